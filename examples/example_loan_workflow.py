@@ -9,37 +9,63 @@ Usage:
     python examples/example_loan_workflow.py
 """
 
+from __future__ import annotations
+
 import asyncio
+import functools
+import importlib.util
 import sys
 from pathlib import Path
 from datetime import datetime
 from decimal import Decimal
+from typing import TYPE_CHECKING
 from dotenv import load_dotenv
 
+# losa (and with it langchain/sqlalchemy) is imported lazily inside the demo
+# functions so the database-failure path doesn't pay for the heavy imports
+if TYPE_CHECKING:
+    from losa.models.loan import Document, LoanApplicationCreate
+    from losa.services.loan_service import LoanService
 
-from losa.models.loan import (
-    LoanApplicationCreate,
-    PersonalInfo,
-    Address,
-    EmploymentInfo,
-    FinancialInfo,
-    LoanDetails,
-    LoanType,
-    EmploymentStatus,
-    MaritalStatus,
-    Document,
-    DocumentType,
-)
-from losa.services.loan_service import LoanService
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+# Add src to path, unless losa is already importable (e.g. an editable install)
+if importlib.util.find_spec('losa') is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 load_dotenv()
 
+# Sample data constants
+_ANNUAL_INCOME = Decimal('95000')
+_MONTHLY_INCOME = Decimal('7916.67')
+_OTHER_INCOME = Decimal('5000')
+_MONTHLY_RENT_MORTGAGE = Decimal('2800')
+_MONTHLY_DEBT_PAYMENTS = Decimal('450')
+_MONTHLY_EXPENSES = Decimal('2200')
+_SAVINGS_BALANCE = Decimal('25000')
+_CHECKING_BALANCE = Decimal('8500')
+_CREDIT_CARDS_DEBT = Decimal('3500')
+_ASSETS_VALUE = Decimal('35000')
+_REQUESTED_AMOUNT = Decimal('30000')
+_COLLATERAL_VALUE = Decimal('0')
+
+_TS_FMT = '%Y-%m-%d %H:%M:%S'
+
+DECISION_ICONS = {'APPROVED': '✅', 'REJECTED': '❌', 'CONDITIONAL': '⚠️'}
 
+
+@functools.lru_cache(maxsize=1)
 def create_sample_application() -> LoanApplicationCreate:
     """Create a sample loan application for demonstration"""
+    from losa.models.loan import (
+        LoanApplicationCreate,
+        PersonalInfo,
+        Address,
+        EmploymentInfo,
+        FinancialInfo,
+        LoanDetails,
+        LoanType,
+        EmploymentStatus,
+        MaritalStatus,
+    )
 
     # Personal information
     address = Address(
@@ -69,29 +95,29 @@ def create_sample_application() -> LoanApplicationCreate:
         employer_name='TechCorp Inc.',
         job_title='Senior Software Engineer',
         employment_start_date=datetime(2020, 6, 1),
-        annual_income=Decimal('95000'),
-        monthly_income=Decimal('7916.67'),
-        other_income=Decimal('5000'),  # Side consulting income
+        annual_income=_ANNUAL_INCOME,
+        monthly_income=_MONTHLY_INCOME,
+        other_income=_OTHER_INCOME,  # Side consulting income
     )
 
     # Financial information
     financial_info = FinancialInfo(
-        monthly_rent_mortgage=Decimal('2800'),  # Bay Area housing costs
-        monthly_debt_payments=Decimal('450'),  # Car loan + student loans
-        monthly_expenses=Decimal('2200'),  # Living expenses
-        savings_balance=Decimal('25000'),
-        checking_balance=Decimal('8500'),
-        credit_cards_debt=Decimal('3500'),
-        assets_value=Decimal('35000'),  # Car + some investments
+        monthly_rent_mortgage=_MONTHLY_RENT_MORTGAGE,  # Bay Area housing costs
+        monthly_debt_payments=_MONTHLY_DEBT_PAYMENTS,  # Car loan + student loans
+        monthly_expenses=_MONTHLY_EXPENSES,  # Living expenses
+        savings_balance=_SAVINGS_BALANCE,
+        checking_balance=_CHECKING_BALANCE,
+        credit_cards_debt=_CREDIT_CARDS_DEBT,
+        assets_value=_ASSETS_VALUE,  # Car + some investments
     )
 
     # Loan details
     loan_details = LoanDetails(
         loan_type=LoanType.PERSONAL,
-        requested_amount=Decimal('30000'),
+        requested_amount=_REQUESTED_AMOUNT,
         requested_term_months=48,
         purpose='Home renovation and debt consolidation. Planning to update kitchen and bathrooms while consolidating high-interest credit card debt.',
-        collateral_value=Decimal('0'),  # No collateral for personal loan
+        collateral_value=_COLLATERAL_VALUE,  # No collateral for personal loan
     )
 
     return LoanApplicationCreate(
@@ -102,14 +128,16 @@ def create_sample_application() -> LoanApplicationCreate:
     )
 
 
-def create_sample_documents(application_id) -> list[Document]:
-    """Create sample documents for the application"""
+@functools.lru_cache(maxsize=1)
+def _base_documents() -> tuple[Document, ...]:
+    """Build the sample document templates once; paths are set per application"""
+    from losa.models.loan import Document, DocumentType
 
-    documents = [
+    return (
         Document(
             document_type=DocumentType.IDENTITY,
             file_name='drivers_license.jpg',
-            file_path=f'/uploads/{application_id}/drivers_license.jpg',
+            file_path='drivers_license.jpg',
             file_size=1024 * 512,  # 512KB
             mime_type='image/jpeg',
             verified=False,
@@ -117,7 +145,7 @@ def create_sample_documents(application_id) -> list[Document]:
         Document(
             document_type=DocumentType.INCOME_PROOF,
             file_name='pay_stub_recent.pdf',
-            file_path=f'/uploads/{application_id}/pay_stub_recent.pdf',
+            file_path='pay_stub_recent.pdf',
             file_size=1024 * 256,  # 256KB
             mime_type='application/pdf',
             verified=False,
@@ -125,7 +153,7 @@ def create_sample_documents(application_id) -> list[Document]:
         Document(
             document_type=DocumentType.EMPLOYMENT_VERIFICATION,
             file_name='employment_letter.pdf',
-            file_path=f'/uploads/{application_id}/employment_letter.pdf',
+            file_path='employment_letter.pdf',
             file_size=1024 * 128,  # 128KB
             mime_type='application/pdf',
             verified=False,
@@ -133,132 +161,147 @@ def create_sample_documents(application_id) -> list[Document]:
         Document(
             document_type=DocumentType.BANK_STATEMENT,
             file_name='bank_statement_march.pdf',
-            file_path=f'/uploads/{application_id}/bank_statement_march.pdf',
+            file_path='bank_statement_march.pdf',
             file_size=1024 * 384,  # 384KB
             mime_type='application/pdf',
             verified=False,
         ),
-    ]
-
-    return documents
+    )
 
 
-def print_application_summary(application):
-    """Print a formatted summary of the loan application"""
+def create_sample_documents(application_id) -> list[Document]:
+    """Create sample documents for the application"""
 
-    print('\n' + '=' * 60)
-    print('📋 LOAN APPLICATION SUMMARY')
-    print('=' * 60)
+    return [
+        doc.model_copy(
+            update={'file_path': f'/uploads/{application_id}/{doc.file_name}'}
+        )
+        for doc in _base_documents()
+    ]
 
-    print(f'📄 Application Number: {application.application_number}')
-    print(f'📅 Created: {application.created_at.strftime("%Y-%m-%d %H:%M:%S")}')
-    print(f'🔄 Status: {application.status.upper()}')
 
-    print(
-        f'\n👤 Applicant: {application.personal_info.first_name} {application.personal_info.last_name}'
-    )
-    print(f'📧 Email: {application.personal_info.email}')
-    print(f'📱 Phone: {application.personal_info.phone}')
-
-    print(f'\n💼 Employment: {application.employment_info.job_title}')
-    print(f'🏢 Employer: {application.employment_info.employer_name}')
-    print(f'💰 Annual Income: ${application.employment_info.annual_income:,}')
+def print_application_summary(application):
+    """Print a formatted summary of the loan application"""
 
-    print('\n🏦 Loan Request:')
-    print(f'   Type: {application.loan_details.loan_type.title()}')
-    print(f'   Amount: ${application.loan_details.requested_amount:,}')
-    print(f'   Term: {application.loan_details.requested_term_months} months')
+    pi = application.personal_info
+    ei = application.employment_info
+    fi = application.financial_info
+    ld = application.loan_details
+
+    parts = [
+        '\n' + '=' * 60 + '\n',
+        '📋 LOAN APPLICATION SUMMARY\n',
+        '=' * 60 + '\n',
+        f'📄 Application Number: {application.application_number}\n',
+        f'📅 Created: {application.created_at.strftime(_TS_FMT)}\n',
+        f'🔄 Status: {application.status.upper()}\n',
+        f'\n👤 Applicant: {pi.first_name} {pi.last_name}\n',
+        f'📧 Email: {pi.email}\n',
+        f'📱 Phone: {pi.phone}\n',
+        f'\n💼 Employment: {ei.job_title}\n',
+        f'🏢 Employer: {ei.employer_name}\n',
+        f'💰 Annual Income: ${ei.annual_income:,}\n',
+        '\n🏦 Loan Request:\n',
+        f'   Type: {ld.loan_type.title()}\n',
+        f'   Amount: ${ld.requested_amount:,}\n',
+        f'   Term: {ld.requested_term_months} months\n',
+    ]
 
     # Calculate and display key ratios
     dti_ratio = application.debt_to_income_ratio
-    print('\n📊 Key Metrics:')
-    print(f'   Debt-to-Income Ratio: {dti_ratio:.1%}')
-    print(f'   Monthly Income: ${application.employment_info.monthly_income:,}')
-    print(
-        f'   Monthly Debts: ${application.financial_info.monthly_debt_payments + application.financial_info.monthly_rent_mortgage:,}'
-    )
+    parts += [
+        '\n📊 Key Metrics:\n',
+        f'   Debt-to-Income Ratio: {dti_ratio:.1%}\n',
+        f'   Monthly Income: ${ei.monthly_income:,}\n',
+        f'   Monthly Debts: ${fi.monthly_debt_payments + fi.monthly_rent_mortgage:,}\n',
+        f'\n📎 Documents: {len(application.documents)} uploaded\n',
+    ]
 
-    print(f'\n📎 Documents: {len(application.documents)} uploaded')
     for doc in application.documents:
         status = '✅ Verified' if doc.verified else '⏳ Pending'
-        print(f'   - {doc.document_type.replace("_", " ").title()}: {status}')
+        parts.append(f'   - {doc.document_type.replace("_", " ").title()}: {status}\n')
+
+    sys.stdout.write(''.join(parts))
+    sys.stdout.flush()
 
 
 def print_workflow_results(application):
     """Print the results of workflow processing"""
 
-    print('\n' + '=' * 60)
-    print('🤖 AI WORKFLOW RESULTS')
-    print('=' * 60)
+    cs = application.credit_score
+    ra = application.risk_assessment
+    d = application.decision
+
+    parts = ['\n' + '=' * 60 + '\n', '🤖 AI WORKFLOW RESULTS\n', '=' * 60 + '\n']
 
     # Credit Score Results
-    if application.credit_score:
-        print('\n📊 Credit Assessment:')
-        print(f'   Credit Score: {application.credit_score.score}')
-        print(f'   Bureau: {application.credit_score.bureau}')
-        if application.credit_score.factors:
-            print(f'   Factors: {", ".join(application.credit_score.factors)}')
+    if cs:
+        parts += [
+            '\n📊 Credit Assessment:\n',
+            f'   Credit Score: {cs.score}\n',
+            f'   Bureau: {cs.bureau}\n',
+        ]
+        if cs.factors:
+            parts.append(f'   Factors: {", ".join(cs.factors)}\n')
 
     # Risk Assessment Results
-    if application.risk_assessment:
-        print('\n⚠️  Risk Assessment:')
-        print(
-            f'   Overall Risk Score: {application.risk_assessment.overall_risk_score}/100'
-        )
-        print(f'   Risk Level: {application.risk_assessment.risk_level}')
-        print(
-            f'   Payment History Score: {application.risk_assessment.payment_history_score}/100'
-        )
-        print(
-            f'   Employment Stability: {application.risk_assessment.employment_stability_score}/100'
-        )
-
-        if application.risk_assessment.risk_factors:
-            print('   Risk Factors:')
-            for factor in application.risk_assessment.risk_factors:
-                print(f'     • {factor}')
+    if ra:
+        parts += [
+            '\n⚠️  Risk Assessment:\n',
+            f'   Overall Risk Score: {ra.overall_risk_score}/100\n',
+            f'   Risk Level: {ra.risk_level}\n',
+            f'   Payment History Score: {ra.payment_history_score}/100\n',
+            f'   Employment Stability: {ra.employment_stability_score}/100\n',
+        ]
+
+        if ra.risk_factors:
+            parts.append('   Risk Factors:\n')
+            for factor in ra.risk_factors:
+                parts.append(f'     • {factor}\n')
 
     # Decision Results
-    if application.decision:
-        print('\n🏛️  Loan Decision:')
-
-        decision_icon = {'APPROVED': '✅', 'REJECTED': '❌', 'CONDITIONAL': '⚠️'}.get(
-            application.decision.decision, '❓'
-        )
-
-        print(f'   {decision_icon} Decision: {application.decision.decision}')
-        print(
-            f'   📅 Decision Date: {application.decision.decision_date.strftime("%Y-%m-%d %H:%M:%S")}'
-        )
-        print(f'   🤖 Decision Maker: {application.decision.decision_maker}')
-        print(f'   🎯 Confidence: {application.decision.confidence_score:.1%}')
-
-        if application.decision.decision in ['APPROVED', 'CONDITIONAL']:
-            print('\n💰 Approved Terms:')
-            print(f'   Amount: ${application.decision.approved_amount:,}')
-            print(f'   Term: {application.decision.approved_term_months} months')
-            print(f'   Interest Rate: {application.decision.interest_rate:.2%} APR')
-
-            if application.decision.conditions:
-                print('   📋 Conditions:')
-                for condition in application.decision.conditions:
-                    print(f'     • {condition}')
-
-        elif application.decision.decision == 'REJECTED':
-            print('\n❌ Rejection Reasons:')
-            for reason in application.decision.rejection_reasons:
-                print(f'   • {reason}')
+    if d:
+        decision_icon = DECISION_ICONS.get(d.decision, '❓')
+
+        parts += [
+            '\n🏛️  Loan Decision:\n',
+            f'   {decision_icon} Decision: {d.decision}\n',
+            f'   📅 Decision Date: {d.decision_date.strftime(_TS_FMT)}\n',
+            f'   🤖 Decision Maker: {d.decision_maker}\n',
+            f'   🎯 Confidence: {d.confidence_score:.1%}\n',
+        ]
+
+        if d.decision in ['APPROVED', 'CONDITIONAL']:
+            parts += [
+                '\n💰 Approved Terms:\n',
+                f'   Amount: ${d.approved_amount:,}\n',
+                f'   Term: {d.approved_term_months} months\n',
+                f'   Interest Rate: {d.interest_rate:.2%} APR\n',
+            ]
+
+            if d.conditions:
+                parts.append('   📋 Conditions:\n')
+                for condition in d.conditions:
+                    parts.append(f'     • {condition}\n')
+
+        elif d.decision == 'REJECTED':
+            parts.append('\n❌ Rejection Reasons:\n')
+            for reason in d.rejection_reasons:
+                parts.append(f'   • {reason}\n')
 
     # Final Status
-    print(f'\n🔄 Final Status: {application.status.upper()}')
+    parts.append(f'\n🔄 Final Status: {application.status.upper()}\n')
 
     if application.assigned_underwriter:
-        print(f'👨‍💼 Assigned to: {application.assigned_underwriter}')
+        parts.append(f'👨‍💼 Assigned to: {application.assigned_underwriter}\n')
 
-    print('=' * 60)
+    parts.append('=' * 60 + '\n')
+
+    sys.stdout.write(''.join(parts))
+    sys.stdout.flush()
 
 
-async def demonstrate_complete_workflow():
+async def demonstrate_complete_workflow(loan_service: LoanService):
     """Demonstrate the complete loan application workflow"""
 
     print('🏦 LOSA - Loan Origination System Application')
@@ -266,8 +309,6 @@ async def demonstrate_complete_workflow():
     print('=' * 60)
 
     try:
-        # Initialize the loan service
-        loan_service = LoanService()
         print('✅ Loan service initialized')
 
         # Step 1: Create a new loan application
@@ -282,10 +323,10 @@ async def demonstrate_complete_workflow():
         print('\n📎 Step 2: Adding required documents...')
         sample_documents = create_sample_documents(application.id)
 
-        for doc in sample_documents:
-            added_doc = loan_service.add_document(
-                application.id, doc, user_id='demo_user'
-            )
+        added_docs = loan_service.add_documents(
+            application.id, sample_documents, user_id='demo_user'
+        )
+        for added_doc in added_docs:
             print(f'   ✅ Added: {added_doc.document_type.replace("_", " ").title()}')
 
         # Refresh application to get updated documents
@@ -305,8 +346,12 @@ async def demonstrate_complete_workflow():
         print('\n🤖 Step 4: Processing through AI workflow...')
         print('   This may take a few moments...')
 
-        # Process the application through the complete workflow
-        processed_app = await loan_service.process_application_workflow(application.id)
+        # Process the application through the workflow, reporting each stage
+        processed_app = application
+        async for stage, processed_app in loan_service.stream_application_workflow(
+            application.id
+        ):
+            print(f'   ✅ {stage.replace("_", " ").title()}: {processed_app.status}')
 
         print('✅ Workflow processing complete!')
 
@@ -353,7 +398,7 @@ async def demonstrate_complete_workflow():
         return None
 
 
-async def demonstrate_manual_processing():
+async def demonstrate_manual_processing(loan_service: LoanService):
     """Demonstrate manual step-by-step processing"""
 
     print('\n' + '=' * 60)
@@ -372,14 +417,12 @@ async def demonstrate_manual_processing():
         from langchain_core.messages import HumanMessage
 
         # Create a sample application
-        loan_service = LoanService()
         application_data = create_sample_application()
         application = loan_service.create_application(application_data)
 
         # Add documents
         sample_documents = create_sample_documents(application.id)
-        for doc in sample_documents:
-            loan_service.add_document(application.id, doc)
+        loan_service.add_documents(application.id, sample_documents)
 
         # Refresh to get documents
         application = loan_service.get_application(application.id)
@@ -413,22 +456,57 @@ async def demonstrate_manual_processing():
             print(f'   Error: {state["error_message"]}')
             return
 
-        # Step 2: Verify Documents
+        # Steps 2 and 3 have no data dependency, so run them concurrently.
+        # Each branch gets its own application copy and message list so the
+        # nodes don't race on shared state; results are merged afterwards.
         print('\n📋 Step 2: Verifying documents...')
-        state = verify_documents_node(state)
+        print('💳 Step 3: Performing credit check...')
+        messages = state['messages']
+        docs_state, credit_state = await asyncio.gather(
+            asyncio.to_thread(
+                verify_documents_node,
+                {
+                    **state,
+                    'application': state['application'].model_copy(deep=True),
+                    'messages': list(messages),
+                },
+            ),
+            asyncio.to_thread(credit_check_node, {**state, 'messages': list(messages)}),
+        )
+        merged_app = credit_state['application']
+        merged_app.documents = docs_state['application'].documents
+        state = {
+            **credit_state,
+            'application': merged_app,
+            'messages': docs_state['messages']
+            + credit_state['messages'][len(messages) :],
+            'document_verification_complete': docs_state.get(
+                'document_verification_complete', False
+            ),
+            'human_review_required': docs_state.get('human_review_required', False),
+        }
+        if state['human_review_required']:
+            # Missing documents hand the application back to the applicant; keep
+            # the verify branch's outcome rather than the credit branch's
+            merged_app.status = docs_state['application'].status
+            state['workflow_status'] = docs_state['workflow_status']
+            state['next_action'] = docs_state['next_action']
+
         print(
             f'   Status: Document verification complete: {state.get("document_verification_complete", False)}'
         )
-
-        # Step 3: Credit Check
-        print('\n💳 Step 3: Performing credit check...')
-        state = credit_check_node(state)
         credit_score = state.get('stage_results', {}).get('credit_score', 'Unknown')
         print(f'   Credit Score: {credit_score}')
         print(
             f'   Status: Credit check complete: {state.get("credit_check_complete", False)}'
         )
 
+        if state['human_review_required']:
+            print(f'   Next Action: {state["next_action"]}')
+            print('\n⏸️  Workflow paused until the missing documents are uploaded')
+            print_workflow_results(state['application'])
+            return
+
         # Step 4: Risk Assessment
         print('\n⚠️  Step 4: Conducting risk assessment...')
         state = risk_assessment_node(state)
@@ -459,17 +537,28 @@ async def demonstrate_manual_processing():
         traceback.print_exc()
 
 
-def main():
-    """Main demonstration function"""
+def _create_loan_service() -> LoanService:
+    """Import and construct the loan service (runs in a worker thread)"""
+    from losa.services.loan_service import LoanService
+
+    return LoanService()
+
+
+async def _amain():
+    """Run both demonstrations on a single event loop"""
 
     print('🏦 LOSA Example: Complete Loan Workflow Demonstration')
     print('=' * 60)
 
+    # Warm up the loan service in the background while the database is
+    # checked and the user reads the prompts
+    warmup = asyncio.create_task(asyncio.to_thread(_create_loan_service))
+
     # Check if we can import the required modules
     try:
         from losa.database.config import check_database_connection
 
-        if not check_database_connection():
+        if not await asyncio.to_thread(check_database_connection):
             print('❌ Database connection failed!')
             print('Please ensure PostgreSQL is running and configured correctly.')
             print('Run: python run.py --init-db')
@@ -484,26 +573,24 @@ def main():
     print('   4. Displaying results and decisions')
     print('   5. Manual step-by-step processing')
 
-    input('\nPress Enter to start the demonstration...')
+    await asyncio.to_thread(input, '\nPress Enter to start the demonstration...')
 
     # Run the async demonstration
     try:
+        loan_service = await warmup
+
         # Complete workflow demonstration
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(demonstrate_complete_workflow())
+        result = await demonstrate_complete_workflow(loan_service)
 
         if result:
             print('\n' + '=' * 60)
-            input('Press Enter to see manual processing demonstration...')
+            await asyncio.to_thread(
+                input, 'Press Enter to see manual processing demonstration...'
+            )
 
             # Manual processing demonstration
-            loop.run_until_complete(demonstrate_manual_processing())
+            await demonstrate_manual_processing(loan_service)
 
-        loop.close()
-
-    except KeyboardInterrupt:
-        print('\n👋 Demonstration stopped by user')
     except Exception as e:
         print(f'\n❌ Demonstration failed: {str(e)}')
         import traceback
@@ -511,5 +598,16 @@ def main():
         traceback.print_exc()
 
 
+def main():
+    """Main demonstration function"""
+
+    # asyncio.run cancels the main task on Ctrl+C and re-raises
+    # KeyboardInterrupt here, so it has to be handled outside the coroutine
+    try:
+        asyncio.run(_amain())
+    except KeyboardInterrupt:
+        print('\n👋 Demonstration stopped by user')
+
+
 if __name__ == '__main__':
     main()
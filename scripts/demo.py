@@ -13,86 +13,275 @@ It shows:
 4. LangGraph workflow structure
 5. Decision making logic
 
-Run: python demo.py
+Run: python demo.py [--batch N]
 """
 
+import argparse
+import math
 import sys
-from pathlib import Path
+import time
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the kernels then run as plain Python
 
-def print_header(title: str, char: str = '='):
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
+
+def print_header(title: str, char: str = '=', emit: Callable[[str], Any] = print):
     """Print a formatted header"""
-    print(f'\n{char * 60}')
-    print(f'🏦 {title}')
-    print(f'{char * 60}')
+    emit(f'\n{char * 60}\n🏦 {title}\n{char * 60}')
 
 
-def print_section(title: str):
+def print_section(title: str, emit: Callable[[str], Any] = print):
     """Print a section header"""
-    print(f'\n{"─" * 40}')
-    print(f'📋 {title}')
-    print(f'{"─" * 40}')
+    emit(f'\n{"─" * 40}\n📋 {title}\n{"─" * 40}')
+
+
+# Bound format methods, so the format spec is parsed once rather than per call
+_money = '${:,.2f}'.format
+_pct = '{:.1%}'.format
+
+# Application statuses are interned so the batch tally and summary lookups
+# compare and hash the same string objects
+STATUS_DRAFT = sys.intern('draft')
+STATUS_APPROVED = sys.intern('approved')
+STATUS_CONDITIONAL = sys.intern('conditional')
+STATUS_REJECTED = sys.intern('rejected')
+_STATUS_BY_DECISION = {
+    'APPROVED': STATUS_APPROVED,
+    'CONDITIONAL': STATUS_CONDITIONAL,
+    'REJECTED': STATUS_REJECTED,
+}
+_DECISION_ICON = {'APPROVED': '✅', 'REJECTED': '❌', 'CONDITIONAL': '⚠️'}
+
+
+def flush_lines(lines: List[str]):
+    """Write buffered output lines with a single stdout write and clear them"""
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
+        lines.clear()
+
+
+def _above(threshold: float) -> float:
+    """Smallest float strictly greater than threshold, so `x > t` becomes `x >= b`"""
+    return math.nextafter(threshold, math.inf)
+
+
+# Step-function lookup tables: bucket = bisect_right(BOUNDS, x), adjustment =
+# DELTAS[bucket]. The same tuples drive np.searchsorted(..., side='right') in
+# the batch path and a linear scan in the compiled kernel, so every path shares
+# one definition. Bounds are floats so the kernel can index them as uniform
+# tuples.
+RISK_INCOME_BOUNDS = (30000.0, _above(50000), _above(75000), _above(100000))
+RISK_INCOME_DELTAS = (-20, 0, 5, 10, 15)
+RISK_DTI_BOUNDS = (0.2, 0.3, _above(0.4))
+RISK_DTI_DELTAS = (15, 10, 0, -20)
+RISK_EMPLOYMENT_BOUNDS = (6.0, _above(12), _above(24))
+RISK_EMPLOYMENT_DELTAS = (-15, 0, 5, 10)
+RISK_SAVINGS_BOUNDS = (5000.0, _above(20000), _above(50000))
+RISK_SAVINGS_DELTAS = (-10, 0, 5, 10)
+
+CREDIT_INCOME_BOUNDS = (40000.0, _above(75000), _above(100000))
+CREDIT_INCOME_DELTAS = (-40, 0, 30, 50)
+CREDIT_DTI_BOUNDS = (0.2, 0.3, _above(0.4))
+CREDIT_DTI_DELTAS = (40, 20, 0, -50)
+
+
+def _step(bounds: tuple, deltas: tuple, value: float) -> int:
+    """Look up the score adjustment for value in a step-function table"""
+    return deltas[bisect_right(bounds, value)]
+
+
+def _step_batch(bounds: tuple, deltas: tuple, values: 'np.ndarray') -> 'np.ndarray':
+    """Vectorized _step over an array of values"""
+    import numpy as np
+
+    return np.asarray(deltas, dtype=np.int16)[
+        np.searchsorted(bounds, values, side='right')
+    ]
+
+
+# Decision tiers, from make_decision's original if/elif tree. Each score is
+# bucketed against its thresholds and the tier is read from DECISION_TABLE,
+# indexed [risk_bucket][credit_bucket].
+TIER_REJECT = 0
+TIER_HIGH_RISK = 1  # risk >= 45 and credit >= 600
+TIER_STANDARD = 2  # risk >= 65 and credit >= 650
+TIER_PRIME = 3  # risk >= 75 and credit >= 700
+
+DECISION_RISK_BOUNDS = (45, 65, 75)
+DECISION_CREDIT_BOUNDS = (600, 650, 700)
+DECISION_TABLE = (
+    (TIER_REJECT, TIER_REJECT, TIER_REJECT, TIER_REJECT),
+    (TIER_REJECT, TIER_HIGH_RISK, TIER_HIGH_RISK, TIER_HIGH_RISK),
+    (TIER_REJECT, TIER_HIGH_RISK, TIER_STANDARD, TIER_STANDARD),
+    (TIER_REJECT, TIER_HIGH_RISK, TIER_STANDARD, TIER_PRIME),
+)
+
+
+# Interest rate per approving tier: base + (pivot - credit_score) * slope
+RATE_COEFFS = {
+    TIER_PRIME: (0.045, 0.0001, 750),
+    TIER_STANDARD: (0.06, 0.0002, 700),
+    TIER_HIGH_RISK: (0.08, 0.0003, 650),
+}
+# RATE_COEFFS as rows indexed by tier; TIER_REJECT has no rate, so its row is NaN
+RATE_TABLE = tuple(
+    tuple(map(float, RATE_COEFFS.get(tier, (math.nan,) * 3)))
+    for tier in range(len(DECISION_TABLE))
+)
+# Decision confidence per tier
+TIER_CONFIDENCE = (0.8, 0.6, 0.75, 0.9)
+
+
+def decision_tier(risk_score: int, credit_score: int) -> int:
+    """Look up the decision tier for a pair of scores"""
+    return DECISION_TABLE[bisect_right(DECISION_RISK_BOUNDS, risk_score)][
+        bisect_right(DECISION_CREDIT_BOUNDS, credit_score)
+    ]
+
 
+def decision_tier_batch(
+    risk_scores: 'np.ndarray', credit_scores: 'np.ndarray'
+) -> 'np.ndarray':
+    """Vectorized decision_tier: one gather from DECISION_TABLE for the batch"""
+    import numpy as np
 
+    table = np.asarray(DECISION_TABLE, dtype=np.int8)
+    return table[
+        np.searchsorted(DECISION_RISK_BOUNDS, risk_scores, side='right'),
+        np.searchsorted(DECISION_CREDIT_BOUNDS, credit_scores, side='right'),
+    ]
+
+
+def interest_rate_batch(
+    tiers: 'np.ndarray', credit_scores: 'np.ndarray'
+) -> 'np.ndarray':
+    """Vectorized interest rate for every application; NaN where rejected"""
+    import numpy as np
+
+    base, slope, pivot = np.asarray(RATE_TABLE)[tiers].T
+    return base + (pivot - credit_scores) * slope
+
+
+@dataclass(slots=True)
 class DemoLoanApplication:
     """Simplified loan application for demonstration"""
 
-    def __init__(self, data: Dict[str, Any]):
-        self.id = f'demo-{datetime.now().strftime("%Y%m%d-%H%M%S")}'
-        self.application_number = (
-            f'LOAN-{datetime.now().strftime("%Y%m%d")}-{self.id[-4:].upper()}'
+    id: str
+    application_number: str
+    created_at: datetime
+    first_name: str = ''
+    last_name: str = ''
+    loan_type: str = ''
+    purpose: str = ''
+    annual_income: float = 0
+    monthly_income: float = 0
+    monthly_rent: float = 0
+    monthly_debt_payments: float = 0
+    employment_months: int = 0
+    savings: float = 0
+    requested_amount: float = 0
+    credit_cards_debt: float = 0
+    status: str = STATUS_DRAFT
+    documents: List[Dict[str, Any]] = field(default_factory=list)
+    credit_score: Optional[Dict[str, Any]] = None
+    risk_assessment: Optional[Dict[str, Any]] = None
+    decision: Optional[Dict[str, Any]] = None
+    _dti: float = field(init=False, repr=False, default=0)
+
+    def __post_init__(self):
+        # The inputs are never modified after construction, so the DTI ratio
+        # only needs to be computed once
+        monthly_debts = self.monthly_rent + self.monthly_debt_payments
+        self._dti = (
+            monthly_debts / self.monthly_income if self.monthly_income > 0 else 0
         )
-        self.data = data
-        self.status = 'draft'
-        self.documents = []
-        self.credit_score = None
-        self.risk_assessment = None
-        self.decision = None
-        self.created_at = datetime.now()
-
-    def add_document(self, doc_type: str, filename: str):
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        now: Optional[datetime] = None,
+        ts: Optional[str] = None,
+        app_seq: Optional[int] = None,
+    ) -> 'DemoLoanApplication':
+        """Parse raw application data into a new application
+
+        Batch callers sample the clock once and pass the snapshot in along with
+        a per-application sequence number to keep IDs unique. Otherwise the ID
+        suffix comes from the low bits of time.time_ns(), which avoids
+        formatting the current time for every application.
+        """
+        if now is None:
+            now = datetime.now()
+        if app_seq is None:
+            suffix = f'{time.time_ns() & 0xFFFF:04X}'
+            app_id = f'demo-{_TODAY}-{suffix}'
+            application_number = f'LOAN-{_TODAY}-{suffix}'
+        else:
+            if ts is None:
+                ts = now.strftime('%Y%m%d-%H%M%S')
+            app_id = f'demo-{ts}-{app_seq}'
+            application_number = f'LOAN-{ts[:8]}-{app_seq:04d}'
+
+        return cls(
+            id=app_id,
+            application_number=application_number,
+            created_at=now,
+            **{key: data[key] for key in _INPUT_FIELDS if key in data},
+        )
+
+    def add_document(
+        self, doc_type: str, filename: str, uploaded_at: Optional[datetime] = None
+    ):
         """Add a document to the application"""
         self.documents.append(
             {
                 'type': doc_type,
                 'filename': filename,
                 'verified': False,
-                'uploaded_at': datetime.now(),
+                'uploaded_at': uploaded_at or datetime.now(),
             }
         )
 
     def calculate_dti_ratio(self) -> float:
         """Calculate debt-to-income ratio"""
-        monthly_income = self.data.get('monthly_income', 0)
-        monthly_debts = self.data.get('monthly_rent', 0) + self.data.get(
-            'monthly_debt_payments', 0
-        )
-        return monthly_debts / monthly_income if monthly_income > 0 else 0
+        return self._dti
 
     def get_risk_factors(self) -> List[str]:
         """Identify risk factors"""
         factors = []
 
-        dti = self.calculate_dti_ratio()
+        dti = self._dti
         if dti > 0.4:
             factors.append('High debt-to-income ratio')
 
-        annual_income = self.data.get('annual_income', 0)
-        if annual_income < 40000:
+        if self.annual_income < 40000:
             factors.append('Low income')
 
-        employment_months = self.data.get('employment_months', 0)
-        if employment_months < 12:
+        if self.employment_months < 12:
             factors.append('Short employment history')
 
-        savings = self.data.get('savings', 0)
-        requested_amount = self.data.get('requested_amount', 0)
-        if savings < (requested_amount * 0.1):
+        if self.savings < (self.requested_amount * 0.1):
             factors.append('Low savings relative to loan amount')
 
         return factors
@@ -101,118 +290,514 @@ class DemoLoanApplication:
         """Calculate overall risk score (0-100, higher is better)"""
         score = 70  # Base score
 
-        # Income factor
-        annual_income = self.data.get('annual_income', 0)
-        if annual_income > 100000:
-            score += 15
-        elif annual_income > 75000:
-            score += 10
-        elif annual_income > 50000:
-            score += 5
-        elif annual_income < 30000:
-            score -= 20
-
-        # DTI factor
-        dti = self.calculate_dti_ratio()
-        if dti < 0.2:
-            score += 15
-        elif dti < 0.3:
-            score += 10
-        elif dti > 0.4:
-            score -= 20
-        elif dti > 0.5:
-            score -= 30
-
-        # Employment stability
-        employment_months = self.data.get('employment_months', 0)
-        if employment_months > 24:
-            score += 10
-        elif employment_months > 12:
-            score += 5
-        elif employment_months < 6:
-            score -= 15
-
-        # Savings factor
-        savings = self.data.get('savings', 0)
-        if savings > 50000:
-            score += 10
-        elif savings > 20000:
-            score += 5
-        elif savings < 5000:
-            score -= 10
+        score += _step(RISK_INCOME_BOUNDS, RISK_INCOME_DELTAS, self.annual_income)
+        score += _step(RISK_DTI_BOUNDS, RISK_DTI_DELTAS, self._dti)
+        score += _step(
+            RISK_EMPLOYMENT_BOUNDS, RISK_EMPLOYMENT_DELTAS, self.employment_months
+        )
+        score += _step(RISK_SAVINGS_BOUNDS, RISK_SAVINGS_DELTAS, self.savings)
 
         return max(0, min(100, score))
 
 
+# Date part of IDs for applications created outside a batch, fixed at startup
+_TODAY = datetime.now().strftime('%Y%m%d')
+
+# Keys accepted from raw application dicts by DemoLoanApplication.from_dict
+_INPUT_FIELDS = frozenset(
+    (
+        'first_name',
+        'last_name',
+        'loan_type',
+        'purpose',
+        'annual_income',
+        'monthly_income',
+        'monthly_rent',
+        'monthly_debt_payments',
+        'employment_months',
+        'savings',
+        'requested_amount',
+        'credit_cards_debt',
+    )
+)
+
+
+@dataclass
+class LoanApplicationBatch:
+    """Columnar (structure-of-arrays) view of many applications for vectorized scoring"""
+
+    annual_income: 'np.ndarray'
+    monthly_income: 'np.ndarray'
+    monthly_rent: 'np.ndarray'
+    monthly_debt_payments: 'np.ndarray'
+    employment_months: 'np.ndarray'
+    savings: 'np.ndarray'
+    requested_amount: 'np.ndarray'
+
+    @classmethod
+    def from_applications(
+        cls, apps: List[DemoLoanApplication]
+    ) -> 'LoanApplicationBatch':
+        """Build one array per input field from a list of applications"""
+        import numpy as np
+
+        def column(key: str) -> 'np.ndarray':
+            return np.fromiter(
+                (getattr(app, key) for app in apps),
+                dtype=np.float64,
+                count=len(apps),
+            )
+
+        return cls(
+            annual_income=column('annual_income'),
+            monthly_income=column('monthly_income'),
+            monthly_rent=column('monthly_rent'),
+            monthly_debt_payments=column('monthly_debt_payments'),
+            employment_months=column('employment_months'),
+            savings=column('savings'),
+            requested_amount=column('requested_amount'),
+        )
+
+    @classmethod
+    def from_frame(cls, df: 'pd.DataFrame') -> 'LoanApplicationBatch':
+        """Build the arrays from DataFrame columns; missing columns read as 0"""
+        import numpy as np
+
+        def column(key: str) -> 'np.ndarray':
+            if key not in df:
+                return np.zeros(len(df))
+            return df[key].fillna(0).to_numpy(dtype=np.float64)
+
+        return cls(
+            annual_income=column('annual_income'),
+            monthly_income=column('monthly_income'),
+            monthly_rent=column('monthly_rent'),
+            monthly_debt_payments=column('monthly_debt_payments'),
+            employment_months=column('employment_months'),
+            savings=column('savings'),
+            requested_amount=column('requested_amount'),
+        )
+
+    def __len__(self) -> int:
+        return len(self.annual_income)
+
+    def dti_ratio(self) -> 'np.ndarray':
+        """Vectorized debt-to-income ratio (0 where there is no income)"""
+        import numpy as np
+
+        monthly_debts = self.monthly_rent + self.monthly_debt_payments
+        return np.divide(
+            monthly_debts,
+            self.monthly_income,
+            out=np.zeros(len(self)),
+            where=self.monthly_income > 0,
+        )
+
+
+def calculate_risk_score_batch(batch: LoanApplicationBatch) -> 'np.ndarray':
+    """Vectorized DemoLoanApplication.calculate_risk_score over a whole batch"""
+    import numpy as np
+
+    score = np.full(len(batch), 70, dtype=np.int16)
+    score += _step_batch(RISK_INCOME_BOUNDS, RISK_INCOME_DELTAS, batch.annual_income)
+    score += _step_batch(RISK_DTI_BOUNDS, RISK_DTI_DELTAS, batch.dti_ratio())
+    score += _step_batch(
+        RISK_EMPLOYMENT_BOUNDS, RISK_EMPLOYMENT_DELTAS, batch.employment_months
+    )
+    score += _step_batch(RISK_SAVINGS_BOUNDS, RISK_SAVINGS_DELTAS, batch.savings)
+
+    return np.clip(score, 0, 100)
+
+
+def get_risk_factors_batch(batch: LoanApplicationBatch) -> List[List[str]]:
+    """Vectorized DemoLoanApplication.get_risk_factors over a whole batch"""
+    masks = (
+        (batch.dti_ratio() > 0.4, 'High debt-to-income ratio'),
+        (batch.annual_income < 40000, 'Low income'),
+        (batch.employment_months < 12, 'Short employment history'),
+        (
+            batch.savings < batch.requested_amount * 0.1,
+            'Low savings relative to loan amount',
+        ),
+    )
+
+    # Strings are only joined per application when reporting
+    return [[factor for mask, factor in masks if mask[i]] for i in range(len(batch))]
+
+
+# Decision codes returned by the fused scoring kernel
+DECISION_REJECTED = 0
+DECISION_APPROVED = 1
+DECISION_CONDITIONAL = 2
+DECISION_NAMES = ('REJECTED', 'APPROVED', 'CONDITIONAL')
+
+
+@njit(cache=True)
+def _bucket(bounds, value):
+    """bisect_right for compiled code: a linear scan, as the tables are short"""
+    bucket = 0
+    while bucket < len(bounds) and value >= bounds[bucket]:
+        bucket += 1
+    return bucket
+
+
+@njit(
+    'Tuple((int32, int32, int8, float64, float64, float64))'
+    '(float64, float64, float64, float64, float64, float64, float64)',
+    cache=True,
+)
+def score_and_decide(
+    annual_income,
+    monthly_income,
+    monthly_rent,
+    monthly_debt,
+    employment_months,
+    savings,
+    requested_amount,
+):
+    """Fused credit check, risk score and decision for one applicant
+
+    Mirrors DemoWorkflow.perform_credit_check, calculate_risk_score and
+    make_decision, reading the same step tables and DECISION_TABLE. Returns
+    (credit_score, risk_score, decision_code, approved_amount, interest_rate,
+    confidence); amount and rate are NaN when the application is rejected.
+    """
+    monthly_debts = monthly_rent + monthly_debt
+    dti = monthly_debts / monthly_income if monthly_income > 0 else 0.0
+
+    # Credit check
+    credit_score = 650
+    credit_score += CREDIT_INCOME_DELTAS[_bucket(CREDIT_INCOME_BOUNDS, annual_income)]
+    credit_score += CREDIT_DTI_DELTAS[_bucket(CREDIT_DTI_BOUNDS, dti)]
+    credit_score = max(300, min(850, credit_score))
+
+    # Risk score
+    risk_score = 70
+    risk_score += RISK_INCOME_DELTAS[_bucket(RISK_INCOME_BOUNDS, annual_income)]
+    risk_score += RISK_DTI_DELTAS[_bucket(RISK_DTI_BOUNDS, dti)]
+    risk_score += RISK_EMPLOYMENT_DELTAS[
+        _bucket(RISK_EMPLOYMENT_BOUNDS, employment_months)
+    ]
+    risk_score += RISK_SAVINGS_DELTAS[_bucket(RISK_SAVINGS_BOUNDS, savings)]
+    risk_score = max(0, min(100, risk_score))
+
+    # Decision
+    tier = DECISION_TABLE[_bucket(DECISION_RISK_BOUNDS, risk_score)][
+        _bucket(DECISION_CREDIT_BOUNDS, credit_score)
+    ]
+    base_rate, slope, pivot = RATE_TABLE[tier]
+    interest_rate = base_rate + (pivot - credit_score) * slope
+    confidence = TIER_CONFIDENCE[tier]
+
+    if tier == TIER_PRIME:
+        code = DECISION_APPROVED
+        approved_amount = requested_amount
+    elif tier == TIER_STANDARD:
+        if requested_amount > 100000:
+            code = DECISION_CONDITIONAL
+            approved_amount = min(requested_amount * 0.8, 100000.0)
+        else:
+            code = DECISION_APPROVED
+            approved_amount = requested_amount
+    elif tier == TIER_HIGH_RISK:
+        code = DECISION_CONDITIONAL
+        approved_amount = min(requested_amount * 0.6, 50000.0)
+    else:
+        code = DECISION_REJECTED
+        approved_amount = math.nan
+
+    return (
+        credit_score,
+        risk_score,
+        code,
+        approved_amount,
+        interest_rate,
+        confidence,
+    )
+
+
+@njit(parallel=True, cache=True)
+def _score_and_decide_arrays(
+    annual_income,
+    monthly_income,
+    monthly_rent,
+    monthly_debt,
+    employment_months,
+    savings,
+    requested_amount,
+    credit_scores,
+    risk_scores,
+    decisions,
+    approved_amounts,
+    interest_rates,
+    confidences,
+):
+    """Run score_and_decide over every applicant, writing into output arrays"""
+    for i in prange(len(annual_income)):
+        (
+            credit_scores[i],
+            risk_scores[i],
+            decisions[i],
+            approved_amounts[i],
+            interest_rates[i],
+            confidences[i],
+        ) = score_and_decide(
+            annual_income[i],
+            monthly_income[i],
+            monthly_rent[i],
+            monthly_debt[i],
+            employment_months[i],
+            savings[i],
+            requested_amount[i],
+        )
+
+
+def score_and_decide_batch(batch: LoanApplicationBatch) -> Dict[str, 'np.ndarray']:
+    """Fused credit/risk/decision pipeline over a whole batch"""
+    import numpy as np
+
+    n = len(batch)
+    results = {
+        'credit_score': np.empty(n, dtype=np.int32),
+        'risk_score': np.empty(n, dtype=np.int32),
+        'decision_code': np.empty(n, dtype=np.int8),
+        'approved_amount': np.empty(n, dtype=np.float64),
+        'interest_rate': np.empty(n, dtype=np.float64),
+        'confidence': np.empty(n, dtype=np.float64),
+    }
+    _score_and_decide_arrays(
+        batch.annual_income,
+        batch.monthly_income,
+        batch.monthly_rent,
+        batch.monthly_debt_payments,
+        batch.employment_months,
+        batch.savings,
+        batch.requested_amount,
+        *results.values(),
+    )
+    return results
+
+
+# Decision conditions and rejection reasons reported by make_decision
+CONDITION_REDUCED_AMOUNT = 'Reduced loan amount due to risk assessment'
+CONDITION_INCOME_VERIFICATION = 'Additional income verification required'
+HIGH_RISK_CONDITIONS = (
+    'Reduced loan amount due to high risk',
+    'Cosigner required',
+    'Additional collateral may be required',
+)
+REASON_CREDIT = 'Credit score below minimum requirement'
+REASON_RISK = 'High overall risk assessment'
+REASON_DTI = 'Debt-to-income ratio exceeds acceptable limits'
+
+# Validation error bits returned by validate_fields, in reporting order
+ERR_MISSING_FIRST_NAME = 1 << 0
+ERR_MISSING_LAST_NAME = 1 << 1
+ERR_MISSING_ANNUAL_INCOME = 1 << 2
+ERR_MISSING_REQUESTED_AMOUNT = 1 << 3
+ERR_LOW_INCOME = 1 << 4
+ERR_AMOUNT_TOO_HIGH = 1 << 5
+ERR_DTI_TOO_HIGH = 1 << 6
+
+
+@njit('uint32(float64, float64, float64, boolean, boolean)', cache=True)
+def validate_fields(annual_income, requested_amount, dti, has_first, has_last):
+    """Check the static validation rules, returning a bitmask of ERR_* codes"""
+    errors = 0
+    if not has_first:
+        errors |= ERR_MISSING_FIRST_NAME
+    if not has_last:
+        errors |= ERR_MISSING_LAST_NAME
+    if annual_income == 0:
+        errors |= ERR_MISSING_ANNUAL_INCOME
+    if requested_amount == 0:
+        errors |= ERR_MISSING_REQUESTED_AMOUNT
+    if annual_income < 20000:
+        errors |= ERR_LOW_INCOME
+    if requested_amount > 500000:
+        errors |= ERR_AMOUNT_TOO_HIGH
+    if dti > 0.5:
+        errors |= ERR_DTI_TOO_HIGH
+    return errors
+
+
+def describe_validation_errors(errors: int, dti: float) -> List[str]:
+    """Decode a validate_fields bitmask into messages"""
+    messages = {
+        ERR_MISSING_FIRST_NAME: 'Missing required field: first_name',
+        ERR_MISSING_LAST_NAME: 'Missing required field: last_name',
+        ERR_MISSING_ANNUAL_INCOME: 'Missing required field: annual_income',
+        ERR_MISSING_REQUESTED_AMOUNT: 'Missing required field: requested_amount',
+        ERR_LOW_INCOME: 'Annual income below minimum requirement ($20,000)',
+        ERR_AMOUNT_TOO_HIGH: 'Requested amount exceeds maximum limit ($500,000)',
+        ERR_DTI_TOO_HIGH: f'Debt-to-income ratio too high: {_pct(dti)}',
+    }
+    return [message for bit, message in messages.items() if errors & bit]
+
+
+BASE_REQUIRED_DOCS = frozenset({'identity', 'income_proof'})
+# Additionally required for loans over $50,000
+LARGE_LOAN_REQUIRED_DOCS = frozenset({'bank_statement', 'tax_return'})
+# Order in which missing documents are reported
+REQUIRED_DOC_ORDER = ('identity', 'income_proof', 'bank_statement', 'tax_return')
+
+
+def process_batch(df: 'pd.DataFrame') -> 'pd.DataFrame':
+    """Run validation, credit check, risk scoring and decision over a DataFrame
+
+    Columnar counterpart of the DemoWorkflow steps: every rule is evaluated as
+    a column expression over the whole frame. Takes one row per application
+    with the same keys as DemoLoanApplication.from_dict and returns a copy
+    with result columns added. Rows that fail validation keep status 'draft'
+    and get no decision; `validation_errors` holds their ERR_* bitmask.
+    Document verification is not covered because uploads are not columnar.
+    """
+    import numpy as np
+
+    batch = LoanApplicationBatch.from_frame(df)
+    dti = batch.dti_ratio()
+
+    def has_text(key: str) -> 'np.ndarray':
+        if key not in df:
+            return np.zeros(len(df), dtype=bool)
+        return df[key].fillna('').astype(str).str.len().to_numpy() > 0
+
+    # Validation as boolean masks folded into the same bitmask as validate_fields
+    checks = (
+        (ERR_MISSING_FIRST_NAME, ~has_text('first_name')),
+        (ERR_MISSING_LAST_NAME, ~has_text('last_name')),
+        (ERR_MISSING_ANNUAL_INCOME, batch.annual_income == 0),
+        (ERR_MISSING_REQUESTED_AMOUNT, batch.requested_amount == 0),
+        (ERR_LOW_INCOME, batch.annual_income < 20000),
+        (ERR_AMOUNT_TOO_HIGH, batch.requested_amount > 500000),
+        (ERR_DTI_TOO_HIGH, dti > 0.5),
+    )
+    validation_errors = np.zeros(len(batch), dtype=np.uint32)
+    for bit, mask in checks:
+        validation_errors[mask] |= bit
+    valid = validation_errors == 0
+
+    # Credit check
+    credit_score = np.full(len(batch), 650, dtype=np.int16)
+    credit_score += _step_batch(
+        CREDIT_INCOME_BOUNDS, CREDIT_INCOME_DELTAS, batch.annual_income
+    )
+    credit_score += _step_batch(CREDIT_DTI_BOUNDS, CREDIT_DTI_DELTAS, dti)
+    credit_score = np.clip(credit_score, 300, 850)
+
+    # Risk assessment and decision tier
+    risk_score = calculate_risk_score_batch(batch)
+    tier = decision_tier_batch(risk_score, credit_score)
+
+    requested = batch.requested_amount
+    approved_amount = np.select(
+        [
+            tier == TIER_PRIME,
+            (tier == TIER_STANDARD) & (requested > 100000),
+            tier == TIER_STANDARD,
+            tier == TIER_HIGH_RISK,
+        ],
+        [
+            requested,
+            np.minimum(requested * 0.8, 100000),
+            requested,
+            np.minimum(requested * 0.6, 50000),
+        ],
+        default=np.nan,
+    )
+    decision = np.select(
+        [
+            tier == TIER_PRIME,
+            (tier == TIER_STANDARD) & (requested <= 100000),
+            (tier == TIER_STANDARD) | (tier == TIER_HIGH_RISK),
+        ],
+        ['APPROVED', 'APPROVED', 'CONDITIONAL'],
+        default='REJECTED',
+    ).astype(object)
+    confidence = np.asarray(TIER_CONFIDENCE)[tier]
+
+    # Invalid applications never reach scoring
+    decision[~valid] = None
+    status = np.array(
+        [STATUS_DRAFT if d is None else _STATUS_BY_DECISION[d] for d in decision],
+        dtype=object,
+    )
+
+    return df.assign(
+        dti_ratio=dti,
+        validation_errors=validation_errors,
+        credit_score=np.where(valid, credit_score, -1),
+        risk_score=np.where(valid, risk_score, -1),
+        decision=decision,
+        approved_amount=np.where(valid, approved_amount, np.nan),
+        interest_rate=np.where(valid, interest_rate_batch(tier, credit_score), np.nan),
+        confidence_score=np.where(valid, confidence, np.nan),
+        status=status,
+    )
+
+
 class DemoWorkflow:
     """Demonstration of LangGraph-style workflow"""
 
-    def __init__(self):
+    def __init__(self, out: Optional[List[str]] = None):
         self.current_step = None
         self.completed_steps = []
         self.errors = []
+        # Timestamp shared by every step of the current application
+        self.now = None
+        # Step output is buffered here and written out by the caller
+        self.out = out if out is not None else []
+        self.emit = self.out.append
 
     def validate_application(self, app: DemoLoanApplication) -> Dict[str, Any]:
         """Step 1: Validate application completeness"""
         self.current_step = 'validation'
-        print('🔍 Validating loan application...')
-
-        errors = []
-
-        # Check required fields
-        required_fields = [
-            'first_name',
-            'last_name',
-            'annual_income',
-            'requested_amount',
-        ]
-        for field in required_fields:
-            if not app.data.get(field):
-                errors.append(f'Missing required field: {field}')
-
-        # Business rule validation
-        if app.data.get('annual_income', 0) < 20000:
-            errors.append('Annual income below minimum requirement ($20,000)')
-
-        if app.data.get('requested_amount', 0) > 500000:
-            errors.append('Requested amount exceeds maximum limit ($500,000)')
+        self.emit('🔍 Validating loan application...')
 
+        # Required fields and business rules; messages are only built on failure
         dti = app.calculate_dti_ratio()
-        if dti > 0.5:
-            errors.append(f'Debt-to-income ratio too high: {dti:.1%}')
+        error_bits = validate_fields(
+            app.annual_income,
+            app.requested_amount,
+            dti,
+            bool(app.first_name),
+            bool(app.last_name),
+        )
 
-        if errors:
+        if error_bits:
+            errors = describe_validation_errors(error_bits, dti)
             self.errors.extend(errors)
             return {'status': 'failed', 'errors': errors}
 
         self.completed_steps.append('validation')
-        print('   ✅ Application validation passed')
+        self.emit('   ✅ Application validation passed')
         return {'status': 'passed'}
 
     def verify_documents(self, app: DemoLoanApplication) -> Dict[str, Any]:
         """Step 2: Verify document completeness"""
         self.current_step = 'document_verification'
-        print('📋 Verifying required documents...')
+        self.emit('📋 Verifying required documents...')
 
-        required_docs = ['identity', 'income_proof']
-        loan_amount = app.data.get('requested_amount', 0)
-
-        if loan_amount > 50000:
-            required_docs.extend(['bank_statement', 'tax_return'])
+        if app.requested_amount > 50000:
+            required_docs = BASE_REQUIRED_DOCS | LARGE_LOAN_REQUIRED_DOCS
+        else:
+            required_docs = BASE_REQUIRED_DOCS
 
-        uploaded_types = [doc['type'] for doc in app.documents]
-        missing_docs = [doc for doc in required_docs if doc not in uploaded_types]
+        uploaded_types = {doc['type'] for doc in app.documents}
+        missing_docs = sorted(
+            required_docs - uploaded_types, key=REQUIRED_DOC_ORDER.index
+        )
 
         if missing_docs:
             error = f'Missing required documents: {", ".join(missing_docs)}'
             self.errors.append(error)
-            print(f'   ❌ {error}')
+            self.emit(f'   ❌ {error}')
             return {'status': 'incomplete', 'missing_documents': missing_docs}
 
         # Simulate document verification
         for doc in app.documents:
             doc['verified'] = True
-            print(f'   ✅ Verified: {doc["type"]} ({doc["filename"]})')
+            self.emit(f'   ✅ Verified: {doc["type"]} ({doc["filename"]})')
 
         self.completed_steps.append('document_verification')
         return {'status': 'verified'}
@@ -220,28 +805,18 @@ class DemoWorkflow:
     def perform_credit_check(self, app: DemoLoanApplication) -> Dict[str, Any]:
         """Step 3: Simulate credit check"""
         self.current_step = 'credit_check'
-        print('💳 Performing credit check...')
+        self.emit('💳 Performing credit check...')
 
         # Simulate credit score calculation
         base_score = 650
 
-        # Adjust based on income
-        annual_income = app.data.get('annual_income', 0)
-        if annual_income > 100000:
-            base_score += 50
-        elif annual_income > 75000:
-            base_score += 30
-        elif annual_income < 40000:
-            base_score -= 40
-
-        # Adjust based on DTI
-        dti = app.calculate_dti_ratio()
-        if dti < 0.2:
-            base_score += 40
-        elif dti < 0.3:
-            base_score += 20
-        elif dti > 0.4:
-            base_score -= 50
+        # Adjust based on income and DTI
+        base_score += _step(
+            CREDIT_INCOME_BOUNDS, CREDIT_INCOME_DELTAS, app.annual_income
+        )
+        base_score += _step(
+            CREDIT_DTI_BOUNDS, CREDIT_DTI_DELTAS, app.calculate_dti_ratio()
+        )
 
         # Ensure score is in valid range
         credit_score = max(300, min(850, base_score))
@@ -249,7 +824,7 @@ class DemoWorkflow:
         app.credit_score = {
             'score': credit_score,
             'bureau': 'Demo Credit Bureau',
-            'date': datetime.now(),
+            'date': self.now or datetime.now(),
             'factors': [],
         }
 
@@ -260,11 +835,11 @@ class DemoWorkflow:
         elif credit_score < 650:
             app.credit_score['factors'].append('Limited credit history')
 
-        print(f'   📊 Credit Score: {credit_score}')
-        print('   🏛️  Bureau: Demo Credit Bureau')
+        self.emit(f'   📊 Credit Score: {credit_score}')
+        self.emit('   🏛️  Bureau: Demo Credit Bureau')
 
         if app.credit_score['factors']:
-            print(f'   ⚠️  Factors: {", ".join(app.credit_score["factors"])}')
+            self.emit(f'   ⚠️  Factors: {", ".join(app.credit_score["factors"])}')
 
         self.completed_steps.append('credit_check')
         return {'status': 'completed', 'credit_score': credit_score}
@@ -272,7 +847,7 @@ class DemoWorkflow:
     def assess_risk(self, app: DemoLoanApplication) -> Dict[str, Any]:
         """Step 4: Perform risk assessment"""
         self.current_step = 'risk_assessment'
-        print('⚠️  Conducting risk assessment...')
+        self.emit('⚠️  Conducting risk assessment...')
 
         risk_score = app.calculate_risk_score()
         risk_factors = app.get_risk_factors()
@@ -292,17 +867,17 @@ class DemoWorkflow:
             'risk_level': risk_level,
             'risk_factors': risk_factors,
             'dti_ratio': app.calculate_dti_ratio(),
-            'assessment_date': datetime.now(),
+            'assessment_date': self.now or datetime.now(),
         }
 
-        print(f'   📊 Risk Score: {risk_score}/100')
-        print(f'   🎯 Risk Level: {risk_level}')
-        print(f'   📈 DTI Ratio: {app.calculate_dti_ratio():.1%}')
+        self.emit(f'   📊 Risk Score: {risk_score}/100')
+        self.emit(f'   🎯 Risk Level: {risk_level}')
+        self.emit(f'   📈 DTI Ratio: {_pct(app.calculate_dti_ratio())}')
 
         if risk_factors:
-            print('   🚨 Risk Factors:')
+            self.emit('   🚨 Risk Factors:')
             for factor in risk_factors:
-                print(f'      • {factor}')
+                self.emit(f'      • {factor}')
 
         self.completed_steps.append('risk_assessment')
         return {
@@ -314,71 +889,63 @@ class DemoWorkflow:
     def make_decision(self, app: DemoLoanApplication) -> Dict[str, Any]:
         """Step 5: Make loan decision"""
         self.current_step = 'decision_making'
-        print('⚖️  Making loan decision...')
+        self.emit('⚖️  Making loan decision...')
 
         credit_score = app.credit_score['score']
         risk_score = app.risk_assessment['overall_risk_score']
-        requested_amount = app.data.get('requested_amount', 0)
+        requested_amount = app.requested_amount
 
         # Decision logic
         decision_type = 'REJECTED'
         approved_amount = None
         interest_rate = None
-        conditions = []
-        rejection_reasons = []
-        confidence_score = 0.0
+        conditions = ()
+        rejection_reasons = ()
 
-        if risk_score >= 75 and credit_score >= 700:
+        tier = decision_tier(risk_score, credit_score)
+        confidence_score = TIER_CONFIDENCE[tier]
+        if tier != TIER_REJECT:
+            base_rate, slope, pivot = RATE_COEFFS[tier]
+            interest_rate = base_rate + (pivot - credit_score) * slope
+
+        if tier == TIER_PRIME:
             # High confidence approval
             decision_type = 'APPROVED'
             approved_amount = requested_amount
-            interest_rate = 0.045 + (750 - credit_score) * 0.0001
-            confidence_score = 0.9
 
-        elif risk_score >= 65 and credit_score >= 650:
+        elif tier == TIER_STANDARD:
             # Conditional approval or reduced amount
             if requested_amount > 100000:
                 decision_type = 'CONDITIONAL'
                 approved_amount = min(requested_amount * 0.8, 100000)
-                conditions.append('Reduced loan amount due to risk assessment')
+                conditions = (CONDITION_REDUCED_AMOUNT,)
             else:
                 decision_type = 'APPROVED'
                 approved_amount = requested_amount
 
-            interest_rate = 0.06 + (700 - credit_score) * 0.0002
-            confidence_score = 0.75
-
             if app.calculate_dti_ratio() > 0.35:
-                conditions.append('Additional income verification required')
+                conditions += (CONDITION_INCOME_VERIFICATION,)
 
-        elif risk_score >= 45 and credit_score >= 600:
+        elif tier == TIER_HIGH_RISK:
             # High-risk conditional approval
             decision_type = 'CONDITIONAL'
             approved_amount = min(requested_amount * 0.6, 50000)
-            interest_rate = 0.08 + (650 - credit_score) * 0.0003
-            confidence_score = 0.6
-
-            conditions.extend(
-                [
-                    'Reduced loan amount due to high risk',
-                    'Cosigner required',
-                    'Additional collateral may be required',
-                ]
-            )
+
+            conditions = HIGH_RISK_CONDITIONS
 
         else:
             # Rejection
             decision_type = 'REJECTED'
-            confidence_score = 0.8
-
-            if credit_score < 600:
-                rejection_reasons.append('Credit score below minimum requirement')
-            if risk_score < 45:
-                rejection_reasons.append('High overall risk assessment')
-            if app.calculate_dti_ratio() > 0.5:
-                rejection_reasons.append(
-                    'Debt-to-income ratio exceeds acceptable limits'
+
+            rejection_reasons = tuple(
+                reason
+                for reason, applies in (
+                    (REASON_CREDIT, credit_score < 600),
+                    (REASON_RISK, risk_score < 45),
+                    (REASON_DTI, app.calculate_dti_ratio() > 0.5),
                 )
+                if applies
+            )
 
         app.decision = {
             'decision': decision_type,
@@ -387,32 +954,30 @@ class DemoWorkflow:
             'conditions': conditions,
             'rejection_reasons': rejection_reasons,
             'confidence_score': confidence_score,
-            'decision_date': datetime.now(),
+            'decision_date': self.now or datetime.now(),
             'decision_maker': 'Demo AI System',
         }
 
         # Print decision details
-        decision_icon = {'APPROVED': '✅', 'REJECTED': '❌', 'CONDITIONAL': '⚠️'}.get(
-            decision_type, '❓'
-        )
-        print(f'   {decision_icon} Decision: {decision_type}')
-        print(f'   🎯 Confidence: {confidence_score:.1%}')
+        decision_icon = _DECISION_ICON.get(decision_type, '❓')
+        self.emit(f'   {decision_icon} Decision: {decision_type}')
+        self.emit(f'   🎯 Confidence: {_pct(confidence_score)}')
 
         if decision_type in ['APPROVED', 'CONDITIONAL']:
-            print(f'   💰 Approved Amount: ${approved_amount:,.2f}')
-            print(f'   📊 Interest Rate: {interest_rate:.2%} APR')
+            self.emit(f'   💰 Approved Amount: {_money(approved_amount)}')
+            self.emit(f'   📊 Interest Rate: {interest_rate:.2%} APR')
 
             if conditions:
-                print('   📋 Conditions:')
+                self.emit('   📋 Conditions:')
                 for condition in conditions:
-                    print(f'      • {condition}')
+                    self.emit(f'      • {condition}')
 
         elif decision_type == 'REJECTED':
-            print('   ❌ Rejection Reasons:')
+            self.emit('   ❌ Rejection Reasons:')
             for reason in rejection_reasons:
-                print(f'      • {reason}')
+                self.emit(f'      • {reason}')
 
-        app.status = decision_type.lower()
+        app.status = _STATUS_BY_DECISION[decision_type]
         self.completed_steps.append('decision_making')
 
         return {
@@ -422,8 +987,12 @@ class DemoWorkflow:
         }
 
 
+@lru_cache(maxsize=1)
 def create_sample_applications():
-    """Create sample loan applications for demonstration"""
+    """Create sample loan applications for demonstration
+
+    Built once and cached, so the result is returned as read-only views.
+    """
 
     applications = [
         {
@@ -492,25 +1061,44 @@ def create_sample_applications():
         },
     ]
 
-    return applications
+    return tuple(
+        MappingProxyType(
+            {
+                'name': app['name'],
+                'data': MappingProxyType(app['data']),
+                'documents': tuple(app['documents']),
+            }
+        )
+        for app in applications
+    )
 
 
-def demonstrate_single_application(app_data: Dict[str, Any], workflow: DemoWorkflow):
+def demonstrate_single_application(
+    app_data: Dict[str, Any],
+    workflow: DemoWorkflow,
+    now: Optional[datetime] = None,
+    ts: Optional[str] = None,
+    app_seq: Optional[int] = None,
+):
     """Demonstrate processing a single loan application"""
 
-    print_section(f'Processing: {app_data["name"]}')
+    emit = workflow.emit
+    print_section(f'Processing: {app_data["name"]}', emit=emit)
+
+    # Sample the clock once for the whole application
+    workflow.now = now or datetime.now()
 
     # Create application
-    app = DemoLoanApplication(app_data['data'])
-    print(f'📄 Application: {app.application_number}')
-    print(f'👤 Applicant: {app.data["first_name"]} {app.data["last_name"]}')
-    print(f'💰 Requested: ${app.data["requested_amount"]:,} ({app.data["loan_type"]})')
-    print(f'💼 Income: ${app.data["annual_income"]:,}/year')
-    print(f'📊 DTI Ratio: {app.calculate_dti_ratio():.1%}')
+    app = DemoLoanApplication.from_dict(app_data['data'], workflow.now, ts, app_seq)
+    emit(f'📄 Application: {app.application_number}')
+    emit(f'👤 Applicant: {app.first_name} {app.last_name}')
+    emit(f'💰 Requested: ${app.requested_amount:,} ({app.loan_type})')
+    emit(f'💼 Income: ${app.annual_income:,}/year')
+    emit(f'📊 DTI Ratio: {_pct(app.calculate_dti_ratio())}')
 
     # Add documents
     for doc_type, filename in app_data['documents']:
-        app.add_document(doc_type, filename)
+        app.add_document(doc_type, filename, workflow.now)
 
     # Process through workflow
     workflow_steps = [
@@ -524,105 +1112,172 @@ def demonstrate_single_application(app_data: Dict[str, Any], workflow: DemoWorkf
     for step in workflow_steps:
         result = step(app)
         if result.get('status') in ['failed', 'incomplete']:
-            print(f'\n❌ Workflow stopped at step: {workflow.current_step}')
+            emit(f'\n❌ Workflow stopped at step: {workflow.current_step}')
             if workflow.errors:
-                print('🚨 Errors:')
+                emit('🚨 Errors:')
                 for error in workflow.errors:
-                    print(f'   • {error}')
+                    emit(f'   • {error}')
             return app
 
-    print('\n✅ Workflow completed successfully!')
+    emit('\n✅ Workflow completed successfully!')
     return app
 
 
 def print_application_summary(app: DemoLoanApplication):
     """Print a detailed summary of the processed application"""
 
-    print_section('Application Summary')
+    lines = []
+    emit = lines.append
+    print_section('Application Summary', emit=emit)
 
-    print(f'📄 Application: {app.application_number}')
-    print(f'👤 Applicant: {app.data["first_name"]} {app.data["last_name"]}')
-    print(f'📅 Created: {app.created_at.strftime("%Y-%m-%d %H:%M:%S")}')
-    print(f'🔄 Status: {app.status.upper()}')
+    emit(f'📄 Application: {app.application_number}')
+    emit(f'👤 Applicant: {app.first_name} {app.last_name}')
+    emit(f'📅 Created: {app.created_at.strftime("%Y-%m-%d %H:%M:%S")}')
+    emit(f'🔄 Status: {app.status.upper()}')
 
-    print('\n💼 Employment & Income:')
-    print(f'   Annual Income: ${app.data["annual_income"]:,}')
-    print(f'   Employment: {app.data["employment_months"]} months')
-    print(f'   DTI Ratio: {app.calculate_dti_ratio():.1%}')
+    emit('\n💼 Employment & Income:')
+    emit(f'   Annual Income: ${app.annual_income:,}')
+    emit(f'   Employment: {app.employment_months} months')
+    emit(f'   DTI Ratio: {_pct(app.calculate_dti_ratio())}')
 
-    print('\n🏦 Loan Details:')
-    print(f'   Type: {app.data["loan_type"].title()}')
-    print(f'   Requested: ${app.data["requested_amount"]:,}')
-    print(f'   Purpose: {app.data["purpose"]}')
+    emit('\n🏦 Loan Details:')
+    emit(f'   Type: {app.loan_type.title()}')
+    emit(f'   Requested: ${app.requested_amount:,}')
+    emit(f'   Purpose: {app.purpose}')
 
     if app.credit_score:
-        print('\n📊 Credit Assessment:')
-        print(f'   Score: {app.credit_score["score"]}')
-        print(f'   Bureau: {app.credit_score["bureau"]}')
+        emit('\n📊 Credit Assessment:')
+        emit(f'   Score: {app.credit_score["score"]}')
+        emit(f'   Bureau: {app.credit_score["bureau"]}')
         if app.credit_score['factors']:
-            print(f'   Factors: {", ".join(app.credit_score["factors"])}')
+            emit(f'   Factors: {", ".join(app.credit_score["factors"])}')
 
     if app.risk_assessment:
-        print('\n⚠️  Risk Assessment:')
-        print(f'   Risk Score: {app.risk_assessment["overall_risk_score"]}/100')
-        print(f'   Risk Level: {app.risk_assessment["risk_level"]}')
+        emit('\n⚠️  Risk Assessment:')
+        emit(f'   Risk Score: {app.risk_assessment["overall_risk_score"]}/100')
+        emit(f'   Risk Level: {app.risk_assessment["risk_level"]}')
         if app.risk_assessment['risk_factors']:
-            print('   Risk Factors:')
+            emit('   Risk Factors:')
             for factor in app.risk_assessment['risk_factors']:
-                print(f'      • {factor}')
+                emit(f'      • {factor}')
 
     if app.decision:
         decision = app.decision
-        decision_icon = {'approved': '✅', 'rejected': '❌', 'conditional': '⚠️'}.get(
-            app.status, '❓'
-        )
+        decision_icon = _DECISION_ICON.get(decision['decision'], '❓')
 
-        print(f'\n{decision_icon} Final Decision: {decision["decision"]}')
-        print(f'   Confidence: {decision["confidence_score"]:.1%}')
+        emit(f'\n{decision_icon} Final Decision: {decision["decision"]}')
+        emit(f'   Confidence: {_pct(decision["confidence_score"])}')
 
         if decision['decision'] in ['APPROVED', 'CONDITIONAL']:
-            print(f'   Approved Amount: ${decision["approved_amount"]:,}')
-            print(f'   Interest Rate: {decision["interest_rate"]:.2%} APR')
+            emit(f'   Approved Amount: ${decision["approved_amount"]:,}')
+            emit(f'   Interest Rate: {decision["interest_rate"]:.2%} APR')
 
             if decision['conditions']:
-                print('   Conditions:')
+                emit('   Conditions:')
                 for condition in decision['conditions']:
-                    print(f'      • {condition}')
+                    emit(f'      • {condition}')
 
         if decision['rejection_reasons']:
-            print('   Rejection Reasons:')
+            emit('   Rejection Reasons:')
             for reason in decision['rejection_reasons']:
-                print(f'      • {reason}')
+                emit(f'      • {reason}')
+
+    flush_lines(lines)
 
 
 def demonstrate_batch_processing():
     """Demonstrate processing multiple applications"""
 
-    print_header('LOSA Batch Processing Demo')
+    # Output for the whole batch is collected and written in one go
+    lines = []
+    emit = lines.append
+    print_header('LOSA Batch Processing Demo', emit=emit)
 
     sample_apps = create_sample_applications()
     results = []
 
-    for app_data in sample_apps:
-        workflow = DemoWorkflow()  # Fresh workflow for each application
-        processed_app = demonstrate_single_application(app_data, workflow)
-        results.append(processed_app)
-        print('\n' + '─' * 60)
+    # One clock read for the whole batch; the sequence number keeps IDs unique
+    t0 = datetime.now()
+    ts = t0.strftime('%Y%m%d-%H%M%S')
 
-    # Summary statistics
-    print_section('Batch Processing Summary')
+    # Large batches go through demonstrate_columnar_batch instead
+    try:
+        for app_seq, app_data in enumerate(sample_apps, start=1):
+            # Fresh workflow for each application
+            workflow = DemoWorkflow(out=lines)
+            processed_app = demonstrate_single_application(
+                app_data, workflow, t0, ts, app_seq
+            )
+            results.append(processed_app)
+            emit('\n' + '─' * 60)
+
+        # Summary statistics
+        print_section('Batch Processing Summary', emit=emit)
+
+        tally = Counter(app.status for app in results)
+        approved = tally[STATUS_APPROVED]
+        conditional = tally[STATUS_CONDITIONAL]
+        rejected = tally[STATUS_REJECTED]
+
+        emit('📊 Results Summary:')
+        emit(f'   ✅ Approved: {approved}')
+        emit(f'   ⚠️  Conditional: {conditional}')
+        emit(f'   ❌ Rejected: {rejected}')
+        approval_rate = (approved + conditional) / len(results) * 100
+        emit(f'   📈 Approval Rate: {approval_rate:.1f}%')
+    finally:
+        flush_lines(lines)
 
-    approved = sum(1 for app in results if app.status == 'approved')
-    conditional = sum(1 for app in results if app.status == 'conditional')
-    rejected = sum(1 for app in results if app.status == 'rejected')
+    return results
 
-    print('📊 Results Summary:')
-    print(f'   ✅ Approved: {approved}')
-    print(f'   ⚠️  Conditional: {conditional}')
-    print(f'   ❌ Rejected: {rejected}')
-    print(f'   📈 Approval Rate: {(approved + conditional) / len(results) * 100:.1f}%')
 
-    return results
+def demonstrate_columnar_batch(count: int) -> 'pd.DataFrame':
+    """Score a large generated batch in one pass with the columnar helpers
+
+    The sample applications are repeated to fill count rows, which are run
+    through process_batch; risk factors are tallied with get_risk_factors_batch.
+    """
+    import pandas as pd
+
+    lines = []
+    emit = lines.append
+    print_header(f'LOSA Columnar Batch Demo ({count:,} applications)', emit=emit)
+
+    sample_apps = create_sample_applications()
+    df = pd.DataFrame(
+        [dict(sample_apps[i % len(sample_apps)]['data']) for i in range(count)]
+    )
+
+    try:
+        start = time.perf_counter()
+        scored = process_batch(df)
+        risk_factors = get_risk_factors_batch(LoanApplicationBatch.from_frame(df))
+        elapsed = time.perf_counter() - start
+
+        print_section('Columnar Batch Summary', emit=emit)
+
+        tally = Counter(scored['status'])
+        approved = tally[STATUS_APPROVED]
+        conditional = tally[STATUS_CONDITIONAL]
+
+        emit('📊 Results Summary:')
+        emit(f'   ✅ Approved: {approved:,}')
+        emit(f'   ⚠️  Conditional: {conditional:,}')
+        emit(f'   ❌ Rejected: {tally[STATUS_REJECTED]:,}')
+        emit(f'   📝 Failed validation: {tally[STATUS_DRAFT]:,}')
+        approval_rate = (approved + conditional) / count * 100
+        emit(f'   📈 Approval Rate: {approval_rate:.1f}%')
+        emit(f'   ⏱️  Scored in {elapsed * 1000:.1f} ms')
+
+        factor_tally = Counter(factor for app in risk_factors for factor in app)
+        if factor_tally:
+            emit('   🚨 Most Common Risk Factors:')
+            for factor, n in factor_tally.most_common(3):
+                emit(f'      • {factor}: {n:,}')
+    finally:
+        flush_lines(lines)
+
+    return scored
 
 
 def demonstrate_langraph_concept():
@@ -712,8 +1367,18 @@ def demonstrate_key_features():
             print(f'   • {feature}')
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main demonstration function"""
+    parser = argparse.ArgumentParser(description='LOSA Demo')
+    parser.add_argument(
+        '--batch',
+        type=int,
+        metavar='N',
+        help='Also score N generated applications with the columnar batch path',
+    )
+    args = parser.parse_args(argv)
+    if args.batch is not None and args.batch < 1:
+        parser.error('--batch must be at least 1')
 
     print_header('🏦 LOSA - Loan Origination System Demo')
 
@@ -757,6 +1422,10 @@ workflow using LangChain and LangGraph concepts.
             print_header(f'Detailed Summary - Application {i}')
             print_application_summary(app)
 
+        if args.batch:
+            print(f'\n📍 Scoring {args.batch:,} applications as one batch...')
+            demonstrate_columnar_batch(args.batch)
+
         print_header('🎉 Demonstration Complete!')
 
         print(
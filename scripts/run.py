@@ -8,32 +8,74 @@ with proper environment setup and configuration.
 
 import os
 import sys
+import atexit
 import logging
+import logging.handlers
 import argparse
+import queue
+import functools
 import importlib.util
+import json
 from pathlib import Path
 
-# Add the src directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+# Add the src directory to the Python path, unless losa is already importable
+# (e.g. from an editable install)
+if importlib.util.find_spec('losa') is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 
 def setup_logging(debug: bool = False):
     """Configure logging for development"""
     log_level = logging.DEBUG if debug else logging.INFO
+
+    # Log calls only format and enqueue records; a background listener does
+    # the console and file writes
+    log_queue = queue.Queue(-1)
+    file_handler = logging.handlers.RotatingFileHandler(
+        'losa_dev.log', maxBytes=10 * 1024 * 1024, backupCount=3, encoding='utf-8'
+    )
+    listener = logging.handlers.QueueListener(
+        log_queue, logging.StreamHandler(), file_handler
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
     logging.basicConfig(
         level=log_level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[logging.StreamHandler(), logging.FileHandler('losa_dev.log')],
+        handlers=[logging.handlers.QueueHandler(log_queue)],
     )
 
 
+def _read_env_file(env_file: Path) -> dict:
+    """Parse .env, reusing a JSON snapshot until the file changes"""
+    cache_file = env_file.with_name('.env.cache')
+    try:
+        if cache_file.stat().st_mtime >= env_file.stat().st_mtime:
+            return json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        pass
+
+    from dotenv import dotenv_values
+
+    values = {k: v for k, v in dotenv_values(env_file).items() if v is not None}
+    try:
+        # The snapshot holds the same secrets as .env, so keep it owner-only
+        fd = os.open(cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(values, f)
+    except OSError:
+        pass
+    return values
+
+
 def load_environment():
     """Load environment variables from .env file"""
-    from dotenv import load_dotenv
-
     env_file = Path(__file__).parent.parent / '.env'
     if env_file.exists():
-        load_dotenv(env_file)
+        # Like load_dotenv(), never override variables already set
+        for key, value in _read_env_file(env_file).items():
+            os.environ.setdefault(key, value)
         print(f'✅ Loaded environment from {env_file}')
     else:
         env_example = Path(__file__).parent.parent / '.env.example'
@@ -45,28 +87,30 @@ def load_environment():
             print('⚠️  No .env file found. Using default environment settings.')
 
 
+_REQUIRED_DEPENDENCIES = ('fastapi', 'sqlalchemy', 'langchain', 'langgraph', 'uvicorn')
+
+
+@functools.lru_cache(maxsize=1)
+def _missing_dependencies() -> tuple:
+    """Names of required dependencies that cannot be found (probed once)"""
+    return tuple(
+        name
+        for name in _REQUIRED_DEPENDENCIES
+        if importlib.util.find_spec(name) is None
+    )
+
+
 def check_dependencies():
     """Check if required dependencies are available"""
-    try:
-        # import fastapi
-        # import sqlalchemy
-        # import langchain
-        # import langgraph
-        # import uvicorn
-
-        importlib.util.find_spec('fastapi')
-        importlib.util.find_spec('sqlalchemy')
-        importlib.util.find_spec('langchain')
-        importlib.util.find_spec('langgraph')
-        importlib.util.find_spec('uvicorn')
-
-        print('✅ All required dependencies are available')
-        return True
-    except ImportError as e:
-        print(f'❌ Missing dependency: {e}')
+    missing = _missing_dependencies()
+    if missing:
+        print(f'❌ Missing dependency: {missing[0]}')
         print('Please run: uv sync  or  pip install -e .')
         return False
 
+    print('✅ All required dependencies are available')
+    return True
+
 
 def check_database():
     """Check database connection"""
@@ -98,6 +142,18 @@ def init_database():
         return False
 
 
+def check_tables_exist():
+    """Check whether the application tables have already been created"""
+    try:
+        from sqlalchemy import inspect
+
+        from losa.database.config import get_sync_engine
+
+        return inspect(get_sync_engine()).has_table('loan_applications')
+    except Exception:
+        return False
+
+
 def run_server(
     host: str = '0.0.0.0', port: int = 8000, reload: bool = True, debug: bool = False
 ):
@@ -115,11 +171,24 @@ def run_server(
     os.environ['DEBUG'] = str(debug).lower()
     os.environ['RELOAD'] = str(reload).lower()
 
+    # Only watch the package sources, so saving logs, docs or tests does not
+    # trigger a restart
+    reload_options = (
+        {
+            'reload_dirs': [str(Path(__file__).parent.parent / 'src' / 'losa')],
+            'reload_includes': ['*.py'],
+            'reload_excludes': ['*.log', '*.pyc', '__pycache__/*'],
+        }
+        if reload
+        else {}
+    )
+
     uvicorn.run(
         'losa.main:app',
         host=host,
         port=port,
         reload=reload,
+        **reload_options,
         log_level='debug' if debug else 'info',
         access_log=True,
         server_header=False,
@@ -139,6 +208,70 @@ def run_tests():
     return exit_code == 0
 
 
+def _cmd_check(args):
+    """Run system checks and exit"""
+    if not check_dependencies():
+        sys.exit(1)
+
+    print('🔍 Running system checks...')
+    db_ok = check_database()
+    print('=' * 50)
+    if db_ok:
+        print('✅ All system checks passed')
+        sys.exit(0)
+    else:
+        print('❌ System checks failed')
+        sys.exit(1)
+
+
+def _cmd_init_db(args):
+    """Initialize database tables and exit"""
+    print('🗄️  Initializing database...')
+    if init_database():
+        print('✅ Database initialization complete')
+        sys.exit(0)
+    else:
+        sys.exit(1)
+
+
+def _cmd_test(args):
+    """Run the test suite and exit"""
+    if run_tests():
+        print('✅ All tests passed')
+        sys.exit(0)
+    else:
+        print('❌ Some tests failed')
+        sys.exit(1)
+
+
+def _cmd_serve(args):
+    """Check dependencies and the database, then start the server"""
+    if not args.no_checks:
+        if not check_dependencies():
+            sys.exit(1)
+
+        # Check database before starting server
+        if not check_database():
+            print('❌ Cannot start server without database connection')
+            print('💡 Try running with --init-db to initialize the database')
+            sys.exit(1)
+
+        # Initialize database tables if they don't exist
+        if not args.skip_init and not check_tables_exist():
+            init_database()
+
+    # Start the server
+    try:
+        run_server(
+            host=args.host, port=args.port, reload=not args.no_reload, debug=args.debug
+        )
+    except KeyboardInterrupt:
+        print('\n👋 Server stopped by user')
+    except Exception as e:
+        print(f'❌ Server error: {e}')
+        sys.exit(1)
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description='LOSA Development Runner')
@@ -153,6 +286,16 @@ def main():
     parser.add_argument(
         '--init-db', action='store_true', help='Initialize database and exit'
     )
+    parser.add_argument(
+        '--skip-init',
+        action='store_true',
+        help='Skip database table initialization on server start',
+    )
+    parser.add_argument(
+        '--no-checks',
+        action='store_true',
+        help='Skip dependency, database and table checks (for inner dev loops)',
+    )
     parser.add_argument('--test', action='store_true', help='Run tests and exit')
     parser.add_argument(
         '--check', action='store_true', help='Run system checks and exit'
@@ -169,59 +312,14 @@ def main():
     print('🏦 Loan Origination System Application (LOSA)')
     print('=' * 50)
 
-    # Check dependencies
-    if not check_dependencies():
-        sys.exit(1)
-
-    # Run system checks
     if args.check:
-        print('🔍 Running system checks...')
-        db_ok = check_database()
-        print('=' * 50)
-        if db_ok:
-            print('✅ All system checks passed')
-            sys.exit(0)
-        else:
-            print('❌ System checks failed')
-            sys.exit(1)
-
-    # Initialize database if requested
-    if args.init_db:
-        print('🗄️  Initializing database...')
-        if init_database():
-            print('✅ Database initialization complete')
-            sys.exit(0)
-        else:
-            sys.exit(1)
-
-    # Run tests if requested
-    if args.test:
-        if run_tests():
-            print('✅ All tests passed')
-            sys.exit(0)
-        else:
-            print('❌ Some tests failed')
-            sys.exit(1)
-
-    # Check database before starting server
-    if not check_database():
-        print('❌ Cannot start server without database connection')
-        print('💡 Try running with --init-db to initialize the database')
-        sys.exit(1)
-
-    # Initialize database tables if they don't exist
-    init_database()
-
-    # Start the server
-    try:
-        run_server(
-            host=args.host, port=args.port, reload=not args.no_reload, debug=args.debug
-        )
-    except KeyboardInterrupt:
-        print('\n👋 Server stopped by user')
-    except Exception as e:
-        print(f'❌ Server error: {e}')
-        sys.exit(1)
+        _cmd_check(args)
+    elif args.init_db:
+        _cmd_init_db(args)
+    elif args.test:
+        _cmd_test(args)
+    else:
+        _cmd_serve(args)
 
 
 if __name__ == '__main__':
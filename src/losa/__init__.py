@@ -25,6 +25,26 @@ Usage:
     from losa.models.loan import LoanApplication, LoanApplicationCreate
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .database.config import db_manager, get_async_session, get_sync_session
+    from .models.loan import (
+        CreditScore,
+        Document,
+        DocumentType,
+        LoanApplication,
+        LoanApplicationCreate,
+        LoanApplicationSummary,
+        LoanApplicationUpdate,
+        LoanDecision,
+        LoanStatus,
+        LoanType,
+        RiskAssessment,
+    )
+    from .services.loan_service import LoanService
+
 __version__ = '1.0.0'
 __author__ = 'LOSA Development Team'
 __email__ = 'dev@losa.com'
@@ -32,23 +52,46 @@ __description__ = (
     'AI-powered loan origination system built with LangChain and LangGraph'
 )
 
-# Package-level imports for convenience
-from .models.loan import (
-    LoanApplication,
-    LoanApplicationCreate,
-    LoanApplicationUpdate,
-    LoanApplicationSummary,
-    LoanStatus,
-    LoanType,
-    DocumentType,
-    Document,
-    CreditScore,
-    RiskAssessment,
-    LoanDecision,
-)
+# Package-level names for convenience, imported on first access (PEP 562) so
+# that `import losa` does not pull in Pydantic, SQLAlchemy or LangChain.
+# Maps attribute name -> (module, attribute).
+_LAZY = {
+    **{
+        name: ('losa.models.loan', name)
+        for name in (
+            'LoanApplication',
+            'LoanApplicationCreate',
+            'LoanApplicationUpdate',
+            'LoanApplicationSummary',
+            'LoanStatus',
+            'LoanType',
+            'DocumentType',
+            'Document',
+            'CreditScore',
+            'RiskAssessment',
+            'LoanDecision',
+        )
+    },
+    'LoanService': ('losa.services.loan_service', 'LoanService'),
+    'db_manager': ('losa.database.config', 'db_manager'),
+    'get_sync_session': ('losa.database.config', 'get_sync_session'),
+    'get_async_session': ('losa.database.config', 'get_async_session'),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return list(globals()) + list(_LAZY)
 
-from .services.loan_service import LoanService
-from .database.config import db_manager, get_sync_session, get_async_session
 
 # Version info tuple
 VERSION = tuple(map(int, __version__.split('.')))
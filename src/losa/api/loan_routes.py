@@ -1,5 +1,5 @@
-from typing import List, Optional
-from uuid import UUID
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID, uuid4
 from fastapi import (
     APIRouter,
     Depends,
@@ -7,14 +7,20 @@ from fastapi import (
     UploadFile,
     File,
     Form,
-    BackgroundTasks,
+    Response,
 )
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from datetime import datetime
+import asyncio
+import base64
+import binascii
+import functools
 import os
-import aiofiles
 import logging
 
 from ..services.loan_service import LoanService
+from ..services.workflow_queue import workflow_queue
 from ..models.loan import (
     LoanApplication,
     LoanApplicationCreate,
@@ -27,10 +33,110 @@ from ..models.loan import (
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix='/api/v1/loans', tags=['loans'])
+router = APIRouter(
+    prefix='/api/v1/loans', tags=['loans'], default_response_class=ORJSONResponse
+)
+
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+MAX_UPLOAD_SIZE = 10 * 1024 * 1024  # 10MB
+# Files of a batch upload written at once; each in-flight write holds up to one
+# chunk in memory and an open file descriptor
+UPLOAD_CONCURRENCY = 8
+ALLOWED_UPLOAD_TYPES = frozenset(
+    {
+        'application/pdf',
+        'image/jpeg',
+        'image/jpg',
+        'image/png',
+        'application/msword',
+        'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    }
+)
+
+
+def _validate_upload(file: UploadFile) -> None:
+    """Reject an upload with no name, a reported size over the limit or a bad type"""
+    if not file.filename:
+        raise HTTPException(status_code=400, detail='No file selected')
+
+    # Check file size (10MB limit)
+    if file.size and file.size > MAX_UPLOAD_SIZE:
+        raise HTTPException(status_code=400, detail='File size exceeds 10MB limit')
+
+    # Validate file type
+    if file.content_type not in ALLOWED_UPLOAD_TYPES:
+        raise HTTPException(status_code=400, detail='Invalid file type')
+
+
+@functools.lru_cache(maxsize=4096)
+def _upload_dir(application_id: UUID) -> str:
+    """Create (once per process) and return an application's upload directory"""
+    upload_dir = f'uploads/{application_id}'
+    os.makedirs(upload_dir, exist_ok=True)
+    return upload_dir
+
+
+def _save_upload(source, file_path: str, max_file_size: int) -> int:
+    """Copy an upload to file_path in chunks and return the number of bytes read.
+
+    Stops and removes the partial file as soon as more than max_file_size
+    bytes have been read.
+    """
+    file_size = 0
+    with open(file_path, 'wb', buffering=UPLOAD_CHUNK_SIZE) as f:
+        while chunk := source.read(UPLOAD_CHUNK_SIZE):
+            file_size += len(chunk)
+            if file_size > max_file_size:
+                break
+            f.write(chunk)
+    if file_size > max_file_size:
+        os.remove(file_path)
+    return file_size
+
+
+def _remove_uploads(file_paths: Iterable[str]) -> None:
+    """Delete saved uploads, skipping any that were never written or already gone"""
+    for file_path in file_paths:
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+
 
+# Summary lists are serialized in one call instead of item by item through the
+# response model; the routes keep response_model for the OpenAPI schema only
+_SUMMARY_LIST = TypeAdapter(List[LoanApplicationSummary])
 
-# Dependency to get loan service
+
+def _summary_list_response(
+    applications: List[LoanApplicationSummary],
+) -> Response:
+    return Response(
+        content=_SUMMARY_LIST.dump_json(applications),
+        media_type='application/json',
+    )
+
+
+def _encode_cursor(summary: LoanApplicationSummary) -> str:
+    """Opaque pagination cursor pointing just after the given row"""
+    raw = f'{summary.priority_level}|{summary.created_at.isoformat()}|{summary.id}'
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[int, datetime, UUID]:
+    """Decode a cursor from _encode_cursor(); raises ValueError if malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError('Invalid cursor') from e
+    priority, created_at, app_id = raw.split('|')
+    return int(priority), datetime.fromisoformat(created_at), UUID(app_id)
+
+
+# Dependency to get loan service; one instance per process, so its document
+# chains and query cache are shared across requests
+@functools.lru_cache(maxsize=1)
 def get_loan_service() -> LoanService:
     return LoanService()
 
@@ -41,18 +147,12 @@ async def create_loan_application(
     loan_service: LoanService = Depends(get_loan_service),
 ):
     """Create a new loan application"""
-    try:
-        application = loan_service.create_application(application_data)
-        return application
-    except Exception as e:
-        logger.error(f'Error creating loan application: {str(e)}')
-        raise HTTPException(
-            status_code=500, detail=f'Failed to create application: {str(e)}'
-        )
+    application = loan_service.create_application(application_data)
+    return application
 
 
 @router.get('/{application_id}', response_model=LoanApplication)
-async def get_loan_application(
+def get_loan_application(
     application_id: UUID, loan_service: LoanService = Depends(get_loan_service)
 ):
     """Get loan application by ID"""
@@ -63,7 +163,7 @@ async def get_loan_application(
 
 
 @router.get('/number/{application_number}', response_model=LoanApplication)
-async def get_loan_application_by_number(
+def get_loan_application_by_number(
     application_number: str, loan_service: LoanService = Depends(get_loan_service)
 ):
     """Get loan application by application number"""
@@ -81,46 +181,32 @@ async def update_loan_application(
     loan_service: LoanService = Depends(get_loan_service),
 ):
     """Update loan application"""
-    try:
-        application = loan_service.update_application(application_id, updates, user_id)
-        if not application:
-            raise HTTPException(status_code=404, detail='Application not found')
-        return application
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f'Error updating application {application_id}: {str(e)}')
-        raise HTTPException(
-            status_code=500, detail=f'Failed to update application: {str(e)}'
-        )
+    application = loan_service.update_application(application_id, updates, user_id)
+    if not application:
+        raise HTTPException(status_code=404, detail='Application not found')
+    return application
 
 
 @router.post('/{application_id}/submit', response_model=LoanApplication)
 async def submit_loan_application(
     application_id: UUID,
-    background_tasks: BackgroundTasks,
     user_id: Optional[str] = None,
     loan_service: LoanService = Depends(get_loan_service),
 ):
     """Submit loan application for processing"""
-    try:
-        application = loan_service.submit_application(application_id, user_id)
-        if not application:
-            raise HTTPException(status_code=404, detail='Application not found')
+    application = loan_service.submit_application(application_id, user_id)
+    if not application:
+        raise HTTPException(status_code=404, detail='Application not found')
 
-        # Process application through workflow in background
-        background_tasks.add_task(
-            loan_service.process_application_workflow, application_id
-        )
+    # Process application through workflow on the background workers; an
+    # application already queued or being processed is not queued again
+    workflow_queue.enqueue(
+        loan_service.process_application_workflow,
+        application_id,
+        key=application_id,
+    )
 
-        return application
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f'Error submitting application {application_id}: {str(e)}')
-        raise HTTPException(
-            status_code=500, detail=f'Failed to submit application: {str(e)}'
-        )
+    return application
 
 
 @router.post('/{application_id}/process')
@@ -128,62 +214,53 @@ async def process_loan_application(
     application_id: UUID, loan_service: LoanService = Depends(get_loan_service)
 ):
     """Manually trigger workflow processing for an application"""
-    try:
-        application = await loan_service.process_application_workflow(application_id)
-        return {
-            'message': 'Application processed successfully',
-            'application_id': application_id,
-            'status': application.status,
-            'decision': application.decision.decision if application.decision else None,
-        }
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f'Error processing application {application_id}: {str(e)}')
-        raise HTTPException(
-            status_code=500, detail=f'Failed to process application: {str(e)}'
-        )
+    application = await loan_service.process_application_workflow(application_id)
+    return {
+        'message': 'Application processed successfully',
+        'application_id': application_id,
+        'status': application.status,
+        'decision': application.decision.decision if application.decision else None,
+    }
 
 
 @router.get('/status/{status}', response_model=List[LoanApplicationSummary])
-async def get_applications_by_status(
+def get_applications_by_status(
     status: LoanStatus,
     limit: int = 100,
     offset: int = 0,
+    cursor: Optional[str] = None,
     loan_service: LoanService = Depends(get_loan_service),
 ):
-    """Get applications by status"""
+    """Get applications by status.
+
+    A full page sets the X-Next-Cursor header; pass it back as ``cursor`` to
+    fetch the next page.
+    """
     try:
-        applications = loan_service.get_applications_by_status(status, limit, offset)
-        return applications
-    except Exception as e:
-        logger.error(f'Error getting applications by status {status}: {str(e)}')
-        raise HTTPException(
-            status_code=500, detail=f'Failed to retrieve applications: {str(e)}'
-        )
+        position = _decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail='Invalid cursor')
+
+    applications = loan_service.get_applications_by_status(
+        status, limit, offset, cursor=position
+    )
+    response = _summary_list_response(applications)
+    if len(applications) == limit and applications:
+        response.headers['X-Next-Cursor'] = _encode_cursor(applications[-1])
+    return response
 
 
 @router.get(
     '/underwriter/{underwriter_id}', response_model=List[LoanApplicationSummary]
 )
-async def get_applications_for_underwriter(
+def get_applications_for_underwriter(
     underwriter_id: str,
     limit: int = 50,
     loan_service: LoanService = Depends(get_loan_service),
 ):
     """Get applications assigned to an underwriter"""
-    try:
-        applications = loan_service.get_applications_for_underwriter(
-            underwriter_id, limit
-        )
-        return applications
-    except Exception as e:
-        logger.error(
-            f'Error getting applications for underwriter {underwriter_id}: {str(e)}'
-        )
-        raise HTTPException(
-            status_code=500, detail=f'Failed to retrieve applications: {str(e)}'
-        )
+    applications = loan_service.get_applications_for_underwriter(underwriter_id, limit)
+    return _summary_list_response(applications)
 
 
 @router.post('/{application_id}/documents', response_model=Document)
@@ -195,67 +272,112 @@ async def upload_document(
     loan_service: LoanService = Depends(get_loan_service),
 ):
     """Upload document for loan application"""
-    try:
-        # Validate file
-        if not file.filename:
-            raise HTTPException(status_code=400, detail='No file selected')
-
-        # Check file size (10MB limit)
-        max_file_size = 10 * 1024 * 1024  # 10MB
-        if file.size and file.size > max_file_size:
-            raise HTTPException(status_code=400, detail='File size exceeds 10MB limit')
-
-        # Validate file type
-        allowed_types = [
-            'application/pdf',
-            'image/jpeg',
-            'image/jpg',
-            'image/png',
-            'application/msword',
-            'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-        ]
-        if file.content_type not in allowed_types:
-            raise HTTPException(status_code=400, detail='Invalid file type')
-
-        # Create upload directory if it doesn't exist
-        upload_dir = f'uploads/{application_id}'
-        os.makedirs(upload_dir, exist_ok=True)
-
-        # Generate unique filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        file_extension = os.path.splitext(file.filename)[1]
-        unique_filename = f'{document_type.value}_{timestamp}{file_extension}'
-        file_path = os.path.join(upload_dir, unique_filename)
-
-        # Save file
-        async with aiofiles.open(file_path, 'wb') as f:
-            content = await file.read()
-            await f.write(content)
-
-        # Create document record
-        document = Document(
+    _validate_upload(file)
+
+    # Create upload directory if it doesn't exist
+    upload_dir = await asyncio.to_thread(_upload_dir, application_id)
+
+    # Generate unique filename
+    file_extension = os.path.splitext(file.filename)[1]
+    unique_filename = f'{document_type.value}_{uuid4().hex}{file_extension}'
+    file_path = os.path.join(upload_dir, unique_filename)
+
+    # Save file in a worker thread, enforcing the size limit on the bytes
+    # actually received rather than trusting the reported size
+    file_size = await asyncio.to_thread(
+        _save_upload, file.file, file_path, MAX_UPLOAD_SIZE
+    )
+    if file_size > MAX_UPLOAD_SIZE:
+        raise HTTPException(status_code=400, detail='File size exceeds 10MB limit')
+
+    # Create document record
+    document = Document(
+        document_type=document_type,
+        file_name=file.filename,
+        file_path=file_path,
+        file_size=file_size,
+        mime_type=file.content_type or 'application/octet-stream',
+        verified=False,
+    )
+
+    # Add to application
+    saved_document = loan_service.add_document(application_id, document, user_id)
+
+    return saved_document
+
+
+@router.post('/{application_id}/documents/batch', response_model=List[Document])
+async def upload_documents_batch(
+    application_id: UUID,
+    files: List[UploadFile] = File(...),
+    document_types: List[DocumentType] = Form(...),
+    user_id: Optional[str] = Form(None),
+    loan_service: LoanService = Depends(get_loan_service),
+):
+    """Upload several documents for a loan application in one request.
+
+    ``document_types`` gives the type of each file, in the same order.
+    """
+    if len(files) != len(document_types):
+        raise HTTPException(
+            status_code=400, detail='Each file needs exactly one document type'
+        )
+    for file in files:
+        _validate_upload(file)
+
+    # Create upload directory if it doesn't exist
+    upload_dir = await asyncio.to_thread(_upload_dir, application_id)
+
+    # Generate unique filenames
+    file_paths = [
+        os.path.join(
+            upload_dir,
+            f'{document_type.value}_{uuid4().hex}{os.path.splitext(file.filename)[1]}',
+        )
+        for file, document_type in zip(files, document_types)
+    ]
+
+    semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+
+    async def save(file: UploadFile, file_path: str) -> int:
+        async with semaphore:
+            return await asyncio.to_thread(
+                _save_upload, file.file, file_path, MAX_UPLOAD_SIZE
+            )
+
+    # Every save runs to completion, so a failed batch can remove all its files
+    results = await asyncio.gather(
+        *(save(file, file_path) for file, file_path in zip(files, file_paths)),
+        return_exceptions=True,
+    )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors or any(size > MAX_UPLOAD_SIZE for size in results):
+        await asyncio.to_thread(_remove_uploads, file_paths)
+        if errors:
+            raise errors[0]
+        raise HTTPException(status_code=400, detail='File size exceeds 10MB limit')
+    file_sizes = results
+
+    documents = [
+        Document(
             document_type=document_type,
             file_name=file.filename,
             file_path=file_path,
-            file_size=len(content),
+            file_size=file_size,
             mime_type=file.content_type or 'application/octet-stream',
             verified=False,
         )
+        for file, document_type, file_path, file_size in zip(
+            files, document_types, file_paths, file_sizes
+        )
+    ]
 
-        # Add to application
-        saved_document = loan_service.add_document(application_id, document, user_id)
-
-        return saved_document
-
-    except HTTPException:
+    # Insert all documents and their audit rows in one transaction
+    try:
+        return loan_service.add_documents(application_id, documents, user_id)
+    except Exception:
+        await asyncio.to_thread(_remove_uploads, file_paths)
         raise
-    except Exception as e:
-        logger.error(
-            f'Error uploading document for application {application_id}: {str(e)}'
-        )
-        raise HTTPException(
-            status_code=500, detail=f'Failed to upload document: {str(e)}'
-        )
 
 
 @router.delete('/{application_id}')
@@ -265,36 +387,20 @@ async def delete_loan_application(
     loan_service: LoanService = Depends(get_loan_service),
 ):
     """Delete (cancel) loan application"""
-    try:
-        success = loan_service.delete_application(application_id, user_id)
-        if not success:
-            raise HTTPException(status_code=404, detail='Application not found')
-
-        return {
-            'message': 'Application cancelled successfully',
-            'application_id': application_id,
-        }
-
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f'Error deleting application {application_id}: {str(e)}')
-        raise HTTPException(
-            status_code=500, detail=f'Failed to delete application: {str(e)}'
-        )
+    success = loan_service.delete_application(application_id, user_id)
+    if not success:
+        raise HTTPException(status_code=404, detail='Application not found')
+
+    return {
+        'message': 'Application cancelled successfully',
+        'application_id': application_id,
+    }
 
 
 @router.get('/statistics/overview')
-async def get_loan_statistics(loan_service: LoanService = Depends(get_loan_service)):
+def get_loan_statistics(loan_service: LoanService = Depends(get_loan_service)):
     """Get loan application statistics"""
-    try:
-        stats = loan_service.get_application_statistics()
-        return stats
-    except Exception as e:
-        logger.error(f'Error getting loan statistics: {str(e)}')
-        raise HTTPException(
-            status_code=500, detail=f'Failed to retrieve statistics: {str(e)}'
-        )
+    return loan_service.get_application_statistics()
 
 
 # Health check endpoint
@@ -312,42 +418,27 @@ async def health_check():
 
 
 @router.get('/{application_id}/status')
-async def get_application_status(
+def get_application_status(
     application_id: UUID, loan_service: LoanService = Depends(get_loan_service)
 ):
     """Get current status of loan application"""
-    application = loan_service.get_application(application_id)
-    if not application:
+    status_view = loan_service.get_application_status_view(application_id)
+    if not status_view:
         raise HTTPException(status_code=404, detail='Application not found')
 
-    return {
-        'application_id': application_id,
-        'application_number': application.application_number,
-        'status': application.status,
-        'created_at': application.created_at,
-        'updated_at': application.updated_at,
-        'submitted_at': application.submitted_at,
-        'decision_date': application.decision_date,
-        'assigned_underwriter': application.assigned_underwriter,
-        'priority_level': application.priority_level,
-    }
+    return {'application_id': application_id, **status_view}
 
 
 @router.get('/{application_id}/documents')
-async def get_application_documents(
+def get_application_documents(
     application_id: UUID, loan_service: LoanService = Depends(get_loan_service)
 ):
     """Get all documents for an application"""
-    application = loan_service.get_application(application_id)
-    if not application:
+    documents_view = loan_service.get_application_documents_view(application_id)
+    if not documents_view:
         raise HTTPException(status_code=404, detail='Application not found')
 
-    return {
-        'application_id': application_id,
-        'documents': application.documents,
-        'required_documents': application._get_required_documents(),
-        'is_complete': application.is_complete,
-    }
+    return {'application_id': application_id, **documents_view}
 
 
 @router.post('/{application_id}/priority')
@@ -363,28 +454,17 @@ async def update_application_priority(
             status_code=400, detail='Priority level must be between 1 and 5'
         )
 
-    try:
-        from ..models.loan import LoanApplicationUpdate
-
-        updates = LoanApplicationUpdate(priority_level=priority_level)
-        application = loan_service.update_application(application_id, updates, user_id)
-
-        if not application:
-            raise HTTPException(status_code=404, detail='Application not found')
+    updates = LoanApplicationUpdate(priority_level=priority_level)
+    application = loan_service.update_application(application_id, updates, user_id)
 
-        return {
-            'message': 'Priority updated successfully',
-            'application_id': application_id,
-            'new_priority': priority_level,
-        }
+    if not application:
+        raise HTTPException(status_code=404, detail='Application not found')
 
-    except Exception as e:
-        logger.error(
-            f'Error updating priority for application {application_id}: {str(e)}'
-        )
-        raise HTTPException(
-            status_code=500, detail=f'Failed to update priority: {str(e)}'
-        )
+    return {
+        'message': 'Priority updated successfully',
+        'application_id': application_id,
+        'new_priority': priority_level,
+    }
 
 
 @router.post('/{application_id}/assign')
@@ -395,46 +475,26 @@ async def assign_underwriter(
     loan_service: LoanService = Depends(get_loan_service),
 ):
     """Assign underwriter to application"""
-    try:
-        from ..models.loan import LoanApplicationUpdate
-
-        updates = LoanApplicationUpdate(assigned_underwriter=underwriter_id)
-        application = loan_service.update_application(application_id, updates, user_id)
+    updates = LoanApplicationUpdate(assigned_underwriter=underwriter_id)
+    application = loan_service.update_application(application_id, updates, user_id)
 
-        if not application:
-            raise HTTPException(status_code=404, detail='Application not found')
-
-        return {
-            'message': 'Underwriter assigned successfully',
-            'application_id': application_id,
-            'assigned_underwriter': underwriter_id,
-        }
+    if not application:
+        raise HTTPException(status_code=404, detail='Application not found')
 
-    except Exception as e:
-        logger.error(
-            f'Error assigning underwriter to application {application_id}: {str(e)}'
-        )
-        raise HTTPException(
-            status_code=500, detail=f'Failed to assign underwriter: {str(e)}'
-        )
+    return {
+        'message': 'Underwriter assigned successfully',
+        'application_id': application_id,
+        'assigned_underwriter': underwriter_id,
+    }
 
 
 @router.get('/{application_id}/workflow-state')
-async def get_workflow_state(
+def get_workflow_state(
     application_id: UUID, loan_service: LoanService = Depends(get_loan_service)
 ):
     """Get current workflow state of application"""
-    application = loan_service.get_application(application_id)
-    if not application:
+    workflow_view = loan_service.get_workflow_state_view(application_id)
+    if not workflow_view:
         raise HTTPException(status_code=404, detail='Application not found')
 
-    return {
-        'application_id': application_id,
-        'status': application.status,
-        'workflow_state': application.workflow_state,
-        'credit_check_complete': bool(application.credit_score),
-        'risk_assessment_complete': bool(application.risk_assessment),
-        'decision_complete': bool(application.decision),
-        'documents_complete': application.is_complete,
-        'human_review_required': application.assigned_underwriter is not None,
-    }
+    return {'application_id': application_id, **workflow_view}
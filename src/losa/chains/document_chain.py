@@ -1,10 +1,58 @@
-from typing import List, Dict, Any, Optional
+import asyncio
+import functools
+import logging
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
+import httpx
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import JsonOutputParser
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel, Field
 
-from ..models.loan import Document
+from ..models.loan import Document, DocumentType
+
+logger = logging.getLogger(__name__)
+
+# Document analyses sent to the LLM at once by one chain, to stay clear of
+# provider rate limits
+DOCUMENT_ANALYSIS_CONCURRENCY = 8
+
+# Documents analyzed together in one LLM request, and the most content tokens
+# packed into such a request
+DOCUMENT_ANALYSIS_BATCH_SIZE = 4
+DOCUMENT_ANALYSIS_BATCH_TOKENS = 4000
+
+# Documents whose analyses feed income verification
+INCOME_DOCUMENT_TYPES = frozenset(
+    {
+        DocumentType.INCOME_PROOF,
+        DocumentType.EMPLOYMENT_VERIFICATION,
+        DocumentType.BANK_STATEMENT,
+        DocumentType.TAX_RETURN,
+    }
+)
+
+# Connections kept to the LLM API, shared by every chain using the same client
+LLM_MAX_CONNECTIONS = 100
+LLM_MAX_KEEPALIVE_CONNECTIONS = 50
+
+
+def _format_money(amount: Any) -> str:
+    """Format an amount for a prompt, e.g. $75,000.00"""
+    return f'${amount:,.2f}' if amount is not None else 'N/A'
+
+
+@functools.lru_cache(maxsize=16)
+def _get_llm(model_name: str, temperature: float) -> ChatOpenAI:
+    """Shared LLM client per model and temperature, so chains reuse connections"""
+    return ChatOpenAI(
+        model=model_name,
+        temperature=temperature,
+        http_async_client=httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+            )
+        ),
+    )
 
 
 class DocumentAnalysisResult(BaseModel):
@@ -17,6 +65,22 @@ class DocumentAnalysisResult(BaseModel):
     issues_found: List[str] = Field(default_factory=list)
     verification_notes: str
 
+    @functools.cached_property
+    def formatted_summary(self) -> str:
+        """Analysis details as listed in the income verification prompt"""
+        return (
+            f'- Valid: {self.is_valid}\n'
+            f'- Extracted Data: {self.extracted_data}\n'
+            f'- Issues: {self.issues_found}\n'
+            f'- Confidence: {self.confidence_score}\n'
+        )
+
+
+class DocumentAnalysisBatchResult(BaseModel):
+    """Results of analyzing several documents in one request"""
+
+    results: List[DocumentAnalysisResult]
+
 
 class IncomeVerificationResult(BaseModel):
     """Result of income verification from documents"""
@@ -42,25 +106,15 @@ class CreditAnalysisResult(BaseModel):
     additional_requirements: List[str] = Field(default_factory=list)
 
 
-class DocumentAnalysisChain:
-    """Chain for analyzing uploaded documents"""
-
-    def __init__(self, llm: Optional[ChatOpenAI] = None):
-        self.llm = llm or ChatOpenAI(model='gpt-4', temperature=0.1)
-
-        # Document analysis prompt
-        self.analysis_prompt = ChatPromptTemplate.from_template(
+# Prompts are built once at import and shared by every chain
+# instance; only the LLM differs between instances
+_DOCUMENT_ANALYSIS_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            'system',
             """
         You are an expert document analyst for a loan origination system.
-        Analyze the following document and extract relevant information.
-
-        Document Information:
-        - Type: {document_type}
-        - File Name: {file_name}
-        - File Size: {file_size} bytes
-
-        Document Content (OCR/Text Extract):
-        {document_content}
+        Analyze the document you are given and extract relevant information.
 
         Your task is to:
         1. Verify if this document matches the expected type
@@ -99,62 +153,242 @@ class DocumentAnalysisChain:
         - Monthly deposits
         - Regular expenses
         - Transaction patterns
-        """
+        """,
+        ),
+        (
+            'human',
+            """
+        Document Information:
+        - Type: {document_type}
+        - File Name: {file_name}
+        - File Size: {file_size} bytes
+
+        Document Content (OCR/Text Extract):
+        {document_content}
+        """,
+        ),
+    ]
+)
+
+_BATCH_DOCUMENT_ANALYSIS_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            'system',
+            """
+        You are an expert document analyst for a loan origination system.
+        Analyze each of the documents you are given and extract relevant
+        information.
+
+        For each document, your task is to:
+        1. Verify if the document matches the expected type
+        2. Extract all relevant financial and personal information
+        3. Identify any issues, inconsistencies, or red flags
+        4. Provide a confidence score for the analysis
+
+        Return one analysis per document, in the same order as the documents,
+        in the following JSON format:
+        {{
+            "results": [
+                {{
+                    "document_type": "confirmed document type",
+                    "is_valid": true/false,
+                    "extracted_data": {{
+                        "key1": "value1",
+                        "key2": "value2"
+                    }},
+                    "confidence_score": 0.95,
+                    "issues_found": ["issue1", "issue2"],
+                    "verification_notes": "detailed notes about the verification"
+                }}
+            ]
+        }}
+
+        For income-related documents, ensure you extract:
+        - Annual income/salary
+        - Monthly income
+        - Employer information
+        - Employment dates
+        - Pay period information
+
+        For identity documents, extract:
+        - Full name
+        - Date of birth
+        - Address
+        - ID numbers
+
+        For bank statements, extract:
+        - Account balances
+        - Monthly deposits
+        - Regular expenses
+        - Transaction patterns
+        """,
+        ),
+        (
+            'human',
+            """
+        Documents:
+        {documents}
+        """,
+        ),
+    ]
+)
+
+
+class DocumentAnalysisChain:
+    """Chain for analyzing uploaded documents"""
+
+    def __init__(
+        self,
+        llm: Optional[ChatOpenAI] = None,
+        max_concurrency: int = DOCUMENT_ANALYSIS_CONCURRENCY,
+    ):
+        self.llm = llm or _get_llm('gpt-4', 0.1)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        # Document analysis prompt
+        self.analysis_prompt = _DOCUMENT_ANALYSIS_PROMPT
+
+        # The model fills in the result schema as a tool call, validated once
+        self.chain = self.analysis_prompt | self.llm.with_structured_output(
+            DocumentAnalysisResult, method='function_calling'
         )
 
-        self.parser = JsonOutputParser(pydantic_object=DocumentAnalysisResult)
+        # Batch analysis prompt, for several documents in one request
+        self.batch_analysis_prompt = _BATCH_DOCUMENT_ANALYSIS_PROMPT
 
-        self.chain = self.analysis_prompt | self.llm | self.parser
+        self.batch_chain = self.batch_analysis_prompt | self.llm.with_structured_output(
+            DocumentAnalysisBatchResult, method='function_calling'
+        )
 
     async def analyze_document(
         self, document: Document, document_content: str
     ) -> DocumentAnalysisResult:
         """Analyze a single document"""
 
-        result = await self.chain.ainvoke(
-            {
-                'document_type': document.document_type.value,
-                'file_name': document.file_name,
-                'file_size': document.file_size,
-                'document_content': document_content,
-            }
-        )
+        async with self._semaphore:
+            result = await self.chain.ainvoke(
+                {
+                    'document_type': document.document_type.value,
+                    'file_name': document.file_name,
+                    'file_size': document.file_size,
+                    'document_content': document_content,
+                }
+            )
 
-        return DocumentAnalysisResult(**result)
+        return result
 
     async def analyze_documents(
         self, documents: List[Document], document_contents: List[str]
     ) -> List[DocumentAnalysisResult]:
-        """Analyze multiple documents"""
-
-        results = []
-        for doc, content in zip(documents, document_contents):
-            result = await self.analyze_document(doc, content)
-            results.append(result)
-
-        return results
+        """Analyze multiple documents.
 
+        Documents are packed into batches of up to DOCUMENT_ANALYSIS_BATCH_SIZE
+        per LLM request and the batches run concurrently. A document whose
+        analysis fails gets an invalid result describing the error instead of
+        failing the whole call.
+        """
 
-class IncomeVerificationChain:
-    """Chain for verifying income from multiple sources"""
+        batches = await self._batch_documents(documents, document_contents)
+        results = await asyncio.gather(
+            *(self._analyze_batch(batch) for batch in batches)
+        )
+        return [analysis for batch in results for analysis in batch]
 
-    def __init__(self, llm: Optional[ChatOpenAI] = None):
-        self.llm = llm or ChatOpenAI(model='gpt-4', temperature=0.1)
+    async def _batch_documents(
+        self, documents: List[Document], document_contents: List[str]
+    ) -> List[List[Tuple[Document, str]]]:
+        """Split documents into batches within the size and token limits"""
+
+        pairs = list(zip(documents, document_contents))
+        if len(pairs) <= 1:
+            # Nothing to split, so there is no need to count tokens
+            return [pairs] if pairs else []
+
+        # Tokenizing is CPU-bound, so it runs off the event loop. If the tokenizer
+        # is unavailable the batches are limited by document count alone
+        try:
+            token_counts = await asyncio.to_thread(
+                lambda: [self.llm.get_num_tokens(content) for _, content in pairs]
+            )
+        except Exception as e:
+            logger.warning(f'Token counting failed, batching by count only: {str(e)}')
+            token_counts = [0] * len(pairs)
+
+        batches: List[List[Tuple[Document, str]]] = []
+        batch_tokens = 0
+        for (doc, content), tokens in zip(pairs, token_counts):
+            if (
+                not batches
+                or len(batches[-1]) >= DOCUMENT_ANALYSIS_BATCH_SIZE
+                or batch_tokens + tokens > DOCUMENT_ANALYSIS_BATCH_TOKENS
+            ):
+                batches.append([])
+                batch_tokens = 0
+            batches[-1].append((doc, content))
+            batch_tokens += tokens
+        return batches
+
+    async def _analyze_batch(
+        self, batch: List[Tuple[Document, str]]
+    ) -> List[DocumentAnalysisResult]:
+        """Analyze a batch in one request, falling back to one per document"""
+
+        if len(batch) > 1:
+            documents_text = '\n\n'.join(
+                f'Document {i + 1}:\n'
+                f'- Type: {doc.document_type.value}\n'
+                f'- File Name: {doc.file_name}\n'
+                f'- File Size: {doc.file_size} bytes\n'
+                f'- Content (OCR/Text Extract):\n{content}'
+                for i, (doc, content) in enumerate(batch)
+            )
+            try:
+                async with self._semaphore:
+                    result = await self.batch_chain.ainvoke(
+                        {'documents': documents_text}
+                    )
+                analyses = result.results
+                if len(analyses) == len(batch):
+                    return analyses
+                logger.warning(
+                    f'Batch analysis returned {len(analyses)} results for '
+                    f'{len(batch)} documents; analyzing them one by one'
+                )
+            except Exception as e:
+                logger.warning(
+                    f'Batch analysis failed, analyzing documents one by one: {str(e)}'
+                )
+
+        results = await asyncio.gather(
+            *(self.analyze_document(doc, content) for doc, content in batch),
+            return_exceptions=True,
+        )
 
-        self.verification_prompt = ChatPromptTemplate.from_template(
+        analyses = []
+        for (doc, _), result in zip(batch, results):
+            if isinstance(result, Exception):
+                logger.error(f'Error analyzing document {doc.file_name}: {str(result)}')
+                result = DocumentAnalysisResult(
+                    document_type=doc.document_type.value,
+                    is_valid=False,
+                    extracted_data={},
+                    confidence_score=0.0,
+                    issues_found=[f'Analysis failed: {str(result)}'],
+                    verification_notes='Document could not be analyzed',
+                )
+            analyses.append(result)
+
+        return analyses
+
+
+_INCOME_VERIFICATION_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            'system',
             """
         You are an expert income verification specialist for loan underwriting.
 
-        Analyze the following income-related information and documents to verify the applicant's income:
-
-        Applicant's Declared Information:
-        - Annual Income: ${declared_annual_income:,.2f}
-        - Monthly Income: ${declared_monthly_income:,.2f}
-        - Employment Status: {employment_status}
-        - Employer: {employer_name}
-
-        Document Analysis Results:
-        {document_analyses}
+        Analyze the income-related information and documents you are given to verify the applicant's income.
 
         Your task is to:
         1. Verify the declared income against document evidence
@@ -180,12 +414,36 @@ class IncomeVerificationChain:
             "verification_confidence": 0.95,
             "discrepancies": ["list of any discrepancies found"]
         }}
-        """
-        )
+        """,
+        ),
+        (
+            'human',
+            """
+        Applicant's Declared Information:
+        - Annual Income: {declared_annual_income}
+        - Monthly Income: {declared_monthly_income}
+        - Employment Status: {employment_status}
+        - Employer: {employer_name}
 
-        self.parser = JsonOutputParser(pydantic_object=IncomeVerificationResult)
+        Document Analysis Results:
+        {document_analyses}
+        """,
+        ),
+    ]
+)
+
+
+class IncomeVerificationChain:
+    """Chain for verifying income from multiple sources"""
+
+    def __init__(self, llm: Optional[ChatOpenAI] = None):
+        self.llm = llm or _get_llm('gpt-4', 0.1)
+
+        self.verification_prompt = _INCOME_VERIFICATION_PROMPT
 
-        self.chain = self.verification_prompt | self.llm | self.parser
+        self.chain = self.verification_prompt | self.llm.with_structured_output(
+            IncomeVerificationResult, method='function_calling'
+        )
 
     async def verify_income(
         self,
@@ -199,69 +457,32 @@ class IncomeVerificationChain:
 
         # Format document analyses for the prompt
         doc_analysis_text = '\n'.join(
-            [
-                f'Document {i + 1} ({analysis.document_type}):\n'
-                f'- Valid: {analysis.is_valid}\n'
-                f'- Extracted Data: {analysis.extracted_data}\n'
-                f'- Issues: {analysis.issues_found}\n'
-                f'- Confidence: {analysis.confidence_score}\n'
-                for i, analysis in enumerate(document_analyses)
-            ]
+            f'Document {i + 1} ({analysis.document_type}):\n'
+            f'{analysis.formatted_summary}'
+            for i, analysis in enumerate(document_analyses)
         )
 
         result = await self.chain.ainvoke(
             {
-                'declared_annual_income': declared_annual_income,
-                'declared_monthly_income': declared_monthly_income,
+                'declared_annual_income': _format_money(declared_annual_income),
+                'declared_monthly_income': _format_money(declared_monthly_income),
                 'employment_status': employment_status,
                 'employer_name': employer_name or 'Not provided',
                 'document_analyses': doc_analysis_text,
             }
         )
 
-        return IncomeVerificationResult(**result)
-
-
-class CreditAnalysisChain:
-    """Chain for comprehensive credit analysis and loan decision support"""
+        return result
 
-    def __init__(self, llm: Optional[ChatOpenAI] = None):
-        self.llm = llm or ChatOpenAI(model='gpt-4', temperature=0.1)
 
-        self.analysis_prompt = ChatPromptTemplate.from_template(
+_CREDIT_ANALYSIS_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            'system',
             """
         You are a senior credit analyst and underwriter with 20+ years of experience.
 
-        Analyze the following complete loan application and provide your professional assessment:
-
-        APPLICANT PROFILE:
-        - Name: {applicant_name}
-        - Age: {age}
-        - Employment: {employment_status} at {employer}
-        - Annual Income: ${annual_income:,.2f} (verified: {income_verified})
-        - Monthly Income: ${monthly_income:,.2f}
-
-        LOAN REQUEST:
-        - Type: {loan_type}
-        - Amount: ${requested_amount:,.2f}
-        - Term: {requested_term} months
-        - Purpose: {loan_purpose}
-
-        FINANCIAL PROFILE:
-        - Credit Score: {credit_score}
-        - Debt-to-Income Ratio: {dti_ratio:.1%}
-        - Monthly Debt Payments: ${monthly_debt:,.2f}
-        - Monthly Housing: ${monthly_housing:,.2f}
-        - Savings: ${savings:,.2f}
-        - Assets: ${assets:,.2f}
-
-        RISK ASSESSMENT:
-        - Overall Risk Score: {risk_score}/100
-        - Risk Level: {risk_level}
-        - Risk Factors: {risk_factors}
-
-        DOCUMENT VERIFICATION:
-        {document_summary}
+        Analyze the complete loan application you are given and provide your professional assessment.
 
         Based on your analysis, provide a comprehensive credit decision with the following JSON structure:
         {{
@@ -286,12 +507,56 @@ class CreditAnalysisChain:
         2. Any mitigating circumstances
         3. Recommended loan terms and conditions
         4. Additional documentation or requirements needed
-        """
-        )
+        """,
+        ),
+        (
+            'human',
+            """
+        APPLICANT PROFILE:
+        - Name: {applicant_name}
+        - Age: {age}
+        - Employment: {employment_status} at {employer}
+        - Annual Income: {annual_income} (verified: {income_verified})
+        - Monthly Income: {monthly_income}
 
-        self.parser = JsonOutputParser(pydantic_object=CreditAnalysisResult)
+        LOAN REQUEST:
+        - Type: {loan_type}
+        - Amount: {requested_amount}
+        - Term: {requested_term} months
+        - Purpose: {loan_purpose}
+
+        FINANCIAL PROFILE:
+        - Credit Score: {credit_score}
+        - Debt-to-Income Ratio: {dti_ratio}
+        - Monthly Debt Payments: {monthly_debt}
+        - Monthly Housing: {monthly_housing}
+        - Savings: {savings}
+        - Assets: {assets}
+
+        RISK ASSESSMENT:
+        - Overall Risk Score: {risk_score}/100
+        - Risk Level: {risk_level}
+        - Risk Factors: {risk_factors}
+
+        DOCUMENT VERIFICATION:
+        {document_summary}
+        """,
+        ),
+    ]
+)
 
-        self.chain = self.analysis_prompt | self.llm | self.parser
+
+class CreditAnalysisChain:
+    """Chain for comprehensive credit analysis and loan decision support"""
+
+    def __init__(self, llm: Optional[ChatOpenAI] = None):
+        self.llm = llm or _get_llm('gpt-4', 0.1)
+
+        self.analysis_prompt = _CREDIT_ANALYSIS_PROMPT
+
+        self.chain = self.analysis_prompt | self.llm.with_structured_output(
+            CreditAnalysisResult, method='function_calling'
+        )
 
     async def analyze_creditworthiness(
         self,
@@ -315,19 +580,23 @@ class CreditAnalysisChain:
                     'employment_status', 'Unknown'
                 ),
                 'employer': application_data.get('employer', 'Unknown'),
-                'annual_income': income_verification.annual_income,
-                'monthly_income': income_verification.monthly_income,
+                'annual_income': _format_money(income_verification.annual_income),
+                'monthly_income': _format_money(income_verification.monthly_income),
                 'income_verified': income_verification.verification_confidence > 0.8,
                 'loan_type': application_data.get('loan_type', 'Unknown'),
-                'requested_amount': application_data.get('requested_amount', 0),
+                'requested_amount': _format_money(
+                    application_data.get('requested_amount', 0)
+                ),
                 'requested_term': application_data.get('requested_term', 0),
                 'loan_purpose': application_data.get('loan_purpose', 'Not specified'),
                 'credit_score': application_data.get('credit_score', 0),
-                'dti_ratio': application_data.get('dti_ratio', 0),
-                'monthly_debt': application_data.get('monthly_debt', 0),
-                'monthly_housing': application_data.get('monthly_housing', 0),
-                'savings': application_data.get('savings', 0),
-                'assets': application_data.get('assets', 0),
+                'dti_ratio': f'{application_data.get("dti_ratio", 0):.1%}',
+                'monthly_debt': _format_money(application_data.get('monthly_debt', 0)),
+                'monthly_housing': _format_money(
+                    application_data.get('monthly_housing', 0)
+                ),
+                'savings': _format_money(application_data.get('savings', 0)),
+                'assets': _format_money(application_data.get('assets', 0)),
                 'risk_score': application_data.get('risk_score', 0),
                 'risk_level': application_data.get('risk_level', 'Unknown'),
                 'risk_factors': application_data.get('risk_factors', []),
@@ -335,81 +604,118 @@ class CreditAnalysisChain:
             }
         )
 
-        return CreditAnalysisResult(**result)
-
-
-class LoanExplanationChain:
-    """Chain for generating loan decision explanations"""
+        return result
 
-    def __init__(self, llm: Optional[ChatOpenAI] = None):
-        self.llm = llm or ChatOpenAI(model='gpt-4', temperature=0.3)
 
-        self.explanation_prompt = ChatPromptTemplate.from_template(
+_EXPLANATION_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            'system',
             """
         You are a loan officer explaining a loan decision to an applicant.
         Create a clear, professional, and empathetic explanation of the loan decision.
 
+        Generate a professional explanation that:
+        1. Clearly states the decision
+        2. Explains the key factors that influenced the decision
+        3. If approved: outlines the terms and any conditions
+        4. If rejected: provides constructive feedback and next steps
+        5. Maintains a helpful and professional tone
+
+        The explanation should be suitable for direct communication with the applicant.
+        """,
+        ),
+        (
+            'human',
+            """
         Loan Decision Details:
         - Decision: {decision}
-        - Requested Amount: ${requested_amount:,.2f}
-        - Approved Amount: ${approved_amount:,.2f} (if approved)
-        - Interest Rate: {interest_rate:.2%} (if approved)
+        - Requested Amount: {requested_amount}
+        - Approved Amount: {approved_amount} (if approved)
+        - Interest Rate: {interest_rate} (if approved)
         - Term: {term} months (if approved)
 
         Key Factors:
         - Credit Score: {credit_score}
-        - Debt-to-Income Ratio: {dti_ratio:.1%}
+        - Debt-to-Income Ratio: {dti_ratio}
         - Risk Factors: {risk_factors}
         - Positive Factors: {positive_factors}
 
         Conditions/Requirements: {conditions}
+        """,
+        ),
+    ]
+)
 
-        Generate a professional explanation that:
-        1. Clearly states the decision
-        2. Explains the key factors that influenced the decision
-        3. If approved: outlines the terms and any conditions
-        4. If rejected: provides constructive feedback and next steps
-        5. Maintains a helpful and professional tone
 
-        The explanation should be suitable for direct communication with the applicant.
-        """
-        )
+def _format_decision_data(decision_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Render the numeric decision fields as the strings the prompt shows"""
+    interest_rate = decision_data['interest_rate']
+    return {
+        **decision_data,
+        'requested_amount': _format_money(decision_data['requested_amount']),
+        'approved_amount': _format_money(decision_data['approved_amount']),
+        'interest_rate': f'{interest_rate:.2%}' if interest_rate is not None else 'N/A',
+        'dti_ratio': f'{decision_data["dti_ratio"]:.1%}',
+    }
+
+
+class LoanExplanationChain:
+    """Chain for generating loan decision explanations"""
+
+    def __init__(self, llm: Optional[ChatOpenAI] = None):
+        self.llm = llm or _get_llm('gpt-4', 0.3)
+
+        self.explanation_prompt = _EXPLANATION_PROMPT
 
         self.chain = self.explanation_prompt | self.llm
 
     async def generate_explanation(self, decision_data: Dict[str, Any]) -> str:
         """Generate a human-readable explanation of the loan decision"""
 
-        result = await self.chain.ainvoke(decision_data)
+        result = await self.chain.ainvoke(_format_decision_data(decision_data))
         return result.content
 
+    async def stream_explanation(
+        self, decision_data: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """Stream the explanation as it is generated"""
+
+        async for chunk in self.chain.astream(_format_decision_data(decision_data)):
+            yield chunk.content
 
-# Factory functions for creating chains with different configurations
 
+# Factory functions for creating chains with different configurations; each
+# returns one shared chain per model name
 
+
+@functools.lru_cache(maxsize=None)
 def create_document_analysis_chain(model_name: str = 'gpt-4') -> DocumentAnalysisChain:
     """Create a document analysis chain with specified model"""
-    llm = ChatOpenAI(model=model_name, temperature=0.1)
+    llm = _get_llm(model_name, 0.1)
     return DocumentAnalysisChain(llm)
 
 
+@functools.lru_cache(maxsize=None)
 def create_income_verification_chain(
     model_name: str = 'gpt-4',
 ) -> IncomeVerificationChain:
     """Create an income verification chain with specified model"""
-    llm = ChatOpenAI(model=model_name, temperature=0.1)
+    llm = _get_llm(model_name, 0.1)
     return IncomeVerificationChain(llm)
 
 
+@functools.lru_cache(maxsize=None)
 def create_credit_analysis_chain(model_name: str = 'gpt-4') -> CreditAnalysisChain:
     """Create a credit analysis chain with specified model"""
-    llm = ChatOpenAI(model=model_name, temperature=0.1)
+    llm = _get_llm(model_name, 0.1)
     return CreditAnalysisChain(llm)
 
 
+@functools.lru_cache(maxsize=None)
 def create_explanation_chain(model_name: str = 'gpt-4') -> LoanExplanationChain:
     """Create a loan explanation chain with specified model"""
-    llm = ChatOpenAI(model=model_name, temperature=0.3)
+    llm = _get_llm(model_name, 0.3)
     return LoanExplanationChain(llm)
 
 
@@ -431,39 +737,17 @@ class CompleteDocumentProcessingChain:
     ) -> Dict[str, Any]:
         """Process complete loan application through all chains"""
 
-        # Step 1: Analyze all documents
-        document_analyses = await self.document_chain.analyze_documents(
-            documents, document_contents
-        )
-
-        # Step 2: Verify income from relevant documents
-        income_verification = await self.income_chain.verify_income(
-            application_data['declared_annual_income'],
-            application_data['declared_monthly_income'],
-            application_data['employment_status'],
-            application_data['employer_name'],
+        (
             document_analyses,
-        )
-
-        # Step 3: Perform credit analysis
-        credit_analysis = await self.credit_chain.analyze_creditworthiness(
-            application_data, document_analyses, income_verification
+            income_verification,
+            credit_analysis,
+        ) = await self._analyze_application(
+            documents, document_contents, application_data
         )
 
         # Step 4: Generate explanation
         explanation = await self.explanation_chain.generate_explanation(
-            {
-                'decision': credit_analysis.recommended_decision,
-                'requested_amount': application_data['requested_amount'],
-                'approved_amount': credit_analysis.recommended_loan_amount,
-                'interest_rate': credit_analysis.recommended_interest_rate or 0,
-                'term': application_data['requested_term'],
-                'credit_score': application_data['credit_score'],
-                'dti_ratio': application_data['dti_ratio'],
-                'risk_factors': credit_analysis.risk_factors,
-                'positive_factors': credit_analysis.positive_factors,
-                'conditions': credit_analysis.additional_requirements,
-            }
+            _explanation_input(application_data, credit_analysis)
         )
 
         return {
@@ -472,3 +756,111 @@ class CompleteDocumentProcessingChain:
             'credit_analysis': credit_analysis,
             'explanation': explanation,
         }
+
+    async def stream_complete_application(
+        self,
+        documents: List[Document],
+        document_contents: List[str],
+        application_data: Dict[str, Any],
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Process an application, yielding (stage, result) as results are ready
+
+        Yields the 'document_analyses', 'income_verification' and
+        'credit_analysis' results, then ('explanation', token) for each token
+        of the explanation as it is generated.
+        """
+
+        (
+            document_analyses,
+            income_verification,
+            credit_analysis,
+        ) = await self._analyze_application(
+            documents, document_contents, application_data
+        )
+        yield 'document_analyses', document_analyses
+        yield 'income_verification', income_verification
+        yield 'credit_analysis', credit_analysis
+
+        # Step 4: Stream the explanation, so the first token only waits on
+        # credit analysis
+        async for token in self.explanation_chain.stream_explanation(
+            _explanation_input(application_data, credit_analysis)
+        ):
+            yield 'explanation', token
+
+    async def _analyze_application(
+        self,
+        documents: List[Document],
+        document_contents: List[str],
+        application_data: Dict[str, Any],
+    ) -> Tuple[
+        List[DocumentAnalysisResult], IncomeVerificationResult, CreditAnalysisResult
+    ]:
+        """Run document analysis, income verification and credit analysis"""
+
+        income_indexes = [
+            i
+            for i, doc in enumerate(documents)
+            if doc.document_type in INCOME_DOCUMENT_TYPES
+        ]
+        other_indexes = [
+            i
+            for i, doc in enumerate(documents)
+            if doc.document_type not in INCOME_DOCUMENT_TYPES
+        ]
+
+        async def analyze(indexes: List[int]) -> List[DocumentAnalysisResult]:
+            return await self.document_chain.analyze_documents(
+                [documents[i] for i in indexes],
+                [document_contents[i] for i in indexes],
+            )
+
+        async def verify_income() -> Tuple[
+            List[DocumentAnalysisResult], IncomeVerificationResult
+        ]:
+            # Step 2 only needs the income documents, so it starts as soon as
+            # they are analyzed while the other documents are still in flight
+            income_analyses = await analyze(income_indexes)
+            verification = await self.income_chain.verify_income(
+                application_data['declared_annual_income'],
+                application_data['declared_monthly_income'],
+                application_data['employment_status'],
+                application_data['employer_name'],
+                income_analyses,
+            )
+            return income_analyses, verification
+
+        # Steps 1 and 2: Analyze documents and verify income from relevant ones
+        (income_analyses, income_verification), other_analyses = await asyncio.gather(
+            verify_income(), analyze(other_indexes)
+        )
+
+        # Put the analyses back in document order
+        analyses_by_index = dict(zip(income_indexes, income_analyses))
+        analyses_by_index.update(zip(other_indexes, other_analyses))
+        document_analyses = [analyses_by_index[i] for i in range(len(documents))]
+
+        # Step 3: Perform credit analysis
+        credit_analysis = await self.credit_chain.analyze_creditworthiness(
+            application_data, document_analyses, income_verification
+        )
+
+        return document_analyses, income_verification, credit_analysis
+
+
+def _explanation_input(
+    application_data: Dict[str, Any], credit_analysis: CreditAnalysisResult
+) -> Dict[str, Any]:
+    """Decision data for the explanation chain"""
+    return {
+        'decision': credit_analysis.recommended_decision,
+        'requested_amount': application_data['requested_amount'],
+        'approved_amount': credit_analysis.recommended_loan_amount,
+        'interest_rate': credit_analysis.recommended_interest_rate or 0,
+        'term': application_data['requested_term'],
+        'credit_score': application_data['credit_score'],
+        'dti_ratio': application_data['dti_ratio'],
+        'risk_factors': credit_analysis.risk_factors,
+        'positive_factors': credit_analysis.positive_factors,
+        'conditions': credit_analysis.additional_requirements,
+    }
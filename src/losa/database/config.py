@@ -1,10 +1,18 @@
+import functools
 import os
-from typing import AsyncGenerator, Generator
+import time
+from typing import AsyncGenerator, Generator, Optional, Tuple
 from contextlib import contextmanager, asynccontextmanager
-from sqlalchemy import create_engine, text
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy import Connection, Engine, create_engine, text
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import NullPool, QueuePool
 
 from .models import Base
 
@@ -26,6 +34,9 @@ class DatabaseConfig:
         self.pool_timeout = int(os.getenv('DB_POOL_TIMEOUT', '30'))
         self.pool_recycle = int(os.getenv('DB_POOL_RECYCLE', '3600'))
 
+        # Prepared statements cached per asyncpg connection
+        self.statement_cache_size = int(os.getenv('DB_STATEMENT_CACHE_SIZE', '500'))
+
         # SSL settings
         self.ssl_mode = os.getenv('DB_SSL_MODE', 'disable')
 
@@ -53,37 +64,77 @@ class DatabaseConfig:
 db_config = DatabaseConfig()
 
 
-# Synchronous engine and session factory
-sync_engine = create_engine(
-    db_config.sync_database_url,
-    poolclass=QueuePool,
-    pool_size=db_config.pool_size,
-    max_overflow=db_config.max_overflow,
-    pool_timeout=db_config.pool_timeout,
-    pool_recycle=db_config.pool_recycle,
-    echo=db_config.echo_sql,
-)
+# Engines and session factories are created on first use, so importing this
+# module does not load the drivers or connect, and each forked worker process
+# builds its own connection pools
 
-SyncSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
 
+@functools.cache
+def get_sync_engine() -> Engine:
+    """Get the synchronous engine"""
+    return create_engine(
+        db_config.sync_database_url,
+        poolclass=QueuePool,
+        pool_size=db_config.pool_size,
+        max_overflow=db_config.max_overflow,
+        pool_timeout=db_config.pool_timeout,
+        pool_recycle=db_config.pool_recycle,
+        echo=db_config.echo_sql,
+    )
 
-# Asynchronous engine and session factory
-async_engine = create_async_engine(
-    db_config.async_database_url,
-    pool_size=db_config.pool_size,
-    max_overflow=db_config.max_overflow,
-    pool_timeout=db_config.pool_timeout,
-    pool_recycle=db_config.pool_recycle,
-    echo=db_config.echo_sql,
-)
 
-AsyncSessionLocal = async_sessionmaker(
-    bind=async_engine,
-    class_=AsyncSession,
-    autocommit=False,
-    autoflush=False,
-    expire_on_commit=False,
-)
+@functools.cache
+def get_sync_session_factory() -> sessionmaker:
+    """Get the synchronous session factory"""
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_sync_engine())
+
+
+@functools.cache
+def get_async_engine() -> AsyncEngine:
+    """Get the asynchronous engine"""
+    return create_async_engine(
+        db_config.async_database_url,
+        pool_size=db_config.pool_size,
+        max_overflow=db_config.max_overflow,
+        pool_timeout=db_config.pool_timeout,
+        pool_recycle=db_config.pool_recycle,
+        echo=db_config.echo_sql,
+        connect_args={
+            'prepared_statement_cache_size': db_config.statement_cache_size,
+            'statement_cache_size': db_config.statement_cache_size,
+            # Short OLTP queries never benefit from JIT compilation
+            'server_settings': {'jit': 'off'},
+        },
+    )
+
+
+@functools.cache
+def get_async_health_engine() -> AsyncEngine:
+    """Get the unpooled engine for one-shot health probes, which hold no pool slots"""
+    return create_async_engine(db_config.async_database_url, poolclass=NullPool)
+
+
+@functools.cache
+def get_async_session_factory() -> async_sessionmaker:
+    """Get the asynchronous session factory"""
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        class_=AsyncSession,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+def _reset_engines_after_fork() -> None:
+    """Drop connections inherited from the parent process without closing them"""
+    if get_sync_engine.cache_info().currsize:
+        get_sync_engine().dispose(close=False)
+    if get_async_engine.cache_info().currsize:
+        get_async_engine().sync_engine.dispose(close=False)
+
+
+os.register_at_fork(after_in_child=_reset_engines_after_fork)
 
 
 # Context managers for database sessions
@@ -92,7 +143,7 @@ AsyncSessionLocal = async_sessionmaker(
 @contextmanager
 def get_sync_session() -> Generator[Session, None, None]:
     """Get synchronous database session"""
-    session = SyncSessionLocal()
+    session = get_sync_session_factory()()
     try:
         yield session
         session.commit()
@@ -106,7 +157,7 @@ def get_sync_session() -> Generator[Session, None, None]:
 @asynccontextmanager
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """Get asynchronous database session"""
-    async with AsyncSessionLocal() as session:
+    async with get_async_session_factory()() as session:
         try:
             yield session
             await session.commit()
@@ -115,6 +166,22 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
             raise e
 
 
+@contextmanager
+def get_readonly_connection() -> Generator[Connection, None, None]:
+    """Get a connection for read-only queries; autocommit, so no COMMIT is sent"""
+    with get_sync_engine().connect() as conn:
+        conn.execution_options(isolation_level='AUTOCOMMIT')
+        yield conn
+
+
+@asynccontextmanager
+async def get_async_readonly_connection() -> AsyncGenerator[AsyncConnection, None]:
+    """Get an async connection for read-only queries; autocommit, so no COMMIT"""
+    async with get_async_engine().connect() as conn:
+        await conn.execution_options(isolation_level='AUTOCOMMIT')
+        yield conn
+
+
 # Dependency functions for FastAPI
 
 
@@ -125,9 +192,35 @@ def get_db_session() -> Generator[Session, None, None]:
 
 
 async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Async dependency function for FastAPI to get database session"""
-    async with get_async_session() as session:
-        yield session
+    """Async dependency function for FastAPI to get database session.
+
+    Commits if the request started a transaction or left pending changes, so
+    ORM changes and Core statements run through the session are both kept. A
+    request that never used the session sends no COMMIT; one that only reads
+    can set ``session.info['read_only'] = True`` to skip it, or depend on
+    get_async_db_read_session instead.
+    """
+    async with get_async_session_factory()() as session:
+        try:
+            yield session
+            pending = session.new or session.dirty or session.deleted
+            if (session.in_transaction() or pending) and not session.info.get(
+                'read_only'
+            ):
+                await session.commit()
+        except Exception as e:
+            await session.rollback()
+            raise e
+
+
+async def get_async_db_read_session() -> AsyncGenerator[AsyncConnection, None]:
+    """Async dependency function for FastAPI for read-only routes.
+
+    Yields an autocommit connection rather than an ORM session, so there is
+    no transaction to commit or roll back.
+    """
+    async with get_async_readonly_connection() as conn:
+        yield conn
 
 
 # Database initialization functions
@@ -135,34 +228,44 @@ async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
 
 def init_database():
     """Initialize database tables"""
-    Base.metadata.create_all(bind=sync_engine)
+    Base.metadata.create_all(bind=get_sync_engine())
+    invalidate_schema_version_cache()
 
 
 async def init_async_database():
     """Initialize database tables asynchronously"""
-    async with async_engine.begin() as conn:
+    async with get_async_engine().begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    invalidate_schema_version_cache()
 
 
 def drop_database():
     """Drop all database tables (use with caution!)"""
-    Base.metadata.drop_all(bind=sync_engine)
+    Base.metadata.drop_all(bind=get_sync_engine())
+    invalidate_schema_version_cache()
 
 
 async def drop_async_database():
     """Drop all database tables asynchronously (use with caution!)"""
-    async with async_engine.begin() as conn:
+    async with get_async_engine().begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    invalidate_schema_version_cache()
 
 
 # Health check functions
 
+# Statements built once; SQLAlchemy's compiled cache then reuses their SQL
+_HEALTH_STMT = text('SELECT 1')
+_SCHEMA_VERSION_STMT = text(
+    'SELECT version_num FROM alembic_version ORDER BY version_num DESC LIMIT 1'
+)
+
 
 def check_database_connection() -> bool:
     """Check if database connection is working"""
     try:
-        with get_sync_session() as session:
-            session.execute(text('SELECT 1'))
+        with get_readonly_connection() as conn:
+            conn.execute(_HEALTH_STMT)
             return True
     except Exception:
         return False
@@ -171,8 +274,8 @@ def check_database_connection() -> bool:
 async def check_async_database_connection() -> bool:
     """Check if async database connection is working"""
     try:
-        async with get_async_session() as session:
-            await session.execute(text('SELECT 1'))
+        async with get_async_health_engine().connect() as conn:
+            await conn.execute(_HEALTH_STMT)
             return True
     except Exception:
         return False
@@ -180,32 +283,55 @@ async def check_async_database_connection() -> bool:
 
 # Migration helpers
 
+# Seconds a looked-up schema version is reused; it only changes on migration
+SCHEMA_VERSION_CACHE_TTL_SECONDS = 300.0
+_schema_version_cache: Optional[Tuple[float, str]] = None
+
+
+def _get_cached_schema_version() -> Optional[str]:
+    if (
+        _schema_version_cache
+        and time.monotonic() - _schema_version_cache[0]
+        < SCHEMA_VERSION_CACHE_TTL_SECONDS
+    ):
+        return _schema_version_cache[1]
+    return None
+
+
+def _set_cached_schema_version(version: str) -> str:
+    global _schema_version_cache
+    _schema_version_cache = (time.monotonic(), version)
+    return version
+
+
+def invalidate_schema_version_cache() -> None:
+    """Forget the cached schema version, e.g. after a migration"""
+    global _schema_version_cache
+    _schema_version_cache = None
+
 
 def get_current_schema_version() -> str:
     """Get current database schema version"""
+    cached = _get_cached_schema_version()
+    if cached is not None:
+        return cached
     try:
-        with get_sync_session() as session:
-            result = session.execute(
-                text(
-                    'SELECT version_num FROM alembic_version ORDER BY version_num DESC LIMIT 1'
-                )
-            ).fetchone()
-            return result[0] if result else 'none'
+        with get_readonly_connection() as conn:
+            version = conn.scalar(_SCHEMA_VERSION_STMT)
+            return _set_cached_schema_version(version or 'none')
     except Exception:
         return 'unknown'
 
 
 async def get_current_schema_version_async() -> str:
     """Get current database schema version asynchronously"""
+    cached = _get_cached_schema_version()
+    if cached is not None:
+        return cached
     try:
-        async with get_async_session() as session:
-            result = await session.execute(
-                text(
-                    'SELECT version_num FROM alembic_version ORDER BY version_num DESC LIMIT 1'
-                )
-            )
-            row = result.fetchone()
-            return row[0] if row else 'none'
+        async with get_async_readonly_connection() as conn:
+            version = await conn.scalar(_SCHEMA_VERSION_STMT)
+            return _set_cached_schema_version(version or 'none')
     except Exception:
         return 'unknown'
 
@@ -215,26 +341,22 @@ async def get_current_schema_version_async() -> str:
 
 @contextmanager
 def database_transaction():
-    """Context manager for explicit database transactions"""
+    """Context manager for explicit database transactions.
+
+    get_sync_session already commits on success and rolls back on error.
+    """
     with get_sync_session() as session:
-        try:
-            yield session
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            raise e
+        yield session
 
 
 @asynccontextmanager
 async def async_database_transaction():
-    """Async context manager for explicit database transactions"""
+    """Async context manager for explicit database transactions.
+
+    get_async_session already commits on success and rolls back on error.
+    """
     async with get_async_session() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception as e:
-            await session.rollback()
-            raise e
+        yield session
 
 
 # Configuration management
@@ -243,11 +365,24 @@ async def async_database_transaction():
 class DatabaseManager:
     """Database manager for handling connections and operations"""
 
-    def __init__(self):
-        self.sync_engine = sync_engine
-        self.async_engine = async_engine
-        self.sync_session_factory = SyncSessionLocal
-        self.async_session_factory = AsyncSessionLocal
+    # Resolved on access rather than in __init__, so the global instance does
+    # not create the engines at import time
+
+    @property
+    def sync_engine(self) -> Engine:
+        return get_sync_engine()
+
+    @property
+    def async_engine(self) -> AsyncEngine:
+        return get_async_engine()
+
+    @property
+    def sync_session_factory(self) -> sessionmaker:
+        return get_sync_session_factory()
+
+    @property
+    def async_session_factory(self) -> async_sessionmaker:
+        return get_async_session_factory()
 
     def get_sync_session(self) -> Session:
         """Get a synchronous session"""
@@ -260,25 +395,30 @@ class DatabaseManager:
     async def close_connections(self):
         """Close all database connections"""
         await self.async_engine.dispose()
+        await get_async_health_engine().dispose()
         self.sync_engine.dispose()
 
     def create_tables(self):
         """Create all database tables"""
         Base.metadata.create_all(bind=self.sync_engine)
+        invalidate_schema_version_cache()
 
     async def create_tables_async(self):
         """Create all database tables asynchronously"""
         async with self.async_engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+        invalidate_schema_version_cache()
 
     def drop_tables(self):
         """Drop all database tables"""
         Base.metadata.drop_all(bind=self.sync_engine)
+        invalidate_schema_version_cache()
 
     async def drop_tables_async(self):
         """Drop all database tables asynchronously"""
         async with self.async_engine.begin() as conn:
             await conn.run_sync(Base.metadata.drop_all)
+        invalidate_schema_version_cache()
 
 
 # Global database manager instance
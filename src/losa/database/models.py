@@ -143,6 +143,14 @@ class LoanApplicationDB(Base, TimestampMixin):
     # Indexes for common queries
     __table_args__ = (
         Index('ix_loan_apps_status_created', 'status', 'created_at'),
+        # Keyset pagination of status listings
+        Index(
+            'ix_loan_apps_status_priority_created_id',
+            'status',
+            priority_level.desc(),
+            'created_at',
+            'id',
+        ),
         Index('ix_loan_apps_underwriter_status', 'assigned_underwriter', 'status'),
         Index('ix_loan_apps_email_status', 'email', 'status'),
     )
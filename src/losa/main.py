@@ -11,6 +11,8 @@ from datetime import datetime
 
 from .database.config import db_manager, check_database_connection
 from .api.loan_routes import router as loan_router
+from .services.loan_service import LoanServiceError
+from .services.workflow_queue import workflow_queue
 
 # Configure logging
 logging.basicConfig(
@@ -42,12 +44,15 @@ async def lifespan(app: FastAPI):
         logger.error(f'Failed to initialize database: {str(e)}')
         raise
 
+    await workflow_queue.start()
+
     logger.info('Application startup completed')
 
     yield
 
     # Shutdown
     logger.info('Shutting down Loan Origination System...')
+    await workflow_queue.stop()
     await db_manager.close_connections()
     logger.info('Application shutdown completed')
 
@@ -174,6 +179,23 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     )
 
 
+# Requests the loan service refuses (invalid status transitions, missing
+# records) are client errors; any other exception falls through to the 500
+@app.exception_handler(LoanServiceError)
+async def loan_service_error_handler(request: Request, exc: LoanServiceError):
+    logger.warning(f'Invalid request for {request.method} {request.url}: {str(exc)}')
+
+    return JSONResponse(
+        status_code=400,
+        content={
+            'error': str(exc),
+            'status_code': 400,
+            'timestamp': datetime.utcnow().isoformat(),
+            'path': str(request.url),
+        },
+    )
+
+
 # Include routers
 app.include_router(loan_router)
 
@@ -209,8 +231,9 @@ async def health_check():
             'components': {
                 'database': 'healthy' if db_healthy else 'unhealthy',
                 'api': 'healthy',
-                'workflows': 'healthy',  # Could add more detailed checks
+                'workflows': 'healthy' if workflow_queue.running else 'unhealthy',
             },
+            'workflow_queue_depth': workflow_queue.depth,
         }
 
         if not db_healthy:
@@ -262,10 +285,10 @@ async def liveness_check():
 @app.get('/metrics', tags=['monitoring'])
 async def get_metrics():
     """Basic metrics endpoint"""
-    from .services.loan_service import LoanService
+    from .api.loan_routes import get_loan_service
 
     try:
-        loan_service = LoanService()
+        loan_service = get_loan_service()
         stats = loan_service.get_application_statistics()
 
         return {
@@ -213,16 +213,25 @@ class LoanApplication(BaseModel):
 
     def _get_required_documents(self) -> List[DocumentType]:
         """Get list of required documents based on loan type"""
-        base_docs = [DocumentType.IDENTITY, DocumentType.INCOME_PROOF]
+        return required_documents(
+            self.loan_details.loan_type, self.loan_details.requested_amount
+        )
+
+
+def required_documents(
+    loan_type: LoanType, requested_amount: Decimal
+) -> List[DocumentType]:
+    """Get list of required documents for a loan type and amount"""
+    base_docs = [DocumentType.IDENTITY, DocumentType.INCOME_PROOF]
 
-        if self.loan_details.loan_type == LoanType.HOME:
-            base_docs.extend([DocumentType.BANK_STATEMENT, DocumentType.TAX_RETURN])
-        elif self.loan_details.loan_type == LoanType.BUSINESS:
-            base_docs.extend([DocumentType.TAX_RETURN, DocumentType.BANK_STATEMENT])
-        elif self.loan_details.requested_amount > 50000:
-            base_docs.append(DocumentType.BANK_STATEMENT)
+    if loan_type == LoanType.HOME:
+        base_docs.extend([DocumentType.BANK_STATEMENT, DocumentType.TAX_RETURN])
+    elif loan_type == LoanType.BUSINESS:
+        base_docs.extend([DocumentType.TAX_RETURN, DocumentType.BANK_STATEMENT])
+    elif requested_amount > 50000:
+        base_docs.append(DocumentType.BANK_STATEMENT)
 
-        return base_docs
+    return base_docs
 
 
 class LoanApplicationCreate(BaseModel):
@@ -1,8 +1,12 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator, Tuple
 from datetime import datetime, timedelta
 import logging
+import threading
+import time
 from uuid import UUID, uuid4
 
+from sqlalchemy import and_, exists, or_, tuple_
+from sqlalchemy.orm import selectinload
 
 from ..models.loan import (
     LoanApplication,
@@ -14,6 +18,7 @@ from ..models.loan import (
     CreditScore,
     RiskAssessment,
     LoanDecision,
+    required_documents,
 )
 from ..database.models import (
     LoanApplicationDB,
@@ -23,17 +28,87 @@ from ..database.models import (
     create_audit_log,
 )
 from ..database.config import get_sync_session
-from ..workflows.loan_workflow import process_loan_application
+from ..workflows.loan_workflow import (
+    process_loan_application,
+    stream_loan_application,
+)
 from ..chains.document_chain import CompleteDocumentProcessingChain
 
 logger = logging.getLogger(__name__)
 
 
+class LoanServiceError(ValueError):
+    """A request the service refuses, such as an invalid status transition"""
+
+
+# Seconds that statistics and status listings are served from the in-memory cache
+QUERY_CACHE_TTL_SECONDS = 5.0
+# Most query results kept at once; each cursor page is its own entry
+QUERY_CACHE_MAX_ENTRIES = 256
+
+# Relationships read by _convert_db_to_pydantic(), loaded with the application in
+# one extra query each instead of lazily per attribute access
+_FULL_APPLICATION_LOADS = (
+    selectinload(LoanApplicationDB.documents),
+    selectinload(LoanApplicationDB.credit_scores),
+    selectinload(LoanApplicationDB.risk_assessments),
+)
+
+
 class LoanService:
     """Service class for loan application business logic"""
 
     def __init__(self):
         self.document_processor = CompleteDocumentProcessingChain()
+        self._query_cache: Dict[tuple, tuple[float, Any]] = {}
+        # The service is shared by sync routes running in the threadpool
+        self._query_cache_lock = threading.Lock()
+
+    def _get_cached(self, key: tuple) -> Optional[Any]:
+        """Return a cached query result if it is still within the TTL"""
+        with self._query_cache_lock:
+            entry = self._query_cache.get(key)
+        if entry and time.monotonic() - entry[0] < QUERY_CACHE_TTL_SECONDS:
+            return entry[1]
+        return None
+
+    def _set_cached(self, key: tuple, value: Any) -> None:
+        """Store a query result, dropping expired and then the oldest entries"""
+        now = time.monotonic()
+        cache = self._query_cache
+        with self._query_cache_lock:
+            cache.pop(key, None)
+            # Entries are in insertion order, so expired ones are at the front
+            while cache:
+                oldest_key = next(iter(cache))
+                stored_at = cache[oldest_key][0]
+                if (
+                    now - stored_at < QUERY_CACHE_TTL_SECONDS
+                    and len(cache) < QUERY_CACHE_MAX_ENTRIES
+                ):
+                    break
+                del cache[oldest_key]
+            cache[key] = (now, value)
+
+    def invalidate_query_cache(self) -> None:
+        """Drop cached statistics and status listings after a write"""
+        with self._query_cache_lock:
+            self._query_cache.clear()
+
+    @staticmethod
+    def _convert_db_document(doc_db: DocumentDB) -> Document:
+        """Convert database document to Pydantic model"""
+        return Document(
+            id=doc_db.id,
+            document_type=doc_db.document_type,
+            file_name=doc_db.file_name,
+            file_path=doc_db.file_path,
+            file_size=doc_db.file_size,
+            mime_type=doc_db.mime_type,
+            uploaded_at=doc_db.created_at,
+            verified=doc_db.verified,
+            verification_notes=doc_db.verification_notes,
+        )
 
     def _convert_db_to_pydantic(self, db_app: LoanApplicationDB) -> LoanApplication:
         """Convert database model to Pydantic model"""
@@ -114,20 +189,7 @@ class LoanService:
         )
 
         # Convert documents
-        documents = []
-        for doc_db in db_app.documents:
-            doc = Document(
-                id=doc_db.id,
-                document_type=doc_db.document_type,
-                file_name=doc_db.file_name,
-                file_path=doc_db.file_path,
-                file_size=doc_db.file_size,
-                mime_type=doc_db.mime_type,
-                uploaded_at=doc_db.created_at,
-                verified=doc_db.verified,
-                verification_notes=doc_db.verification_notes,
-            )
-            documents.append(doc)
+        documents = [self._convert_db_document(doc_db) for doc_db in db_app.documents]
 
         # Convert credit score if available
         credit_score = None
@@ -316,6 +378,7 @@ class LoanService:
             )
 
             session.commit()
+            self.invalidate_query_cache()
 
             # Convert back to Pydantic model
             application.id = db_app.id
@@ -331,6 +394,7 @@ class LoanService:
         with get_sync_session() as session:
             db_app = (
                 session.query(LoanApplicationDB)
+                .options(*_FULL_APPLICATION_LOADS)
                 .filter(LoanApplicationDB.id == application_id)
                 .first()
             )
@@ -348,6 +412,7 @@ class LoanService:
         with get_sync_session() as session:
             db_app = (
                 session.query(LoanApplicationDB)
+                .options(*_FULL_APPLICATION_LOADS)
                 .filter(LoanApplicationDB.application_number == application_number)
                 .first()
             )
@@ -357,6 +422,105 @@ class LoanService:
 
             return self._convert_db_to_pydantic(db_app)
 
+    def get_application_status_view(
+        self, application_id: UUID
+    ) -> Optional[Dict[str, Any]]:
+        """Get the status and tracking fields of an application in one narrow query"""
+
+        with get_sync_session() as session:
+            row = (
+                session.query(
+                    LoanApplicationDB.application_number,
+                    LoanApplicationDB.status,
+                    LoanApplicationDB.created_at,
+                    LoanApplicationDB.updated_at,
+                    LoanApplicationDB.submitted_at,
+                    LoanApplicationDB.decision_date,
+                    LoanApplicationDB.assigned_underwriter,
+                    LoanApplicationDB.priority_level,
+                )
+                .filter(LoanApplicationDB.id == application_id)
+                .first()
+            )
+
+            return row._asdict() if row else None
+
+    def get_application_documents_view(
+        self, application_id: UUID
+    ) -> Optional[Dict[str, Any]]:
+        """Get an application's documents and document requirements"""
+
+        with get_sync_session() as session:
+            row = (
+                session.query(
+                    LoanApplicationDB.loan_type, LoanApplicationDB.requested_amount
+                )
+                .filter(LoanApplicationDB.id == application_id)
+                .first()
+            )
+            if not row:
+                return None
+
+            documents = [
+                self._convert_db_document(doc_db)
+                for doc_db in session.query(DocumentDB)
+                .filter(DocumentDB.application_id == application_id)
+                .all()
+            ]
+
+        required = required_documents(row.loan_type, row.requested_amount)
+        uploaded_doc_types = {doc.document_type for doc in documents}
+        return {
+            'documents': documents,
+            'required_documents': required,
+            'is_complete': all(doc_type in uploaded_doc_types for doc_type in required),
+        }
+
+    def get_workflow_state_view(self, application_id: UUID) -> Optional[Dict[str, Any]]:
+        """Get the workflow progress of an application without loading it in full"""
+
+        with get_sync_session() as session:
+            row = (
+                session.query(
+                    LoanApplicationDB.status,
+                    LoanApplicationDB.workflow_state,
+                    LoanApplicationDB.decision,
+                    LoanApplicationDB.assigned_underwriter,
+                    LoanApplicationDB.loan_type,
+                    LoanApplicationDB.requested_amount,
+                    exists()
+                    .where(CreditScoreDB.application_id == LoanApplicationDB.id)
+                    .label('has_credit_score'),
+                    exists()
+                    .where(RiskAssessmentDB.application_id == LoanApplicationDB.id)
+                    .label('has_risk_assessment'),
+                )
+                .filter(LoanApplicationDB.id == application_id)
+                .first()
+            )
+            if not row:
+                return None
+
+            uploaded_doc_types = {
+                doc_type
+                for (doc_type,) in session.query(DocumentDB.document_type).filter(
+                    DocumentDB.application_id == application_id
+                )
+            }
+
+        required = required_documents(row.loan_type, row.requested_amount)
+        return {
+            'status': row.status,
+            'workflow_state': row.workflow_state or {},
+            'credit_check_complete': row.has_credit_score,
+            'risk_assessment_complete': row.has_risk_assessment,
+            'decision_complete': bool(row.decision),
+            'documents_complete': all(
+                doc_type in uploaded_doc_types for doc_type in required
+            ),
+            'human_review_required': row.assigned_underwriter is not None,
+        }
+
     def update_application(
         self,
         application_id: UUID,
@@ -472,6 +636,7 @@ class LoanService:
             )
 
             session.commit()
+            self.invalidate_query_cache()
 
             return self._convert_db_to_pydantic(db_app)
 
@@ -485,7 +650,7 @@ class LoanService:
             return None
 
         if application.status != LoanStatus.DRAFT:
-            raise ValueError(
+            raise LoanServiceError(
                 f'Application must be in DRAFT status to submit, current status: {application.status}'
             )
 
@@ -509,6 +674,7 @@ class LoanService:
             )
 
             session.commit()
+            self.invalidate_query_cache()
 
         # Trigger workflow processing
         updated_application = self.get_application(application_id)
@@ -527,7 +693,7 @@ class LoanService:
 
         application = self.get_application(application_id)
         if not application:
-            raise ValueError(f'Application {application_id} not found')
+            raise LoanServiceError(f'Application {application_id} not found')
 
         try:
             # Process through LangGraph workflow
@@ -542,34 +708,66 @@ class LoanService:
             return processed_application
 
         except Exception as e:
-            logger.error(
-                f'Error processing application {application.application_number}: {str(e)}'
-            )
+            self._record_workflow_error(application, e)
+            raise
 
-            # Update status to indicate error
-            with get_sync_session() as session:
-                session.query(LoanApplicationDB).filter(
-                    LoanApplicationDB.id == application_id
-                ).update(
-                    {
-                        'status': LoanStatus.UNDER_REVIEW,
-                        'notes': (application.notes or [])
-                        + [f'Processing error: {str(e)}'],
-                    }
-                )
+    async def stream_application_workflow(
+        self, application_id: UUID
+    ) -> AsyncIterator[Tuple[str, LoanApplication]]:
+        """Process application through the workflow, yielding after each stage"""
 
-                create_audit_log(
-                    session=session,
-                    application_id=str(application_id),
-                    action='WORKFLOW_ERROR',
-                    user_type='system',
-                    notes=f'Workflow processing error: {str(e)}',
-                )
+        application = self.get_application(application_id)
+        if not application:
+            raise LoanServiceError(f'Application {application_id} not found')
 
-                session.commit()
+        processed_application = application
+        try:
+            async for stage, processed_application in stream_loan_application(
+                application
+            ):
+                yield stage, processed_application
+
+            # Save the final results back to database
+            self._save_workflow_results(processed_application)
 
+            logger.info(
+                f'Completed workflow processing for application {application.application_number}'
+            )
+
+        except Exception as e:
+            self._record_workflow_error(application, e)
             raise
 
+    def _record_workflow_error(self, application: LoanApplication, error: Exception):
+        """Mark application for review after a workflow processing error"""
+
+        logger.error(
+            f'Error processing application {application.application_number}: {str(error)}'
+        )
+
+        # Update status to indicate error
+        with get_sync_session() as session:
+            session.query(LoanApplicationDB).filter(
+                LoanApplicationDB.id == application.id
+            ).update(
+                {
+                    'status': LoanStatus.UNDER_REVIEW,
+                    'notes': (application.notes or [])
+                    + [f'Processing error: {str(error)}'],
+                }
+            )
+
+            create_audit_log(
+                session=session,
+                application_id=str(application.id),
+                action='WORKFLOW_ERROR',
+                user_type='system',
+                notes=f'Workflow processing error: {str(error)}',
+            )
+
+            session.commit()
+            self.invalidate_query_cache()
+
     def _save_workflow_results(self, application: LoanApplication):
         """Save workflow processing results to database"""
 
@@ -640,24 +838,51 @@ class LoanService:
             )
 
             session.commit()
+            self.invalidate_query_cache()
 
     def get_applications_by_status(
-        self, status: LoanStatus, limit: int = 100, offset: int = 0
+        self,
+        status: LoanStatus,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[Tuple[int, datetime, UUID]] = None,
     ) -> List[LoanApplicationSummary]:
-        """Get applications by status"""
+        """Get applications by status.
+
+        Results are ordered by priority (highest first), then age, then id. Pass
+        the (priority_level, created_at, id) of the last row seen as ``cursor``
+        to continue after it with an index seek; ``offset`` is ignored then.
+        """
+
+        cache_key = ('by_status', status, limit, offset, cursor)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return list(cached)
 
         with get_sync_session() as session:
-            db_apps = (
-                session.query(LoanApplicationDB)
-                .filter(LoanApplicationDB.status == status)
-                .order_by(
-                    LoanApplicationDB.priority_level.desc(),
-                    LoanApplicationDB.created_at.asc(),
+            query = session.query(LoanApplicationDB).filter(
+                LoanApplicationDB.status == status
+            )
+            if cursor is not None:
+                priority, created_at, app_id = cursor
+                query = query.filter(
+                    or_(
+                        LoanApplicationDB.priority_level < priority,
+                        and_(
+                            LoanApplicationDB.priority_level == priority,
+                            tuple_(LoanApplicationDB.created_at, LoanApplicationDB.id)
+                            > tuple_(created_at, app_id),
+                        ),
+                    )
                 )
-                .offset(offset)
-                .limit(limit)
-                .all()
+            query = query.order_by(
+                LoanApplicationDB.priority_level.desc(),
+                LoanApplicationDB.created_at.asc(),
+                LoanApplicationDB.id.asc(),
             )
+            if cursor is None:
+                query = query.offset(offset)
+            db_apps = query.limit(limit).all()
 
             summaries = []
             for db_app in db_apps:
@@ -675,7 +900,8 @@ class LoanService:
                 )
                 summaries.append(summary)
 
-            return summaries
+            self._set_cached(cache_key, summaries)
+            return list(summaries)
 
     def get_applications_for_underwriter(
         self, underwriter_id: str, limit: int = 50
@@ -753,6 +979,56 @@ class LoanService:
 
             return document
 
+    def add_documents(
+        self,
+        application_id: UUID,
+        documents: List[Document],
+        user_id: Optional[str] = None,
+    ) -> List[Document]:
+        """Add multiple documents to application in a single transaction"""
+
+        with get_sync_session() as session:
+            db_docs = [
+                DocumentDB(
+                    application_id=application_id,
+                    document_type=document.document_type,
+                    file_name=document.file_name,
+                    file_path=document.file_path,
+                    file_size=document.file_size,
+                    mime_type=document.mime_type,
+                    verified=document.verified,
+                    verification_notes=document.verification_notes,
+                )
+                for document in documents
+            ]
+
+            # One flush lets SQLAlchemy batch the rows into a multi-VALUES INSERT
+            session.add_all(db_docs)
+            session.flush()
+
+            for document in documents:
+                create_audit_log(
+                    session=session,
+                    application_id=str(application_id),
+                    action='DOCUMENT_UPLOADED',
+                    user_id=user_id,
+                    user_type='applicant',
+                    new_values={
+                        'document_type': document.document_type.value,
+                        'file_name': document.file_name,
+                    },
+                    notes=f'Document uploaded: {document.file_name}',
+                )
+
+            session.commit()
+
+            # Update the documents with the generated IDs and timestamps
+            for document, db_doc in zip(documents, db_docs):
+                document.id = db_doc.id
+                document.uploaded_at = db_doc.created_at
+
+            return documents
+
     def delete_application(
         self, application_id: UUID, user_id: Optional[str] = None
     ) -> bool:
@@ -770,7 +1046,7 @@ class LoanService:
 
             # Only allow deletion of draft or rejected applications
             if db_app.status not in [LoanStatus.DRAFT, LoanStatus.REJECTED]:
-                raise ValueError(
+                raise LoanServiceError(
                     f'Cannot delete application in status: {db_app.status}'
                 )
 
@@ -786,11 +1062,16 @@ class LoanService:
             )
 
             session.commit()
+            self.invalidate_query_cache()
             return True
 
     def get_application_statistics(self) -> Dict[str, Any]:
         """Get loan application statistics"""
 
+        cached = self._get_cached(('statistics',))
+        if cached is not None:
+            return dict(cached)
+
         with get_sync_session() as session:
             stats = {}
 
@@ -824,4 +1105,5 @@ class LoanService:
             # Average processing time (for completed applications)
             # This would require more complex queries in a real implementation
 
-            return stats
+            self._set_cached(('statistics',), stats)
+            return dict(stats)
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import os
+from typing import Any, Awaitable, Callable, Hashable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Workflows processed at once per server process
+WORKFLOW_WORKERS = int(os.getenv('WORKFLOW_WORKERS', '4'))
+
+# Seconds to let queued workflows finish on shutdown before they are cancelled
+WORKFLOW_SHUTDOWN_TIMEOUT_SECONDS = 30.0
+
+Job = Tuple[Callable[..., Awaitable[Any]], Tuple[Any, ...], Optional[Hashable]]
+
+
+class WorkflowQueue:
+    """Runs loan workflows on a fixed pool of worker tasks.
+
+    Submitting a job only enqueues it, so the request that triggered it is not
+    tied to the workflow's run time, and at most ``workers`` workflows run
+    concurrently no matter how many are submitted.
+    """
+
+    def __init__(self, workers: int = WORKFLOW_WORKERS):
+        self.workers = workers
+        self._queue: asyncio.Queue[Job] = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+        self._pending_keys: Set[Hashable] = set()
+
+    @property
+    def depth(self) -> int:
+        """Number of jobs waiting to be picked up"""
+        return self._queue.qsize()
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def enqueue(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        key: Optional[Hashable] = None,
+    ) -> bool:
+        """Queue ``await func(*args)`` to run on a worker.
+
+        A job with a ``key`` is skipped while another job with the same key is
+        still queued or running. Returns whether the job was queued.
+        """
+        if key is not None:
+            if key in self._pending_keys:
+                return False
+            self._pending_keys.add(key)
+        self._queue.put_nowait((func, args, key))
+        return True
+
+    async def start(self) -> None:
+        """Start the worker tasks"""
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._worker(), name=f'workflow-worker-{i}')
+                for i in range(self.workers)
+            ]
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """Wait for queued jobs to finish, then stop the workers"""
+        if timeout is None:
+            timeout = WORKFLOW_SHUTDOWN_TIMEOUT_SECONDS
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f'Stopping workflow workers with {self.depth} job(s) still queued'
+            )
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _worker(self) -> None:
+        while True:
+            func, args, key = await self._queue.get()
+            try:
+                await func(*args)
+            except Exception as e:
+                logger.error(f'Workflow job {func.__name__}{args} failed: {str(e)}')
+            finally:
+                self._pending_keys.discard(key)
+                self._queue.task_done()
+
+
+# Global workflow queue instance
+workflow_queue = WorkflowQueue()
@@ -10,6 +10,7 @@ from .loan_workflow import (
     # Main workflow components
     create_loan_workflow,
     process_loan_application,
+    stream_loan_application,
     # Workflow state and status
     LoanWorkflowState,
     WorkflowStatus,
@@ -28,6 +29,7 @@ __all__ = [
     # Main workflow
     'create_loan_workflow',
     'process_loan_application',
+    'stream_loan_application',
     # State management
     'LoanWorkflowState',
     'WorkflowStatus',
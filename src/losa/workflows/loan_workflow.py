@@ -1,4 +1,4 @@
-from typing import TypedDict, List, Optional, Annotated
+from typing import TypedDict, List, Optional, Annotated, AsyncIterator, Tuple
 from datetime import datetime
 from enum import Enum
 import operator
@@ -565,14 +565,9 @@ def create_loan_workflow() -> StateGraph:
     return workflow
 
 
-# Convenience function to run the complete workflow
-async def process_loan_application(application: LoanApplication) -> LoanApplication:
-    """Process a loan application through the complete workflow"""
-
-    workflow = create_loan_workflow()
-    app = workflow.compile()
-
-    initial_state: LoanWorkflowState = {
+def _create_initial_state(application: LoanApplication) -> LoanWorkflowState:
+    """Build the initial workflow state for an application"""
+    return {
         'application': application,
         'messages': [
             HumanMessage(
@@ -592,7 +587,32 @@ async def process_loan_application(application: LoanApplication) -> LoanApplicat
         'stage_results': {},
     }
 
+
+# Convenience function to run the complete workflow
+async def process_loan_application(application: LoanApplication) -> LoanApplication:
+    """Process a loan application through the complete workflow"""
+
+    workflow = create_loan_workflow()
+    app = workflow.compile()
+
+    initial_state = _create_initial_state(application)
+
     # Run the workflow
     final_state = await app.ainvoke(initial_state)
 
     return final_state['application']
+
+
+async def stream_loan_application(
+    application: LoanApplication,
+) -> AsyncIterator[Tuple[str, LoanApplication]]:
+    """Process a loan application, yielding (stage, application) after each node"""
+
+    workflow = create_loan_workflow()
+    app = workflow.compile()
+
+    initial_state = _create_initial_state(application)
+
+    async for update in app.astream(initial_state, stream_mode='updates'):
+        for stage, stage_state in update.items():
+            yield stage, stage_state['application']
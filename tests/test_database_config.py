@@ -0,0 +1,98 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+from sqlalchemy import update
+
+from losa.database.config import get_async_db_session
+from losa.database.models import LoanApplicationDB
+from losa.models.loan import LoanStatus
+
+
+class TestAsyncDbSession:
+    """Test cases for the get_async_db_session dependency"""
+
+    @pytest.fixture
+    def mock_session(self):
+        """Async session that starts a transaction on its first execute"""
+        session = Mock()
+        session.new = session.dirty = session.deleted = ()
+        session.info = {}
+        session.in_transaction = Mock(return_value=False)
+        session.commit = AsyncMock()
+        session.rollback = AsyncMock()
+
+        async def execute(statement):
+            session.in_transaction.return_value = True
+
+        session.execute = AsyncMock(side_effect=execute)
+        return session
+
+    @pytest.fixture
+    def session_factory(self, mock_session):
+        """Patch the async session factory to hand out mock_session"""
+        context = MagicMock()
+        context.__aenter__.return_value = mock_session
+        with patch(
+            'losa.database.config.get_async_session_factory',
+            return_value=Mock(return_value=context),
+        ):
+            yield
+
+    @staticmethod
+    async def _run(dependency, body):
+        """Drive a yield dependency the way FastAPI does around a route body"""
+        session = await dependency.__anext__()
+        await body(session)
+        with pytest.raises(StopAsyncIteration):
+            await dependency.__anext__()
+
+    @pytest.mark.asyncio
+    async def test_core_update_is_committed(self, session_factory, mock_session):
+        """Test a Core update() with no ORM changes is still committed"""
+
+        async def body(session):
+            await session.execute(
+                update(LoanApplicationDB).values(status=LoanStatus.CANCELLED)
+            )
+
+        await self._run(get_async_db_session(), body)
+
+        mock_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unused_session_is_not_committed(self, session_factory, mock_session):
+        """Test a request that never touches the session sends no COMMIT"""
+
+        async def body(session):
+            pass
+
+        await self._run(get_async_db_session(), body)
+
+        mock_session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_read_only_session_is_not_committed(
+        self, session_factory, mock_session
+    ):
+        """Test a request can opt out of the commit"""
+
+        async def body(session):
+            session.info['read_only'] = True
+            await session.execute(update(LoanApplicationDB))
+
+        await self._run(get_async_db_session(), body)
+
+        mock_session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_error_rolls_back(self, session_factory, mock_session):
+        """Test an error raised into the dependency rolls back"""
+        dependency = get_async_db_session()
+        session = await dependency.__anext__()
+        await session.execute(update(LoanApplicationDB))
+
+        with pytest.raises(RuntimeError):
+            await dependency.athrow(RuntimeError('boom'))
+
+        mock_session.rollback.assert_awaited_once()
+        mock_session.commit.assert_not_awaited()
@@ -0,0 +1,133 @@
+import importlib.util
+import itertools
+import math
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+DEMO_PATH = Path(__file__).resolve().parents[1] / 'scripts' / 'demo.py'
+
+
+@pytest.fixture(scope='module')
+def demo():
+    """Load scripts/demo.py, which is not part of the installed package"""
+    spec = importlib.util.spec_from_file_location('losa_demo', DEMO_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='module')
+def applications(demo):
+    """Applications on and around every threshold of the scoring tables"""
+    now = datetime(2024, 1, 1)
+    apps = []
+    for seq, (income, dti, employment, savings, requested) in enumerate(
+        itertools.product(
+            (25000, 30000, 40000, 50000, 50000.01, 75000, 100000, 120000),
+            (0, 0.1, 0.2, 0.3, 0.4, 0.45),
+            (3, 6, 12, 13, 24, 30),
+            (1000, 5000, 20000, 60000),
+            (30000, 150000),
+        )
+    ):
+        monthly_income = income / 12
+        apps.append(
+            demo.DemoLoanApplication(
+                id=f'test-{seq}',
+                application_number=f'LOAN-{seq:04d}',
+                created_at=now,
+                first_name='Test',
+                last_name='Applicant',
+                annual_income=income,
+                monthly_income=monthly_income,
+                monthly_rent=dti * monthly_income,
+                employment_months=employment,
+                savings=savings,
+                requested_amount=requested,
+            )
+        )
+    return apps
+
+
+class TestScoreAndDecide:
+    """The fused kernel must agree with the step-by-step DemoWorkflow"""
+
+    def test_scalar_and_batch_paths_agree(self, demo, applications):
+        """Test score_and_decide_batch matches the workflow for every application"""
+        batch = demo.LoanApplicationBatch.from_applications(applications)
+        results = demo.score_and_decide_batch(batch)
+
+        for i, app in enumerate(applications):
+            workflow = demo.DemoWorkflow()
+            workflow.perform_credit_check(app)
+            workflow.assess_risk(app)
+            workflow.make_decision(app)
+            decision = app.decision
+
+            assert results['credit_score'][i] == app.credit_score['score']
+            assert results['risk_score'][i] == app.risk_assessment['overall_risk_score']
+            assert (
+                demo.DECISION_NAMES[results['decision_code'][i]] == decision['decision']
+            )
+            assert results['confidence'][i] == decision['confidence_score']
+            if decision['approved_amount'] is None:
+                assert math.isnan(results['approved_amount'][i])
+                assert math.isnan(results['interest_rate'][i])
+            else:
+                assert results['approved_amount'][i] == pytest.approx(
+                    decision['approved_amount']
+                )
+                assert results['interest_rate'][i] == pytest.approx(
+                    decision['interest_rate']
+                )
+
+    def test_scores_match_vectorized_helpers(self, demo, applications):
+        """Test the kernel's risk scores and tiers match the numpy helpers"""
+        batch = demo.LoanApplicationBatch.from_applications(applications)
+        results = demo.score_and_decide_batch(batch)
+
+        risk_scores = demo.calculate_risk_score_batch(batch)
+        np.testing.assert_array_equal(results['risk_score'], risk_scores)
+
+        tiers = demo.decision_tier_batch(risk_scores, results['credit_score'])
+        np.testing.assert_array_equal(
+            results['confidence'], np.asarray(demo.TIER_CONFIDENCE)[tiers]
+        )
+
+
+class TestBatchMode:
+    """main(['--batch', N]) scores generated applications with the batch path"""
+
+    def test_columnar_batch_matches_workflow(self, demo):
+        """Test each repeated sample gets the status the narrated workflow gives"""
+        pytest.importorskip('pandas')
+        samples = demo.create_sample_applications()
+        expected = [
+            demo.demonstrate_single_application(sample, demo.DemoWorkflow()).status
+            for sample in samples
+        ]
+
+        scored = demo.demonstrate_columnar_batch(len(samples) * 100)
+
+        assert len(scored) == len(samples) * 100
+        assert list(scored['status']) == expected * 100
+
+    def test_main_runs_batch_mode(self, demo, capsys):
+        """Test the --batch flag reaches the columnar batch summary"""
+        pytest.importorskip('pandas')
+
+        demo.main(['--batch', '300'])
+
+        output = capsys.readouterr().out
+        assert 'LOSA Columnar Batch Demo (300 applications)' in output
+        assert 'Columnar Batch Summary' in output
+        assert 'Demo error' not in output
+
+    def test_batch_must_be_positive(self, demo):
+        """Test --batch rejects counts below one"""
+        with pytest.raises(SystemExit):
+            demo.main(['--batch', '0'])
@@ -0,0 +1,248 @@
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from langchain_core.runnables import RunnableLambda
+
+from losa.chains.document_chain import (
+    CompleteDocumentProcessingChain,
+    CreditAnalysisResult,
+    DocumentAnalysisBatchResult,
+    DocumentAnalysisChain,
+    DocumentAnalysisResult,
+    IncomeVerificationResult,
+    LoanExplanationChain,
+)
+from losa.models.loan import Document, DocumentType
+
+
+def _analysis(document_type: str = 'identity') -> DocumentAnalysisResult:
+    return DocumentAnalysisResult(
+        document_type=document_type,
+        is_valid=True,
+        extracted_data={},
+        confidence_score=0.9,
+        verification_notes='Looks genuine',
+    )
+
+
+class TestDocumentAnalysisChain:
+    """Test cases for batched document analysis"""
+
+    @pytest.fixture
+    def llm(self):
+        """LLM stand-in; each document counts as 10 tokens"""
+        llm = Mock()
+        llm.get_num_tokens.return_value = 10
+        llm.with_structured_output.return_value = RunnableLambda(lambda _: None)
+        return llm
+
+    @pytest.fixture
+    def chain(self, llm):
+        """Chain whose single and batch LLM calls are mocked"""
+        chain = DocumentAnalysisChain(llm=llm)
+        chain.chain = Mock()
+        chain.chain.ainvoke = AsyncMock(side_effect=lambda _: _analysis())
+        chain.batch_chain = Mock()
+        chain.batch_chain.ainvoke = AsyncMock(
+            side_effect=lambda inputs: DocumentAnalysisBatchResult(
+                results=[
+                    _analysis() for _ in range(inputs['documents'].count('Document '))
+                ]
+            )
+        )
+        return chain
+
+    @staticmethod
+    def _documents(count: int):
+        documents = [
+            Document(
+                document_type=DocumentType.IDENTITY,
+                file_name=f'id_{i}.pdf',
+                file_path=f'uploads/id_{i}.pdf',
+                file_size=1024,
+                mime_type='application/pdf',
+            )
+            for i in range(count)
+        ]
+        return documents, [f'content {i}' for i in range(count)]
+
+    @pytest.mark.asyncio
+    async def test_documents_are_analyzed_in_one_request(self, chain):
+        """Test documents within the batch limits share one LLM request"""
+        documents, contents = self._documents(3)
+
+        analyses = await chain.analyze_documents(documents, contents)
+
+        assert len(analyses) == 3
+        chain.batch_chain.ainvoke.assert_awaited_once()
+        chain.chain.ainvoke.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_per_document(self, chain):
+        """Test a failed batch is retried per document, isolating failures"""
+        documents, contents = self._documents(2)
+        chain.batch_chain.ainvoke.side_effect = RuntimeError('rate limited')
+        chain.chain.ainvoke.side_effect = [_analysis(), RuntimeError('bad scan')]
+
+        analyses = await chain.analyze_documents(documents, contents)
+
+        assert chain.chain.ainvoke.await_count == 2
+        assert analyses[0].is_valid
+        assert not analyses[1].is_valid
+        assert 'bad scan' in analyses[1].issues_found[0]
+
+    @pytest.mark.asyncio
+    async def test_token_counting_failure_batches_by_count(self, chain, llm):
+        """Test a tokenizer error still analyzes everything, batched by count"""
+        documents, contents = self._documents(6)
+        llm.get_num_tokens.side_effect = OSError('encoding unavailable')
+
+        analyses = await chain.analyze_documents(documents, contents)
+
+        assert len(analyses) == 6
+        # DOCUMENT_ANALYSIS_BATCH_SIZE documents per request
+        assert chain.batch_chain.ainvoke.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_single_document_skips_token_counting(self, chain, llm):
+        """Test one document is analyzed without tokenizing it"""
+        documents, contents = self._documents(1)
+
+        analyses = await chain.analyze_documents(documents, contents)
+
+        assert len(analyses) == 1
+        llm.get_num_tokens.assert_not_called()
+        chain.chain.ainvoke.assert_awaited_once()
+
+
+class TestCompleteDocumentProcessingChain:
+    """Test cases for the composite document processing chain"""
+
+    @pytest.fixture
+    def explanation_chain(self):
+        """Explanation chain whose LLM streams the explanation in two chunks"""
+        explanation_chain = LoanExplanationChain(llm=RunnableLambda(lambda _: None))
+
+        async def astream(inputs):
+            for token in ('Approved ', 'with conditions'):
+                yield Mock(content=token)
+
+        explanation_chain.chain = Mock()
+        explanation_chain.chain.astream = astream
+        explanation_chain.chain.ainvoke = AsyncMock(
+            return_value=Mock(content='Approved with conditions')
+        )
+        return explanation_chain
+
+    @pytest.fixture
+    def processing_chain(self, explanation_chain):
+        """Composite chain with the analysis steps mocked"""
+        document_chain = Mock()
+        document_chain.analyze_documents = AsyncMock(
+            side_effect=lambda documents, contents: [
+                _analysis(doc.document_type.value) for doc in documents
+            ]
+        )
+        income_chain = Mock()
+        income_chain.verify_income = AsyncMock(
+            return_value=IncomeVerificationResult(
+                annual_income=85000,
+                monthly_income=7083.33,
+                employment_status='employed',
+                income_sources=['salary'],
+                verification_confidence=0.9,
+            )
+        )
+        credit_chain = Mock()
+        credit_chain.analyze_creditworthiness = AsyncMock(
+            return_value=CreditAnalysisResult(
+                recommended_decision='APPROVE',
+                risk_factors=[],
+                positive_factors=['Stable income'],
+                confidence_score=0.8,
+                recommended_interest_rate=0.065,
+                recommended_loan_amount=25000,
+            )
+        )
+
+        module = 'losa.chains.document_chain'
+        with (
+            patch(
+                f'{module}.create_document_analysis_chain', return_value=document_chain
+            ),
+            patch(
+                f'{module}.create_income_verification_chain', return_value=income_chain
+            ),
+            patch(f'{module}.create_credit_analysis_chain', return_value=credit_chain),
+            patch(f'{module}.create_explanation_chain', return_value=explanation_chain),
+        ):
+            yield CompleteDocumentProcessingChain()
+
+    @pytest.fixture
+    def application_inputs(self):
+        """Documents, contents and application data for one application"""
+        documents = [
+            Document(
+                document_type=document_type,
+                file_name=f'{document_type.value}.pdf',
+                file_path=f'uploads/{document_type.value}.pdf',
+                file_size=1024,
+                mime_type='application/pdf',
+            )
+            for document_type in (DocumentType.IDENTITY, DocumentType.INCOME_PROOF)
+        ]
+        application_data = {
+            'declared_annual_income': 85000,
+            'declared_monthly_income': 7083.33,
+            'employment_status': 'employed',
+            'employer_name': 'Tech Corp',
+            'requested_amount': 25000,
+            'requested_term': 60,
+            'credit_score': 720,
+            'dti_ratio': 0.25,
+        }
+        return documents, ['id scan', 'pay stub'], application_data
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_stages_then_explanation_tokens(
+        self, processing_chain, application_inputs
+    ):
+        """Test the stream yields each stage result, then the explanation tokens"""
+        events = [
+            event
+            async for event in processing_chain.stream_complete_application(
+                *application_inputs
+            )
+        ]
+
+        stages = [stage for stage, _ in events]
+        assert stages[:3] == [
+            'document_analyses',
+            'income_verification',
+            'credit_analysis',
+        ]
+        tokens = [value for stage, value in events if stage == 'explanation']
+        assert tokens == ['Approved ', 'with conditions']
+
+        # Analyses come back in document order despite the income split
+        document_analyses = events[0][1]
+        assert [analysis.document_type for analysis in document_analyses] == [
+            'identity',
+            'income_proof',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_process_returns_all_results(
+        self, processing_chain, application_inputs
+    ):
+        """Test the non-streaming path returns the same stage results"""
+        result = await processing_chain.process_complete_application(
+            *application_inputs
+        )
+
+        assert result['explanation'] == 'Approved with conditions'
+        assert [a.document_type for a in result['document_analyses']] == [
+            'identity',
+            'income_proof',
+        ]
+        assert result['credit_analysis'].recommended_decision == 'APPROVE'
@@ -1,5 +1,6 @@
 import pytest
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from decimal import Decimal
 from uuid import uuid4
@@ -21,7 +22,7 @@ from losa.models.loan import (
     DocumentType,
     Document,
 )
-from losa.services.loan_service import LoanService
+from losa.services.loan_service import LoanService, LoanServiceError
 
 from dotenv import load_dotenv
 
@@ -316,7 +317,9 @@ class TestLoanService:
         with patch.object(
             loan_service, 'get_application', return_value=mock_application
         ):
-            with pytest.raises(ValueError, match='Application must be in DRAFT status'):
+            with pytest.raises(
+                LoanServiceError, match='Application must be in DRAFT status'
+            ):
                 loan_service.submit_application(application_id)
 
     @patch('losa.services.loan_service.get_sync_session')
@@ -354,6 +357,76 @@ class TestLoanService:
         assert results[0].status == LoanStatus.UNDER_REVIEW
         assert results[0].applicant_name == 'John Doe'
 
+    @patch('losa.services.loan_service.get_sync_session')
+    def test_get_applications_by_status_with_cursor(self, mock_session, loan_service):
+        """Test that a cursor seeks past the last row instead of using offset"""
+        mock_db_session = Mock()
+        mock_session.return_value.__enter__.return_value = mock_db_session
+
+        mock_query = mock_db_session.query.return_value.filter.return_value
+        mock_query.filter.return_value.order_by.return_value.limit.return_value.all.return_value = []
+
+        cursor = (1, datetime.utcnow(), uuid4())
+        results = loan_service.get_applications_by_status(
+            LoanStatus.UNDER_REVIEW, limit=10, offset=20, cursor=cursor
+        )
+
+        assert results == []
+        mock_query.filter.assert_called_once()
+        mock_query.filter.return_value.order_by.return_value.offset.assert_not_called()
+        mock_query.filter.return_value.order_by.return_value.limit.assert_called_once_with(
+            10
+        )
+
+    @patch('losa.services.loan_service.get_sync_session')
+    def test_get_application_status_view(self, mock_session, loan_service):
+        """Test that the status view returns the selected columns as a dict"""
+        mock_db_session = Mock()
+        mock_session.return_value.__enter__.return_value = mock_db_session
+
+        mock_row = Mock()
+        mock_row._asdict = Mock(
+            return_value={'application_number': 'LOAN-001', 'status': LoanStatus.DRAFT}
+        )
+        mock_db_session.query.return_value.filter.return_value.first.return_value = (
+            mock_row
+        )
+
+        view = loan_service.get_application_status_view(uuid4())
+
+        assert view == {'application_number': 'LOAN-001', 'status': LoanStatus.DRAFT}
+
+    @patch('losa.services.loan_service.get_sync_session')
+    def test_get_application_documents_view(self, mock_session, loan_service):
+        """Test the documents view computes completeness from document rows"""
+        mock_db_session = Mock()
+        mock_session.return_value.__enter__.return_value = mock_db_session
+
+        mock_row = Mock(loan_type=LoanType.PERSONAL, requested_amount=Decimal('25000'))
+        mock_doc = Mock(
+            id=uuid4(),
+            document_type=DocumentType.IDENTITY,
+            file_name='id.pdf',
+            file_path='/uploads/id.pdf',
+            file_size=1024,
+            mime_type='application/pdf',
+            created_at=datetime.utcnow(),
+            verified=False,
+            verification_notes=None,
+        )
+        mock_query = mock_db_session.query.return_value.filter.return_value
+        mock_query.first.return_value = mock_row
+        mock_query.all.return_value = [mock_doc]
+
+        view = loan_service.get_application_documents_view(uuid4())
+
+        assert len(view['documents']) == 1
+        assert view['required_documents'] == [
+            DocumentType.IDENTITY,
+            DocumentType.INCOME_PROOF,
+        ]
+        assert view['is_complete'] is False
+
     @patch('losa.services.loan_service.get_sync_session')
     def test_delete_application_invalid_status(self, mock_session, loan_service):
         """Test deleting application with invalid status"""
@@ -372,7 +445,9 @@ class TestLoanService:
         )
 
         # Test deletion should fail
-        with pytest.raises(ValueError, match='Cannot delete application in status'):
+        with pytest.raises(
+            LoanServiceError, match='Cannot delete application in status'
+        ):
             loan_service.delete_application(application_id)
 
     @patch('losa.services.loan_service.get_sync_session')
@@ -415,6 +490,52 @@ class TestLoanService:
                 mock_db_session.flush.assert_called_once()
                 mock_db_session.commit.assert_called_once()
 
+    @patch('losa.services.loan_service.get_sync_session')
+    def test_add_documents_success(self, mock_session, loan_service):
+        """Test adding multiple documents in a single transaction"""
+        application_id = uuid4()
+
+        # Mock database session
+        mock_db_session = Mock()
+        mock_session.return_value.__enter__.return_value = mock_db_session
+
+        mock_db_session.add_all = Mock()
+        mock_db_session.flush = Mock()
+        mock_db_session.commit = Mock()
+
+        documents = [
+            Document(
+                document_type=DocumentType.IDENTITY,
+                file_name='driver_license.jpg',
+                file_path='/uploads/driver_license.jpg',
+                file_size=1024,
+                mime_type='image/jpeg',
+            ),
+            Document(
+                document_type=DocumentType.INCOME_PROOF,
+                file_name='pay_stub.pdf',
+                file_path='/uploads/pay_stub.pdf',
+                file_size=2048,
+                mime_type='application/pdf',
+            ),
+        ]
+
+        with patch('losa.services.loan_service.DocumentDB') as mock_document_db:
+            with patch('losa.services.loan_service.create_audit_log') as mock_audit:
+                results = loan_service.add_documents(
+                    application_id, documents, 'test_user'
+                )
+
+                assert len(results) == 2
+                assert results[0].document_type == DocumentType.IDENTITY
+                assert results[1].file_name == 'pay_stub.pdf'
+
+                assert mock_document_db.call_count == 2
+                assert mock_audit.call_count == 2
+                mock_db_session.add_all.assert_called_once()
+                mock_db_session.flush.assert_called_once()
+                mock_db_session.commit.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_process_application_workflow_success(self, loan_service):
         """Test successful workflow processing"""
@@ -446,6 +567,44 @@ class TestLoanService:
                     assert result is not None
                     assert result.status == LoanStatus.APPROVED
 
+    @pytest.mark.asyncio
+    async def test_stream_application_workflow_success(self, loan_service):
+        """Test streaming workflow yields each stage and saves the final result"""
+        application_id = uuid4()
+
+        mock_application = Mock()
+        mock_application.id = application_id
+        mock_application.application_number = 'TEST-STREAM'
+        mock_application.status = LoanStatus.SUBMITTED
+
+        validated_application = Mock(status=LoanStatus.UNDER_REVIEW)
+        decided_application = Mock(status=LoanStatus.APPROVED)
+
+        async def fake_stream(application):
+            yield 'validate_application', validated_application
+            yield 'make_decision', decided_application
+
+        with patch.object(
+            loan_service, 'get_application', return_value=mock_application
+        ):
+            with patch(
+                'losa.services.loan_service.stream_loan_application',
+                side_effect=fake_stream,
+            ):
+                with patch.object(loan_service, '_save_workflow_results') as mock_save:
+                    stages = [
+                        stage
+                        async for stage in loan_service.stream_application_workflow(
+                            application_id
+                        )
+                    ]
+
+                    assert [name for name, _ in stages] == [
+                        'validate_application',
+                        'make_decision',
+                    ]
+                    mock_save.assert_called_once_with(decided_application)
+
     @pytest.mark.asyncio
     async def test_process_application_workflow_not_found(self, loan_service):
         """Test workflow processing with non-existent application"""
@@ -453,7 +612,7 @@ class TestLoanService:
 
         with patch.object(loan_service, 'get_application', return_value=None):
             with pytest.raises(
-                ValueError, match=f'Application {application_id} not found'
+                LoanServiceError, match=f'Application {application_id} not found'
             ):
                 await loan_service.process_application_workflow(application_id)
 
@@ -524,3 +683,52 @@ class TestLoanService:
         assert stats['type_business'] == 1
         assert stats['type_student'] == 0
         assert stats['recent_applications'] == 25
+
+    @patch('losa.services.loan_service.get_sync_session')
+    def test_get_application_statistics_cached(self, mock_session, loan_service):
+        """Test statistics are served from the TTL cache until invalidated"""
+        mock_db_session = Mock()
+        mock_session.return_value.__enter__.return_value = mock_db_session
+        mock_db_session.query.return_value.filter.return_value.count.return_value = 1
+
+        first = loan_service.get_application_statistics()
+        query_count = mock_db_session.query.call_count
+
+        second = loan_service.get_application_statistics()
+        assert second == first
+        assert mock_db_session.query.call_count == query_count
+
+        loan_service.invalidate_query_cache()
+        loan_service.get_application_statistics()
+        assert mock_db_session.query.call_count == query_count * 2
+
+    def test_query_cache_is_bounded(self, loan_service):
+        """Test the query cache drops expired and then the oldest entries"""
+        with patch('losa.services.loan_service.QUERY_CACHE_MAX_ENTRIES', 2):
+            with patch('losa.services.loan_service.time.monotonic') as mock_clock:
+                mock_clock.return_value = 100.0
+                loan_service._set_cached(('expired',), 'old')
+
+                mock_clock.return_value = 200.0
+                loan_service._set_cached(('page', 1), 'first')
+                assert ('expired',) not in loan_service._query_cache
+
+                loan_service._set_cached(('page', 2), 'second')
+                loan_service._set_cached(('page', 3), 'third')
+
+                assert list(loan_service._query_cache) == [('page', 2), ('page', 3)]
+                assert loan_service._get_cached(('page', 3)) == 'third'
+
+    def test_query_cache_is_thread_safe(self, loan_service):
+        """Test concurrent writers evicting the same oldest entry do not fail"""
+
+        def fill(thread_id):
+            for i in range(500):
+                loan_service._set_cached(('page', thread_id, i), i)
+                loan_service._get_cached(('page', thread_id, i))
+
+        with patch('losa.services.loan_service.QUERY_CACHE_MAX_ENTRIES', 4):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(fill, range(8)))
+
+        assert len(loan_service._query_cache) <= 4
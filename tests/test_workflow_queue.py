@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from losa.services.workflow_queue import WorkflowQueue
+
+
+class TestWorkflowQueue:
+    """Test cases for WorkflowQueue"""
+
+    @pytest.fixture
+    def queue(self):
+        """Queue with a single worker, so jobs run one at a time"""
+        return WorkflowQueue(workers=1)
+
+    @pytest.mark.asyncio
+    async def test_enqueue_skips_pending_key(self, queue):
+        """Test a job is not queued twice while one with its key is pending"""
+        calls = []
+
+        async def job(application_id):
+            calls.append(application_id)
+
+        assert queue.enqueue(job, 'app-1', key='app-1') is True
+        assert queue.enqueue(job, 'app-1', key='app-1') is False
+        assert queue.enqueue(job, 'app-2', key='app-2') is True
+        assert queue.depth == 2
+
+        await queue.start()
+        await queue.stop(timeout=1)
+
+        assert calls == ['app-1', 'app-2']
+        # Once the job has run its key can be queued again
+        assert queue.enqueue(job, 'app-1', key='app-1') is True
+
+    @pytest.mark.asyncio
+    async def test_worker_survives_failing_job(self, queue):
+        """Test a job that raises neither stops the worker nor keeps its key"""
+        calls = []
+
+        async def failing_job(application_id):
+            raise RuntimeError('workflow failed')
+
+        async def job(application_id):
+            calls.append(application_id)
+
+        queue.enqueue(failing_job, 'app-1', key='app-1')
+        queue.enqueue(job, 'app-2', key='app-2')
+
+        await queue.start()
+        await queue.stop(timeout=1)
+
+        assert calls == ['app-2']
+        assert queue.enqueue(failing_job, 'app-1', key='app-1') is True
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_queued_jobs(self, queue):
+        """Test stop() lets every queued job finish before stopping the workers"""
+        calls = []
+
+        async def job(application_id):
+            await asyncio.sleep(0.01)
+            calls.append(application_id)
+
+        for i in range(3):
+            queue.enqueue(job, f'app-{i}')
+
+        await queue.start()
+        await queue.stop(timeout=1)
+
+        assert calls == ['app-0', 'app-1', 'app-2']
+        assert queue.depth == 0
+        assert not queue.running
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_jobs_after_timeout(self, queue):
+        """Test stop() cancels a job still running when the timeout expires"""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def stuck_job():
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        queue.enqueue(stuck_job)
+        queue.enqueue(stuck_job)
+
+        await queue.start()
+        await started.wait()
+        await asyncio.wait_for(queue.stop(timeout=0.05), timeout=1)
+
+        assert cancelled.is_set()
+        assert queue.depth == 1
+        assert not queue.running